@@ -0,0 +1,65 @@
+# cython: language_level=3
+"""
+Compiled longest-common-substring kernel used by main.find_longest_common_substring.
+Build in place with `cythonize -i _lcs.pyx`; main.py falls back to its pure-Python
+implementation when this module has not been built.
+"""
+cimport cython
+from libc.stdlib cimport calloc, free
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef unicode longest_common_substring(list strings):
+    """
+    Returns the leftmost longest substring of strings[0] that occurs in every string (not stripped).
+    For each string, the rolling-row DP gives the longest common run ending at every position of
+    strings[0]; the minimum across strings is the run common to all of them.
+    """
+    cdef unicode s1 = strings[0]
+    cdef unicode other
+    cdef Py_ssize_t n1 = len(s1), n2, i, j
+    cdef Py_UCS4 s1_char
+    cdef int run, row_best, longest_length = 0, longest_end = 0
+    cdef int *common = <int *>calloc(n1 + 1, sizeof(int))
+    cdef int *prev_row
+    cdef int *curr_row
+    cdef int *swap
+    if common == NULL:
+        raise MemoryError()
+    try:
+        for i in range(n1):
+            common[i] = i + 1
+        for other in strings[1:]:
+            n2 = len(other)
+            prev_row = <int *>calloc(n2 + 1, sizeof(int))
+            curr_row = <int *>calloc(n2 + 1, sizeof(int))
+            if prev_row == NULL or curr_row == NULL:
+                free(prev_row)
+                free(curr_row)
+                raise MemoryError()
+            for i in range(n1):
+                s1_char = s1[i]
+                row_best = 0
+                for j in range(n2):
+                    if s1_char == other[j]:
+                        run = prev_row[j] + 1
+                        curr_row[j + 1] = run
+                        if run > row_best:
+                            row_best = run
+                    else:
+                        curr_row[j + 1] = 0
+                if row_best < common[i]:
+                    common[i] = row_best
+                swap = prev_row
+                prev_row = curr_row
+                curr_row = swap # Every entry but [0] (always 0) is rewritten on the next row
+            free(prev_row)
+            free(curr_row)
+        for i in range(n1):
+            if common[i] > longest_length:
+                longest_length = common[i]
+                longest_end = i + 1
+    finally:
+        free(common)
+    return s1[longest_end - longest_length:longest_end]
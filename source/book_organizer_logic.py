@@ -1,10 +1,12 @@
+import functools
 import os
 import re
-from collections import defaultdict
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 # Import functions from other modules directly for multiprocessing workers
 from metadata_utils import get_audio_metadata_and_embedded_image_status, parse_opf_metadata, extract_series_info, extract_internal_part_info, strip_series_info_from_title, strip_part_info_from_title, normalize_publisher_name
-from file_system_utils import custom_print, sanitize_filename, hard_link_to_leftbehind
+from file_system_utils import custom_print, sanitize_filename, hard_link_to_leftbehind, hard_link_to_leftbehind_batch, flush_log_handles, DEBUG_ENABLED
 
 # SCRIPT VERSION - Increment this each time the script is modified and sent
 SCRIPT_VERSION = "1.0.36" # Incremented version for this change
@@ -12,15 +14,91 @@ SCRIPT_VERSION = "1.0.36" # Incremented version for this change
 AUDIO_EXTENSIONS = ('.mp3', '.m4a', '.m4b')
 IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
 
-def _get_physical_folder_metadata(args):
+# Extension sets for O(1) membership tests on the lowercase extension of each file
+_IMAGE_EXTENSION_SET = frozenset(IMAGE_EXTENSIONS)
+_EXTRA_DOCUMENT_EXTENSION_SET = frozenset(('.epub', '.pdf', '.txt'))
+_HANDLED_EXTENSION_SET = frozenset(AUDIO_EXTENSIONS + IMAGE_EXTENSIONS + ('.opf', '.epub', '.pdf', '.txt'))
+
+# Audio file tags copied into the combined metadata when the OPF file does not provide them
+_OPF_OVERLAY_KEYS = frozenset(['artist', 'album', 'title', 'genre', 'comment', 'grouping', 'description', 'TIT3', 'TRACKTOTAL', 'copyright', 'publisher', 'performer', 'date'])
+# Metadata keys read downstream (overlay keys plus the per-file track number); everything else is
+# dropped before a file's metadata is kept, cached or pickled back to the parent process.
+_CONSUMED_METADATA_KEYS = _OPF_OVERLAY_KEYS | {'track'}
+
+# Result of _get_physical_folder_metadata. A namedtuple pickles its values positionally,
+# so results sent back from pool workers do not carry the field names for every folder.
+FolderResult = namedtuple('FolderResult', [
+    'physical_folder_path', 'combined_metadata', 'book_has_embedded_image',
+    'all_audio_files_details_in_folder', 'worker_cache_updates', 'non_audio_files'
+])
+
+# Metadata cache shared by the pre-scan workers, set once per worker via set_global_audiobook_cache
+_global_audiobook_cache = {}
+
+# Image names that mark a file as the primary cover
+_COVER_RE = re.compile(r'cover|folder|front', re.IGNORECASE)
+
+# Track tag parser: "N" or "N/M", parsed with one match instead of repeated str.split calls
+_TRACK_RE = re.compile(r'^\s*(\d+)\s*(?:/\s*(\d+))?\s*$')
+
+@functools.lru_cache(maxsize=None)
+def _track_formats(padding):
+    """
+    Returns the track suffix format strings for a padding width, built once per width.
+    Args:
+        padding (int): Zero-padding width for the track numbers.
+    Returns:
+        tuple: (" Track N of M" format, " Track N" format)
+    """
+    return f" Track {{:0{padding}d}} of {{:0{padding}d}}", f" Track {{:0{padding}d}}"
+
+def set_global_audiobook_cache(audiobook_cache):
+    """
+    Sets the metadata cache read by _get_physical_folder_metadata.
+    This function is intended to be used as the 'initializer' for multiprocessing.Pool, so the
+    cache is transferred once per worker (or inherited on fork) instead of pickled with every task.
+    """
+    global _global_audiobook_cache
+    _global_audiobook_cache = audiobook_cache
+
+def _scan_physical_folder(physical_folder_path):
+    """
+    Lists the files of a physical folder in a single os.scandir pass.
+    DirEntry.is_file() uses the cached directory entry type, so no extra stat is issued per file.
+    Args:
+        physical_folder_path (str): The folder to scan (not recursive).
+    Returns:
+        tuple: (sorted list of audio file names, OPF file name or None,
+                list of (name, path, lowercase extension) tuples for every non-audio file)
+    """
+    audio_files_in_folder = []
+    opf_file = None
+    non_audio_files = []
+    with os.scandir(physical_folder_path) as it:
+        for entry in it:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            file_name = entry.name
+            lower_name = file_name.lower()
+            if lower_name.endswith(AUDIO_EXTENSIONS):
+                audio_files_in_folder.append(file_name)
+                continue
+            if opf_file is None and lower_name.endswith('.opf'):
+                opf_file = file_name # Assuming one OPF per folder for now
+            non_audio_files.append((file_name, entry.path, os.path.splitext(lower_name)[1]))
+    audio_files_in_folder.sort() # Ensure consistent order
+    return audio_files_in_folder, opf_file, non_audio_files
+
+def _get_physical_folder_metadata(physical_folder_path):
     """
     Worker function for multiprocessing pool to get metadata for a single physical folder.
+    The metadata cache is read from the global set by set_global_audiobook_cache.
     Args:
-        args (tuple): A tuple containing (physical_folder_path, audiobook_cache).
+        physical_folder_path (str): The physical folder to scan.
     Returns:
-        dict: A dictionary containing metadata and processing results for the folder.
+        FolderResult: Metadata and processing results for the folder.
     """
-    physical_folder_path, audiobook_cache = args # Correct unpacking from single tuple
+    audiobook_cache = _global_audiobook_cache
     
     folder_name = os.path.basename(physical_folder_path)
     custom_print(f"  Info: Pre-scanning folder: '{folder_name}'", to_console=False)
@@ -30,30 +108,27 @@ def _get_physical_folder_metadata(args):
     all_audio_files_details_in_folder = []
     worker_cache_updates = {} # Cache updates specific to this worker
 
-    audio_files_in_folder = [
-        f for f in os.listdir(physical_folder_path)
-        if os.path.isfile(os.path.join(physical_folder_path, f)) and f.lower().endswith(AUDIO_EXTENSIONS)
-    ]
-    audio_files_in_folder.sort() # Ensure consistent order
+    audio_files_in_folder, opf_file, non_audio_files = _scan_physical_folder(physical_folder_path)
 
     if not audio_files_in_folder:
         custom_print(f"  Warning: No audio files found in '{folder_name}'. Skipping metadata extraction for this folder.", level="WARNING", to_console=False)
-        return {
-            'physical_folder_path': physical_folder_path,
-            'combined_metadata': None,
-            'book_has_embedded_image': False,
-            'all_audio_files_details_in_folder': [],
-            'worker_cache_updates': worker_cache_updates
-        }
+        return FolderResult(
+            physical_folder_path=physical_folder_path,
+            combined_metadata=None,
+            book_has_embedded_image=False,
+            all_audio_files_details_in_folder=[],
+            worker_cache_updates=worker_cache_updates,
+            non_audio_files=non_audio_files
+        )
 
     # Try to find an OPF file first
-    opf_file = next((f for f in os.listdir(physical_folder_path) if f.lower().endswith('.opf')), None)
     opf_metadata = {}
     if opf_file:
         opf_path = os.path.join(physical_folder_path, opf_file)
-        custom_print(f"  DEBUG: Found OPF file: '{opf_file}' in '{folder_name}'", level="DEBUG", to_console=False)
+        if DEBUG_ENABLED:
+            custom_print(f"  DEBUG: Found OPF file: '{opf_file}' in '{folder_name}'", level="DEBUG", to_console=False)
         opf_metadata = parse_opf_metadata(opf_path, custom_print)
-        if opf_metadata:
+        if opf_metadata and DEBUG_ENABLED:
             custom_print(f"  DEBUG: OPF metadata for '{folder_name}': {opf_metadata}", level="DEBUG", to_console=False)
             
     # Process each audio file for its metadata
@@ -61,18 +136,21 @@ def _get_physical_folder_metadata(args):
         audio_file_path = os.path.join(physical_folder_path, audio_file_name)
         
         # Check cache first
-        if audio_file_path in audiobook_cache:
-            file_metadata = audiobook_cache[audio_file_path]['metadata']
-            has_embedded_image = audiobook_cache[audio_file_path]['has_embedded_image']
+        cache_entry = audiobook_cache.get(audio_file_path)
+        if cache_entry is not None:
+            file_metadata = {key: value for key, value in cache_entry['metadata'].items() if key in _CONSUMED_METADATA_KEYS}
+            has_embedded_image = cache_entry['has_embedded_image']
             custom_print(f"  Info: Using cached metadata for '{audio_file_name}'", to_console=False)
         else:
             file_metadata, has_embedded_image = get_audio_metadata_and_embedded_image_status(audio_file_path, custom_print)
             if file_metadata:
+                file_metadata = {key: value for key, value in file_metadata.items() if key in _CONSUMED_METADATA_KEYS}
                 worker_cache_updates[audio_file_path] = {
                     'metadata': file_metadata,
                     'has_embedded_image': has_embedded_image
                 }
-            custom_print(f"  DEBUG: Fresh metadata for '{audio_file_name}': {file_metadata}", level="DEBUG", to_console=False)
+            if DEBUG_ENABLED:
+                custom_print(f"  DEBUG: Fresh metadata for '{audio_file_name}': {file_metadata}", level="DEBUG", to_console=False)
 
         if file_metadata:
             all_audio_files_details_in_folder.append({
@@ -87,23 +165,25 @@ def _get_physical_folder_metadata(args):
 
     # Combine OPF metadata with audio file metadata. OPF takes precedence for core book info.
     if opf_metadata:
-        combined_metadata = opf_metadata.copy()
-        # Overlay common audio file metadata if not present in OPF
+        # Overlay common audio file metadata if not present in OPF (OPF values win in the merge)
+        first_audio_overlay = {}
         if all_audio_files_details_in_folder:
             first_audio_meta = all_audio_files_details_in_folder[0]['metadata']
-            for key in ['artist', 'album', 'title', 'genre', 'comment', 'grouping', 'description', 'TIT3', 'TRACKTOTAL', 'copyright', 'publisher', 'performer', 'date']:
-                if key not in combined_metadata and key in first_audio_meta:
-                    combined_metadata[key] = first_audio_meta[key]
-        custom_print(f"  DEBUG: Combined metadata (OPF prioritized) for '{folder_name}': {combined_metadata}", level="DEBUG", to_console=False)
+            first_audio_overlay = {key: first_audio_meta[key] for key in _OPF_OVERLAY_KEYS & first_audio_meta.keys()}
+        combined_metadata = {**first_audio_overlay, **opf_metadata}
+        if DEBUG_ENABLED:
+            custom_print(f"  DEBUG: Combined metadata (OPF prioritized) for '{folder_name}': {combined_metadata}", level="DEBUG", to_console=False)
     elif all_audio_files_details_in_folder:
         # If no OPF, use metadata from the first audio file as the primary source for the folder
         combined_metadata = all_audio_files_details_in_folder[0]['metadata'].copy()
-        custom_print(f"  DEBUG: Combined metadata (first audio file) for '{folder_name}': {combined_metadata}", level="DEBUG", to_console=False)
+        if DEBUG_ENABLED:
+            custom_print(f"  DEBUG: Combined metadata (first audio file) for '{folder_name}': {combined_metadata}", level="DEBUG", to_console=False)
     
     # Ensure publisher is normalized in combined_metadata
     if combined_metadata and 'publisher' in combined_metadata:
         combined_metadata['publisher'] = normalize_publisher_name(combined_metadata['publisher'])
-        custom_print(f"  DEBUG: Publisher after normalization: '{combined_metadata['publisher']}' for '{folder_name}'", level="DEBUG", to_console=False)
+        if DEBUG_ENABLED:
+            custom_print(f"  DEBUG: Publisher after normalization: '{combined_metadata['publisher']}' for '{folder_name}'", level="DEBUG", to_console=False)
 
     # Extract part info from the physical folder name itself, and add to combined_metadata
     part_designation, part_number, total_parts = extract_internal_part_info(folder_name)
@@ -111,16 +191,41 @@ def _get_physical_folder_metadata(args):
         combined_metadata['extracted_part_designation'] = part_designation
         combined_metadata['extracted_part_number'] = part_number
         combined_metadata['extracted_total_parts'] = total_parts
-    custom_print(f"  DEBUG: Extracted part info for '{folder_name}': designation='{part_designation}', num={part_number}, total={total_parts}", level="DEBUG", to_console=False)
+    if DEBUG_ENABLED:
+        custom_print(f"  DEBUG: Extracted part info for '{folder_name}': designation='{part_designation}', num={part_number}, total={total_parts}", level="DEBUG", to_console=False)
+
 
+    return FolderResult(
+        physical_folder_path=physical_folder_path,
+        combined_metadata=combined_metadata,
+        book_has_embedded_image=book_has_embedded_image,
+        all_audio_files_details_in_folder=all_audio_files_details_in_folder,
+        worker_cache_updates=worker_cache_updates,
+        non_audio_files=non_audio_files
+    )
 
-    return {
-        'physical_folder_path': physical_folder_path,
-        'combined_metadata': combined_metadata,
-        'book_has_embedded_image': book_has_embedded_image,
-        'all_audio_files_details_in_folder': all_audio_files_details_in_folder,
-        'worker_cache_updates': worker_cache_updates
-    }
+def prescan_physical_folders(physical_folder_paths, audiobook_cache, max_workers=None):
+    """
+    Runs _get_physical_folder_metadata over all physical folders on a thread pool.
+    The pre-scan is dominated by directory listings and tag reads, so threads share
+    audiobook_cache directly instead of pickling it into every task of a process pool.
+    Args:
+        physical_folder_paths (list): The physical book folders to scan.
+        audiobook_cache (dict): Metadata cache keyed by audio file path; updated in place with fresh results.
+        max_workers (int, optional): Number of threads. Defaults to twice the CPU count.
+    Returns:
+        list: The FolderResult tuples from _get_physical_folder_metadata, in input order.
+    """
+    if max_workers is None:
+        max_workers = (os.cpu_count() or 1) * 2
+    set_global_audiobook_cache(audiobook_cache) # Threads share the module global, so set it once up front
+    physical_folder_metadata_results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for result in executor.map(_get_physical_folder_metadata, physical_folder_paths):
+            physical_folder_metadata_results.append(result)
+            if result.worker_cache_updates:
+                audiobook_cache.update(result.worker_cache_updates)
+    return physical_folder_metadata_results
 
 def process_single_logical_book_or_part(args):
     """
@@ -151,6 +256,7 @@ def process_single_logical_book_or_part(args):
     book_has_embedded_image = logical_book_info['book_has_embedded_image']
     
     physical_folder_paths_for_this_part = logical_book_info['physical_folder_paths']
+    physical_folder_files = logical_book_info.get('physical_folder_files', {}) # folder path -> 'non_audio_files' from the pre-scan
     all_audio_files_details_for_this_part = logical_book_info['all_audio_files_details']
 
     part_display_name = logical_book_info['part_display_name'] # Will be None for single books
@@ -221,15 +327,39 @@ def process_single_logical_book_or_part(args):
         # Ensure part_display_name is clean for folder creation, e.g., "(1 of 5)"
         clean_part_folder_name = part_display_name.strip('()')
         dest_book_path = os.path.join(base_book_path, clean_part_folder_name)
-        custom_print(f"  DEBUG: Multi-part book part path: '{os.path.relpath(dest_book_path, dest_base_dir)}'", level="DEBUG", to_console=False)
+        if DEBUG_ENABLED:
+            custom_print(f"  DEBUG: Multi-part book part path: '{os.path.relpath(dest_book_path, dest_base_dir)}'", level="DEBUG", to_console=False)
     
     os.makedirs(dest_book_path, exist_ok=True)
     custom_print(f"  Info: Created book/part folder: '{os.path.relpath(dest_book_path, dest_base_dir)}'", to_console=False)
 
     final_book_path_relative_to_dest = os.path.relpath(dest_book_path, dest_base_dir)
 
+    # Hard links cannot cross filesystems. Check the device once per part instead of letting every os.link raise.
+    try:
+        same_filesystem = os.stat(physical_folder_paths_for_this_part[0]).st_dev == os.stat(dest_book_path).st_dev
+    except (OSError, IndexError):
+        same_filesystem = True # Let the per-file os.link calls report the problem
+    if not same_filesystem:
+        reason = "Hard-link failed: destination is on a different filesystem than the source."
+        custom_print(f"  Error: Cannot hard-link files into '{final_book_path_relative_to_dest}': destination is on a different filesystem. Sending them to 'leftbehind'.", level="ERROR", to_console=True)
+        files_for_leftbehind = [audio_file_detail['file_path'] for audio_file_detail in all_audio_files_details_for_this_part]
+        for physical_folder_path in physical_folder_paths_for_this_part:
+            associated_physical_folders.add(physical_folder_path)
+            non_audio_files = physical_folder_files.get(physical_folder_path)
+            if non_audio_files is None:
+                non_audio_files = _scan_physical_folder(physical_folder_path)[2]
+            # OPF files are never linked into the organized structure
+            files_for_leftbehind.extend(src_file_path for _, src_file_path, ext_lower in non_audio_files if ext_lower != '.opf')
+        errors_count += len(files_for_leftbehind)
+        hard_link_to_leftbehind_batch(files_for_leftbehind, source_root_dir, leftbehind_base_dir, reason=reason, manual_log_list=non_audio_manual_logs, level="ERROR")
+        flush_log_handles() # Worker may be terminated before its buffered log writes are flushed
+        return linked_count, errors_count, final_book_path_relative_to_dest, audio_manual_logs, non_audio_manual_logs, successfully_linked_paths, associated_physical_folders
+
     # Process audio files
     num_audio_files_in_part = len(all_audio_files_details_for_this_part)
+    # 1-based position of each file when sorted by name, used as a fallback track index if metadata is missing
+    file_index_map = {path: idx + 1 for idx, path in enumerate(sorted(d['file_path'] for d in all_audio_files_details_for_this_part))}
     for i, audio_file_detail in enumerate(all_audio_files_details_for_this_part): # Use files specific to THIS part
         src_audio_file_path = audio_file_detail['file_path']
         audio_metadata = audio_file_detail['metadata']
@@ -242,20 +372,18 @@ def process_single_logical_book_or_part(args):
         track_total = None
 
         if track_num_raw:
-            try:
-                if '/' in track_num_raw:
-                    track_num = int(track_num_raw.split('/')[0].strip())
-                    track_total = int(track_num_raw.split('/')[1].strip()) if len(track_num_raw.split('/')) > 1 else None
-                else:
-                    track_num = int(track_num_raw.strip())
-            except ValueError:
+            track_match = _TRACK_RE.match(track_num_raw) # "N" or "N/M"
+            if track_match:
+                track_num = int(track_match.group(1))
+                if track_match.group(2):
+                    track_total = int(track_match.group(2))
+            else:
                 custom_print(f"  Warning: Could not parse track number '{track_num_raw}' for '{os.path.basename(src_audio_file_path)}'.", level="WARNING", to_console=False) # Changed to to_console=False
         
         if track_total_raw and track_total is None: # Only use if not already set by track_num_raw
-            try:
-                track_total = int(track_total_raw.strip())
-            except ValueError:
-                pass
+            track_total_match = _TRACK_RE.match(track_total_raw)
+            if track_total_match:
+                track_total = int(track_total_match.group(1))
 
         # Determine padding for track number
         padding = 2 # Default padding for consistency if multiple tracks
@@ -267,16 +395,16 @@ def process_single_logical_book_or_part(args):
         track_info_for_filename = ""
         # Omit track info if it's a single track (num_audio_files_in_part == 1)
         if num_audio_files_in_part > 1: 
+            track_of_total_format, track_only_format = _track_formats(padding)
             if track_num is not None and track_total is not None:
-                track_info_for_filename = f" Track {track_num:0{padding}d} of {track_total:0{padding}d}"
+                track_info_for_filename = track_of_total_format.format(track_num, track_total)
             elif track_num is not None: # Fallback if total tracks is missing, but individual track number exists
-                track_info_for_filename = f" Track {track_num:0{padding}d}"
+                track_info_for_filename = track_only_format.format(track_num)
             else: # Fallback if no track number is found, use an index if multiple files in THIS part
-                # Sort files by name to ensure consistent indexing if track metadata is missing
-                sorted_audio_files_paths = sorted([d['file_path'] for d in all_audio_files_details_for_this_part])
-                current_file_index = sorted_audio_files_paths.index(src_audio_file_path) + 1
-                track_info_for_filename = f" Track {current_file_index:0{padding}d} of {num_audio_files_in_part:0{padding}d}"
-                custom_print(f"  DEBUG: Using generated track index {current_file_index} for '{os.path.basename(src_audio_file_path)}'", level="DEBUG", to_console=False)
+                current_file_index = file_index_map[src_audio_file_path]
+                track_info_for_filename = track_of_total_format.format(current_file_index, num_audio_files_in_part)
+                if DEBUG_ENABLED:
+                    custom_print(f"  DEBUG: Using generated track index {current_file_index} for '{os.path.basename(src_audio_file_path)}'", level="DEBUG", to_console=False)
 
         # Determine the file title for the audio file name
         base_file_name_for_audio = sanitized_core_book_title
@@ -286,7 +414,8 @@ def process_single_logical_book_or_part(args):
             # e.g., "(Part 01 of 05)" -> "Part 1 of 5"
             part_info_for_audio_filename = part_display_name.strip('()')
             base_file_name_for_audio = f"{sanitized_core_book_title} {part_info_for_audio_filename}"
-            custom_print(f"  DEBUG: Generated base_file_name_for_audio for multi-part: '{base_file_name_for_audio}'", level="DEBUG", to_console=False)
+            if DEBUG_ENABLED:
+                custom_print(f"  DEBUG: Generated base_file_name_for_audio for multi-part: '{base_file_name_for_audio}'", level="DEBUG", to_console=False)
         else:
             # For single-part books, use the cleaned_file_title if it's more specific, otherwise core_book_title
             original_file_title = audio_metadata.get('title') or os.path.splitext(os.path.basename(src_audio_file_path))[0]
@@ -297,7 +426,8 @@ def process_single_logical_book_or_part(args):
                 base_file_name_for_audio = sanitized_core_book_title
             else:
                 base_file_name_for_audio = cleaned_file_title_for_audio_name
-            custom_print(f"  DEBUG: Generated base_file_name_for_audio for single-part: '{base_file_name_for_audio}'", level="DEBUG", to_console=False)
+            if DEBUG_ENABLED:
+                custom_print(f"  DEBUG: Generated base_file_name_for_audio for single-part: '{base_file_name_for_audio}'", level="DEBUG", to_console=False)
 
 
         final_audio_file_name = sanitize_filename(f"{base_file_name_for_audio}{track_info_for_filename}{os.path.splitext(src_audio_file_path)[1]}")
@@ -315,14 +445,15 @@ def process_single_logical_book_or_part(args):
             hard_link_to_leftbehind(src_audio_file_path, source_root_dir, leftbehind_base_dir, reason=f"Hard-link failed: {e}", manual_log_list=non_audio_manual_logs, level="ERROR")
     
     # Process non-audio files (e.g., cover art, PDFs, EPUBs) from the original physical folders
+    extras_dir = os.path.join(dest_book_path, "Extras")
+    extras_dir_created = False # Created lazily on the first extra file, then reused for the rest of the part
     for physical_folder_path in physical_folder_paths_for_this_part: # Use physical folders specific to THIS part
         associated_physical_folders.add(physical_folder_path) # Mark this folder as processed
         
-        # Collect all potential extra files in the physical folder
-        all_files_in_folder = [
-            f for f in os.listdir(physical_folder_path)
-            if os.path.isfile(os.path.join(physical_folder_path, f))
-        ]
+        # Reuse the file listing captured during the pre-scan; only scan again if it was not passed through
+        non_audio_files = physical_folder_files.get(physical_folder_path)
+        if non_audio_files is None:
+            non_audio_files = _scan_physical_folder(physical_folder_path)[2]
         
         primary_cover_linked = False
         
@@ -335,13 +466,14 @@ def process_single_logical_book_or_part(args):
         # Prioritize linking a single "Cover.jpg" or similar if no embedded image
         # OR if an embedded image exists, but we still want a separate cover file.
         # The user's goal shows explicit Cover.jpg files, so we should always try to link them.
-        for file_name in all_files_in_folder:
-            src_file_path = os.path.join(physical_folder_path, file_name)
+        for file_name, src_file_path, ext_lower in non_audio_files:
+            if src_file_path in successfully_linked_paths: # Already linked earlier in this part
+                continue
 
-            if file_name.lower().endswith(IMAGE_EXTENSIONS):
+            if ext_lower in _IMAGE_EXTENSION_SET:
                 # Check if this image is a strong candidate for the main cover
-                if any(kw in file_name.lower() for kw in ['cover', 'folder', 'front']) or \
-                   (not primary_cover_linked and len([f for f in all_files_in_folder if f.lower().endswith(IMAGE_EXTENSIONS)]) == 1): # If only one image, assume it's the cover
+                if _COVER_RE.search(file_name) or \
+                   (not primary_cover_linked and len([f for f, _, ext in non_audio_files if ext in _IMAGE_EXTENSION_SET]) == 1): # If only one image, assume it's the cover
                     
                     dest_image_path = os.path.join(dest_book_path, f"{cover_image_base_name} Cover{os.path.splitext(file_name)[1]}")
                     
@@ -360,9 +492,11 @@ def process_single_logical_book_or_part(args):
                 
                 # All other image files (including those not chosen as primary cover) are treated as extras
                 # No separate "Artwork" folder, they go to "Extras" if not the main cover.
-                elif src_file_path not in successfully_linked_paths: # If not already linked as primary cover
-                    dest_extra_path = os.path.join(dest_book_path, "Extras", sanitize_filename(file_name))
-                    os.makedirs(os.path.dirname(dest_extra_path), exist_ok=True)
+                else:
+                    if not extras_dir_created:
+                        os.makedirs(extras_dir, exist_ok=True)
+                        extras_dir_created = True
+                    dest_extra_path = os.path.join(extras_dir, sanitize_filename(file_name))
                     try:
                         os.link(src_file_path, dest_extra_path)
                         linked_count += 1
@@ -390,9 +524,11 @@ def process_single_logical_book_or_part(args):
                     non_audio_manual_logs.append(f"[ERROR] {error_msg}")
                     hard_link_to_leftbehind(src_file_path, source_root_dir, leftbehind_base_dir, reason=f"Hard-link failed for playlist.ll: {e}", manual_log_list=non_audio_manual_logs, level="ERROR")
             
-            elif file_name.lower().endswith(('.epub', '.pdf', '.txt')) and src_file_path not in successfully_linked_paths: # Handle EPUBs and PDFs explicitly
-                dest_extra_path = os.path.join(dest_book_path, "Extras", sanitize_filename(file_name))
-                os.makedirs(os.path.dirname(dest_extra_path), exist_ok=True)
+            elif ext_lower in _EXTRA_DOCUMENT_EXTENSION_SET: # Handle EPUBs and PDFs explicitly
+                if not extras_dir_created:
+                    os.makedirs(extras_dir, exist_ok=True)
+                    extras_dir_created = True
+                dest_extra_path = os.path.join(extras_dir, sanitize_filename(file_name))
                 try:
                     os.link(src_file_path, dest_extra_path)
                     linked_count += 1
@@ -405,10 +541,12 @@ def process_single_logical_book_or_part(args):
                     non_audio_manual_logs.append(f"[ERROR] {error_msg}")
                     hard_link_to_leftbehind(src_file_path, source_root_dir, leftbehind_base_dir, reason=f"Hard-link failed for extra file: {e}", manual_log_list=non_audio_manual_logs, level="ERROR")
 
-            elif not file_name.lower().endswith(AUDIO_EXTENSIONS + IMAGE_EXTENSIONS + ('.opf', '.epub', '.pdf', '.txt')) and src_file_path not in successfully_linked_paths: # Catch any other unhandled files
+            elif ext_lower not in _HANDLED_EXTENSION_SET: # Catch any other unhandled files
                 # Hard-link other non-audio, non-image files to an "Extras" subfolder
-                dest_extra_path = os.path.join(dest_book_path, "Extras", sanitize_filename(file_name))
-                os.makedirs(os.path.dirname(dest_extra_path), exist_ok=True)
+                if not extras_dir_created:
+                    os.makedirs(extras_dir, exist_ok=True)
+                    extras_dir_created = True
+                dest_extra_path = os.path.join(extras_dir, sanitize_filename(file_name))
                 try:
                     os.link(src_file_path, dest_extra_path)
                     linked_count += 1
@@ -421,8 +559,29 @@ def process_single_logical_book_or_part(args):
                     non_audio_manual_logs.append(f"[ERROR] {error_msg}")
                     hard_link_to_leftbehind(src_file_path, source_root_dir, leftbehind_base_dir, reason=f"Hard-link failed for extra file: {e}", manual_log_list=non_audio_manual_logs, level="ERROR")
     
+    flush_log_handles() # Worker may be terminated before its buffered log writes are flushed
     return linked_count, errors_count, final_book_path_relative_to_dest, audio_manual_logs, non_audio_manual_logs, successfully_linked_paths, associated_physical_folders
 
+def _first_common_substring_of_length(first, other_strings, length):
+    """
+    Finds the first substring of the given length in 'first' that occurs in every other string.
+    Args:
+        first (str): The lowercased string whose substrings are tested.
+        other_strings (list): The other lowercased strings, shortest first so misses are found early.
+        length (int): The substring length to look for.
+    Returns:
+        str: The earliest matching substring of 'first', or None if there is none.
+    """
+    common = {first[i:i + length] for i in range(len(first) - length + 1)}
+    for other in other_strings:
+        common &= {other[i:i + length] for i in range(len(other) - length + 1)}
+        if not common:
+            return None
+    for i in range(len(first) - length + 1):
+        if first[i:i + length] in common:
+            return first[i:i + length]
+    return None
+
 def find_longest_common_substring(strings):
     """
     Finds the longest common substring among a list of strings.
@@ -441,29 +600,31 @@ def find_longest_common_substring(strings):
     # Convert all strings to lowercase for case-insensitive comparison
     lower_strings = [s.lower() for s in strings]
 
-    s1 = lower_strings[0]
-    min_len = len(s1)
-    
+    # If a common substring of length L exists, one of every shorter length does too,
+    # so binary search on L instead of testing every substring of the first string.
+    # Parts of one book often share an identical title, so drop duplicates of the first string and
+    # test the shortest remaining strings first; their small substring sets empty the candidates fastest.
+    first = lower_strings[0]
+    other_strings = sorted(set(lower_strings[1:]) - {first}, key=len)
     longest_common = ""
-    
-    for i in range(min_len):
-        for j in range(i + 1, min_len + 1):
-            substring = s1[i:j]
-            is_common = True
-            for k in range(1, len(lower_strings)):
-                if substring not in lower_strings[k]:
-                    is_common = False
-                    break
-            if is_common and len(substring) > len(longest_common):
-                longest_common = substring
+    low, high = 0, min(len(s) for s in lower_strings)
+    while low < high:
+        length = (low + high + 1) // 2
+        candidate = _first_common_substring_of_length(first, other_strings, length)
+        if candidate is not None:
+            longest_common = candidate
+            low = length
+        else:
+            high = length - 1
     
     # Attempt to return the original casing from one of the input strings
     # that contains the longest common substring.
     if longest_common:
+        longest_common_pattern = re.compile(re.escape(longest_common), re.IGNORECASE) # Compile once for all strings
         for original_s in strings:
             if longest_common.lower() in original_s.lower():
                 # Find the exact substring in the original string
-                match = re.search(re.escape(longest_common), original_s, re.IGNORECASE)
+                match = longest_common_pattern.search(original_s)
                 if match:
                     return match.group(0)
     
@@ -1,70 +1,375 @@
+import atexit
+import ctypes
+import ctypes.util
+import errno
+import functools
+import multiprocessing
 import os
+import queue
 import shutil
+import subprocess
 import sys
 import threading
-import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-# Global lock for print statements to avoid interleaving output from multiple processes/threads
+try:
+    import fcntl # POSIX only; used for reflink clones on Linux
+except ImportError:
+    fcntl = None
+
+# Global lock for print statements to avoid interleaving output from threads of this process.
+# Pool workers never write to the console or log files themselves (see set_global_log_queue),
+# so an in-process lock is enough and no cross-process lock is taken per message.
 print_lock = threading.Lock()
 
 # Global variables to hold log file handles for multiprocessing workers
 _global_log_file_handle = None
 _global_manual_log_file_handle = None
 
+# Characters not allowed in file names are mapped to underscores by sanitize_filename
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+# ASCII characters other than ' ' that count as whitespace; a lone one is still rewritten to a space
+_ASCII_NON_SPACE_WHITESPACE = '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f'
+
+# Leftbehind directories already created by this process (most recently used last), so files
+# landing in the same directory skip os.makedirs. Capped to bound memory on very large trees.
+_CREATED_DIRS_MAX = 10000
+_created_leftbehind_dirs = OrderedDict()
+_created_dirs_lock = threading.Lock()
+
+# When os.link fails with one of these (e.g. the leftbehind directory is on another filesystem),
+# the file is cloned with a reflink if the filesystems support it, and copied otherwise.
+_LINK_FALLBACK_ERRNOS = frozenset((errno.EXDEV, errno.EMLINK, errno.EPERM))
+_FICLONE = 0x40049409 # Linux ioctl that makes dest share src's extents (btrfs, XFS)
+# Whether reflinks work between a (source device, destination device) pair, learned on first attempt
+_reflink_supported = {}
+
+# Direct (non-writer) log file writes are flushed every _FLUSH_EVERY messages instead of after
+# each one. Pool workers call flush_log_handles() before returning a result, because they can be
+# terminated without running exit handlers.
+_FLUSH_EVERY = 64
+_unflushed_count = 0
+
+# DEBUG-level messages are only written when AO_DEBUG=1. Callers check this flag before
+# building the message so the f-string is never formatted when it would be discarded.
+DEBUG_ENABLED = os.environ.get("AO_DEBUG") == "1"
+
+class _BufferedLog:
+    """
+    Wraps a log file handle and collects written text in memory, passing it on in a single
+    write call once max_lines entries or max_chars characters have accumulated (or on flush).
+    """
+    def __init__(self, handle, max_lines=256, max_chars=65536):
+        self._handle = handle
+        self._max_lines = max_lines
+        self._max_chars = max_chars
+        self._parts = []
+        self._size = 0
+
+    @property
+    def closed(self):
+        return self._handle.closed
+
+    def write(self, text):
+        self._parts.append(text)
+        self._size += len(text)
+        if len(self._parts) >= self._max_lines or self._size >= self._max_chars:
+            self.flush()
+
+    def flush(self):
+        if self._parts and not self._handle.closed:
+            self._handle.write(''.join(self._parts))
+            self._handle.flush()
+        self._parts.clear()
+        self._size = 0
+
+class _BatchedLogQueue:
+    """
+    Stands in for the worker log queue inside a pool worker: records are collected in a list and sent
+    to the parent as a single ('batch', records) message once max_records have accumulated or on flush,
+    instead of one pipe write per message.
+    """
+    def __init__(self, log_queue, max_records=256):
+        self._log_queue = log_queue
+        self._max_records = max_records
+        self._records = []
+
+    def put(self, record):
+        self._records.append(record)
+        if len(self._records) >= self._max_records:
+            self.flush()
+
+    def flush(self):
+        if self._records:
+            records, self._records = self._records, []
+            self._log_queue.put(('batch', records))
+
 def set_global_log_handles(log_file_h, manual_log_file_h):
     """
     Sets the global log file handles for use by multiprocessing workers.
     This function is intended to be used as the 'initializer' for multiprocessing.Pool.
+    Manual-log lines are buffered and written in batches; stop_log_writer() or flush_log_handles()
+    writes out the rest.
     """
     global _global_log_file_handle
     global _global_manual_log_file_handle
     _global_log_file_handle = log_file_h
-    _global_manual_log_file_handle = manual_log_file_h
+    _global_manual_log_file_handle = _BufferedLog(manual_log_file_h) if manual_log_file_h is not None else None
+
+# Background log writer. While it runs, custom_print only enqueues records; a single writer thread
+# in the parent process does the file and console writes and flushes whenever it has caught up with
+# the queue. Pool workers put their records on a multiprocessing queue that a relay thread feeds into
+# the same writer, so only the parent ever writes to the log files.
+# Records are ('log', log_message, to_console, end, log_file_handle) or ('manual', line); workers send
+# them in ('batch', records) messages (see _BatchedLogQueue).
+_log_queue = None
+_log_writer_thread = None
+_worker_log_queue = None
+_worker_log_relay_thread = None
+_worker_log_synced = threading.Event()
+# True when manual-log lines for the global manual log handle go through the writer
+_manual_log_via_queue = False
+
+def set_global_log_queue(log_queue):
+    """
+    Routes this worker's log and manual-log output to the parent's log writer.
+    This function is intended to be used as the 'initializer' for multiprocessing.Pool,
+    with the queue returned by start_log_writer(). Records are sent in batches; flush_log_handles()
+    sends the pending ones.
+    """
+    global _log_queue
+    global _manual_log_via_queue
+    _log_queue = _BatchedLogQueue(log_queue)
+    _manual_log_via_queue = True
+
+def _log_writer_loop(log_queue):
+    """Consumes log records until the None sentinel is received."""
+    unflushed_handles = set()
+    while True:
+        record = log_queue.get()
+        if record is None:
+            log_queue.task_done()
+            break
+        if record[0] == 'manual':
+            _global_manual_log_file_handle.write(record[1] + "\n")
+            unflushed_handles.add(_global_manual_log_file_handle)
+        else:
+            _, log_message, to_console, end, log_file_handle = record
+            current_log_file_handle = log_file_handle
+            if _global_log_file_handle:
+                current_log_file_handle = _global_log_file_handle
+            if current_log_file_handle:
+                current_log_file_handle.write(log_message + "\n")
+                unflushed_handles.add(current_log_file_handle)
+            if to_console:
+                with print_lock: # Don't interleave with progress lines printed by the main thread
+                    sys.stdout.write(log_message + end)
+                unflushed_handles.add(sys.stdout)
+        if log_queue.empty(): # Caught up; flush once for the whole batch
+            for handle in unflushed_handles:
+                handle.flush()
+            unflushed_handles.clear()
+        log_queue.task_done()
+    for handle in unflushed_handles:
+        handle.flush()
+
+def _worker_log_relay_loop(worker_log_queue, log_queue):
+    """Moves records from pool workers onto the writer queue until the None sentinel is received."""
+    while True:
+        record = worker_log_queue.get()
+        if record is None:
+            break
+        if record[0] == 'sync': # Everything sent before this marker has been relayed
+            _worker_log_synced.set()
+            continue
+        for worker_record in record[1]: # ('batch', records)
+            log_queue.put(worker_record)
+
+def start_log_writer():
+    """
+    Starts the background log writer thread for this process. custom_print calls made afterwards are
+    written by that thread. Call stop_log_writer() before closing the log file handles.
+    Returns:
+        multiprocessing.SimpleQueue: The queue to pass to set_global_log_queue in pool workers.
+    """
+    global _log_queue
+    global _log_writer_thread
+    global _worker_log_queue
+    global _worker_log_relay_thread
+    global _manual_log_via_queue
+    if _log_writer_thread is not None:
+        return _worker_log_queue
+    _log_queue = queue.Queue()
+    _log_writer_thread = threading.Thread(target=_log_writer_loop, args=(_log_queue,), name="log-writer", daemon=True)
+    _log_writer_thread.start()
+    # SimpleQueue.put writes straight to the pipe, so records are not lost if a worker is terminated
+    _worker_log_queue = multiprocessing.SimpleQueue()
+    _worker_log_relay_thread = threading.Thread(target=_worker_log_relay_loop, args=(_worker_log_queue, _log_queue), name="worker-log-relay", daemon=True)
+    _worker_log_relay_thread.start()
+    _manual_log_via_queue = _global_manual_log_file_handle is not None
+    return _worker_log_queue
+
+def flush_log_writer():
+    """Blocks until every queued log record, including those already sent by workers, has been written."""
+    if _log_writer_thread is None:
+        return
+    _worker_log_synced.clear()
+    _worker_log_queue.put(('sync',))
+    _worker_log_synced.wait()
+    _log_queue.join()
+
+def stop_log_writer():
+    """Writes out any queued log records and stops the background log writer and relay threads."""
+    global _log_queue
+    global _log_writer_thread
+    global _worker_log_queue
+    global _worker_log_relay_thread
+    global _manual_log_via_queue
+    if _log_writer_thread is None:
+        return
+    _worker_log_queue.put(None)
+    _worker_log_relay_thread.join()
+    _log_queue.put(None)
+    _log_writer_thread.join()
+    flush_log_handles() # Write out batched manual-log lines before the caller closes the handles
+    _worker_log_queue.close()
+    _log_queue = None
+    _log_writer_thread = None
+    _worker_log_queue = None
+    _worker_log_relay_thread = None
+    _manual_log_via_queue = False
+
+def _reset_log_writer_after_fork():
+    """
+    Forked pool workers do not inherit the writer threads; set_global_log_queue routes them to the parent.
+    The queues are drained before forking, so the child never copies a log handle mid-write.
+    """
+    global _log_queue
+    global _log_writer_thread
+    global _worker_log_queue
+    global _worker_log_relay_thread
+    global _manual_log_via_queue
+    _log_queue = None
+    _log_writer_thread = None
+    _worker_log_queue = None
+    _worker_log_relay_thread = None
+    _manual_log_via_queue = False
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=flush_log_writer, after_in_child=_reset_log_writer_after_fork)
+
+def _write_manual_log(manual_log_list, line):
+    """
+    Appends a line to the manual-actions log. The global manual log handle (when set) takes priority over
+    manual_log_list, which may be a list or a file object.
+    """
+    if _manual_log_via_queue: # Written by the parent's log writer
+        _log_queue.put(('manual', line))
+        return
+    current_manual_log_list = manual_log_list
+    if _global_manual_log_file_handle:
+        current_manual_log_list = _global_manual_log_file_handle
+
+    if current_manual_log_list is not None:
+        if isinstance(current_manual_log_list, list):
+            current_manual_log_list.append(line)
+        else: # Assume it's a file handle
+            with print_lock:
+                current_manual_log_list.write(line + "\n")
+                _count_buffered_write()
 
 def custom_print(message, level="INFO", to_console=True, log_file_handle=None, end='\n'):
     """
     Custom print function that logs to a file and optionally to the console.
     It prioritizes global log handles (for multiprocessing) over passed arguments.
+    If the background log writer is running, the message is queued for it instead of written here.
     Args:
-        message (str): The message to print.
+        message (str or callable): The message to print, or a zero-argument callable returning it.
+            A callable is only called when the message is actually going to be written somewhere.
         level (str): The log level (e.g., "INFO", "WARNING", "ERROR").
         to_console (bool): Whether to print the message to the console.
         log_file_handle (file object, optional): A file handle to write logs to.
         end (str): String appended after the message. Defaults to '\n'.
     """
-    with print_lock:
-        log_message = f"[{level}] {message}"
-        
-        # Determine which log file handle to use
-        current_log_file_handle = log_file_handle
-        if _global_log_file_handle: # If global handle is set (from multiprocessing)
-            current_log_file_handle = _global_log_file_handle
+    log_queue = _log_queue # Each module global is looked up once per call
+    # Determine which log file handle to use; the global handle (from multiprocessing) takes priority
+    current_log_file_handle = _global_log_file_handle or log_file_handle
+    if log_queue is None and not to_console and not current_log_file_handle:
+        return # No sink for this message, so don't build it
+
+    if callable(message):
+        message = message()
+    log_message = f"[{level}] {message}"
+    if log_queue is not None: # Writer thread handles the I/O
+        log_queue.put(('log', log_message, to_console, end, log_file_handle))
+        return
 
+    with print_lock:
         # Always write full message with a newline to the log file for readability
         if current_log_file_handle:
             current_log_file_handle.write(log_message + "\n")
-            current_log_file_handle.flush() # Ensure it's written immediately
+            _count_buffered_write() # Flushed in batches, see _FLUSH_EVERY
         
         # For console, use the 'end' argument
         if to_console:
             sys.stdout.write(log_message + end)
             sys.stdout.flush()
 
+def _collapse_whitespace(text):
+    """Replaces each run of whitespace in text with a single space, like re.sub(r'\s+', ' ', text)."""
+    words = text.split()
+    if not words: # Whitespace only
+        return ' ' if text else text
+    collapsed = ' '.join(words)
+    # str.split drops the runs at both ends; re.sub would have kept one space for each
+    if text[0].isspace():
+        collapsed = ' ' + collapsed
+    if text[-1].isspace():
+        collapsed += ' '
+    return collapsed
+
+@functools.lru_cache(maxsize=8192)
 def sanitize_filename(name):
-    """Sanitizes a string to be used as a filename or directory name."""
+    """
+    Sanitizes a string to be used as a filename or directory name.
+    The function is pure and many folders share authors, series and titles, so results are memoized.
+    """
     if not name:
         return "Untitled"
-    # Replace invalid characters with underscores
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', name)
-    # Replace leading/trailing spaces or dots
-    sanitized = sanitized.strip(' .')
-    # Replace multiple spaces with a single space
-    sanitized = re.sub(r'\s+', ' ', sanitized)
+    # Replace invalid characters with underscores (single C-level pass), then leading/trailing spaces or dots
+    sanitized = name.translate(_SANITIZE_TABLE).strip(' .')
+    # Replace multiple spaces with a single space, only when there is whitespace to rewrite
+    if ('  ' in sanitized or not sanitized.isascii()
+            or any(c in sanitized for c in _ASCII_NON_SPACE_WHITESPACE)):
+        sanitized = _collapse_whitespace(sanitized)
     # Truncate if too long (common filesystem limit is 255, but keep shorter for safety)
     if len(sanitized) > 200:
         sanitized = sanitized[:200]
     return sanitized
 
+def _fast_relpath(path, start):
+    """
+    Returns path relative to start. When path lies directly under start this is a plain string slice;
+    otherwise it falls back to os.path.relpath, which normalizes both paths first.
+    """
+    prefix = start if start.endswith(os.sep) else start + os.sep
+    if path.startswith(prefix):
+        return path[len(prefix):]
+    return os.path.relpath(path, start)
+
+def _ensure_leftbehind_dir(dir_path):
+    """Creates dir_path unless this process has already created it."""
+    with _created_dirs_lock:
+        if dir_path in _created_leftbehind_dirs:
+            _created_leftbehind_dirs.move_to_end(dir_path)
+            return
+    os.makedirs(dir_path, exist_ok=True)
+    with _created_dirs_lock:
+        _created_leftbehind_dirs[dir_path] = None
+        if len(_created_leftbehind_dirs) > _CREATED_DIRS_MAX:
+            _created_leftbehind_dirs.popitem(last=False)
+
 def hard_link_to_leftbehind(src_path, source_root_dir, leftbehind_base_dir, reason="", manual_log_list=None, level="INFO"):
     """
     Hard-links a file to the 'leftbehind' directory, maintaining its relative path structure.
@@ -78,48 +383,194 @@ def hard_link_to_leftbehind(src_path, source_root_dir, leftbehind_base_dir, reas
     Returns:
         bool: True if hard-link was successful, False otherwise.
     """
-    relative_path = os.path.relpath(src_path, source_root_dir)
+    relative_path = _fast_relpath(src_path, source_root_dir)
     dest_path = os.path.join(leftbehind_base_dir, relative_path)
-    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    dest_path_for_log = _fast_relpath(dest_path, os.path.dirname(leftbehind_base_dir))
+    return _link_to_leftbehind(src_path, relative_path, dest_path, dest_path_for_log, reason, manual_log_list, level)
+
+def _reflink(src_path, dest_path):
+    """
+    Creates dest_path as a copy-on-write clone of src_path (FICLONE on Linux, clonefile on macOS).
+    Raises OSError if the platform or filesystem does not support it.
+    """
+    if sys.platform == 'darwin':
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        if libc.clonefile(os.fsencode(src_path), os.fsencode(dest_path), 0) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), dest_path)
+        return
+    if fcntl is None or not sys.platform.startswith('linux'):
+        raise OSError(errno.EOPNOTSUPP, "Reflinks are not supported on this platform", dest_path)
+    src_fd = os.open(src_path, os.O_RDONLY)
     try:
-        if not os.path.exists(dest_path): # Avoid trying to link if already exists (e.g., from a previous run)
-            os.link(src_path, dest_path)
-            log_message = f"  Info: Hard-linked '{relative_path}' to '{os.path.relpath(dest_path, os.path.dirname(leftbehind_base_dir))}' in 'leftbehind'. Reason: {reason}"
-            custom_print(log_message, to_console=False)
-            
-            # Determine which manual log list/handle to use
-            current_manual_log_list = manual_log_list
-            if _global_manual_log_file_handle:
-                current_manual_log_list = _global_manual_log_file_handle
-
-            if current_manual_log_list is not None:
-                if isinstance(current_manual_log_list, list):
-                    current_manual_log_list.append(f"[{level}] {log_message}")
-                else: # Assume it's a file handle
-                    current_manual_log_list.write(f"[{level}] {log_message}\n")
-                    current_manual_log_list.flush()
-            return True
-        else:
-            log_message = f"  Info: File '{relative_path}' already exists in 'leftbehind'. Skipping hard-link. Reason: {reason}"
-            custom_print(log_message, to_console=False)
-            return True # Consider it successful as it's already there
+        dest_fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            fcntl.ioctl(dest_fd, _FICLONE, src_fd)
+        except OSError:
+            os.close(dest_fd)
+            os.unlink(dest_path)
+            raise
+        os.close(dest_fd)
+        shutil.copystat(src_path, dest_path)
+    finally:
+        os.close(src_fd)
+
+def _clone_or_copy(src_path, dest_path):
+    """
+    Fallback for when src_path cannot be hard-linked to dest_path: tries a reflink clone first
+    (as cheap as a hard link where supported), then a full copy.
+    Returns:
+        str: "Cloned" or "Copied", for the log message.
+    """
+    device_pair = (os.stat(src_path).st_dev, os.stat(os.path.dirname(dest_path)).st_dev)
+    if _reflink_supported.get(device_pair, True):
+        try:
+            _reflink(src_path, dest_path)
+            _reflink_supported[device_pair] = True
+            return "Cloned"
+        except FileExistsError:
+            raise
+        except OSError:
+            _reflink_supported[device_pair] = False # Don't retry a failing clone for this pair
+    if os.path.exists(dest_path): # copy2 would silently overwrite
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dest_path)
+    shutil.copy2(src_path, dest_path)
+    return "Copied"
+
+def _link_to_leftbehind(src_path, relative_path, dest_path, dest_path_for_log, reason, manual_log_list, level, dest_dir_fd=None):
+    """
+    Hard-links one file into 'leftbehind' and logs the outcome. Shared by hard_link_to_leftbehind and
+    hard_link_to_leftbehind_batch; dest_dir_fd, when given, is an open descriptor for dest_path's directory.
+    Returns:
+        bool: True if the file was linked or already present, False otherwise.
+    """
+    action = "Hard-linked"
+    try:
+        try:
+            if dest_dir_fd is None:
+                _ensure_leftbehind_dir(os.path.dirname(dest_path))
+                os.link(src_path, dest_path)
+            else: # Link relative to the already-open destination directory (no path walk for the target)
+                os.link(src_path, os.path.basename(dest_path), dst_dir_fd=dest_dir_fd)
+        except OSError as e:
+            if e.errno not in _LINK_FALLBACK_ERRNOS:
+                raise
+            action = _clone_or_copy(src_path, dest_path)
+    except FileExistsError: # Already linked (e.g., from a previous run)
+        log_message = f"  Info: File '{relative_path}' already exists in 'leftbehind'. Skipping hard-link. Reason: {reason}"
+        custom_print(log_message, to_console=False)
+        return True # Consider it successful as it's already there
     except OSError as e:
-        error_message = f"  Error: Could not hard-link '{relative_path}' to '{os.path.relpath(dest_path, os.path.dirname(leftbehind_base_dir))}' in 'leftbehind': {e}. Reason: {reason}"
+        error_message = f"  Error: Could not hard-link '{relative_path}' to '{dest_path_for_log}' in 'leftbehind': {e}. Reason: {reason}"
         custom_print(error_message, level="ERROR", to_console=True)
-        
-        current_manual_log_list = manual_log_list
-        if _global_manual_log_file_handle:
-            current_manual_log_list = _global_manual_log_file_handle
-
-        if current_manual_log_list is not None:
-            if isinstance(current_manual_log_list, list):
-                current_manual_log_list.append(f"[{level}] {error_message}")
-            else: # Assume it's a file handle
-                current_manual_log_list.write(f"[{level}] {error_message}\n")
-                current_manual_log_list.flush()
+        _write_manual_log(manual_log_list, f"[{level}] {error_message}")
         return False
 
-def setup_directories(dest_base_dir, leftbehind_base_dir, force_empty, custom_print_func):
+    if (_log_queue is None and not _global_log_file_handle and not _global_manual_log_file_handle
+            and manual_log_list is None):
+        return True # Nowhere to record the success, so skip building the message
+    log_message = f"  Info: {action} '{relative_path}' to '{dest_path_for_log}' in 'leftbehind'. Reason: {reason}"
+    custom_print(log_message, to_console=False)
+    _write_manual_log(manual_log_list, f"[{level}] {log_message}")
+    return True
+
+def hard_link_to_leftbehind_batch(src_paths, source_root_dir, leftbehind_base_dir, reason="", manual_log_list=None, level="INFO"):
+    """
+    Hard-links many files to the 'leftbehind' directory. Files are grouped by destination directory,
+    which is opened once so each link is made relative to its descriptor instead of resolving the
+    full destination path again.
+    Args:
+        src_paths (iterable): Full paths of the source files.
+        source_root_dir (str): The root directory from which relative paths are calculated.
+        leftbehind_base_dir (str): The base directory for leftbehind files.
+        reason (str): The reason the files are being hard-linked to leftbehind.
+        manual_log_list (list or file object, optional): A list or file object to append manual actions to.
+        level (str): The log level for the manual actions.
+    Returns:
+        tuple: (linked_count, errors_count)
+    """
+    linked_count = 0
+    errors_count = 0
+    use_dir_fd = os.link in os.supports_dir_fd and hasattr(os, 'O_DIRECTORY')
+    leftbehind_parent = os.path.dirname(leftbehind_base_dir)
+
+    files_by_dest_dir = {}
+    for src_path in src_paths:
+        relative_path = _fast_relpath(src_path, source_root_dir)
+        dest_path = os.path.join(leftbehind_base_dir, relative_path)
+        files_by_dest_dir.setdefault(os.path.dirname(dest_path), []).append((src_path, relative_path, dest_path))
+
+    for dest_dir, entries in files_by_dest_dir.items():
+        dest_dir_fd = None
+        if use_dir_fd:
+            try:
+                _ensure_leftbehind_dir(dest_dir)
+                dest_dir_fd = os.open(dest_dir, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                dest_dir_fd = None # Fall back to path-based links, which report the error per file
+        try:
+            for src_path, relative_path, dest_path in entries:
+                dest_path_for_log = _fast_relpath(dest_path, leftbehind_parent)
+                if _link_to_leftbehind(src_path, relative_path, dest_path, dest_path_for_log, reason, manual_log_list, level, dest_dir_fd):
+                    linked_count += 1
+                else:
+                    errors_count += 1
+        finally:
+            if dest_dir_fd is not None:
+                os.close(dest_dir_fd)
+    return linked_count, errors_count
+
+def _flush_global_handles():
+    """Flushes the global log handles. The caller must hold print_lock."""
+    global _unflushed_count
+    for handle in (_global_log_file_handle, _global_manual_log_file_handle):
+        if handle and not handle.closed:
+            handle.flush()
+    _unflushed_count = 0
+
+def _count_buffered_write():
+    """Records one buffered log write and flushes once _FLUSH_EVERY have accumulated. The caller must hold print_lock."""
+    global _unflushed_count
+    _unflushed_count += 1
+    if _unflushed_count >= _FLUSH_EVERY:
+        _flush_global_handles()
+
+def flush_log_handles():
+    """Flushes any buffered direct log writes to the global log handles, and a pool worker's pending log batch."""
+    log_queue = _log_queue
+    if isinstance(log_queue, _BatchedLogQueue):
+        log_queue.flush()
+    with print_lock:
+        _flush_global_handles()
+
+atexit.register(flush_log_handles)
+
+def _fast_rmtree(path):
+    """
+    Removes a directory tree using the platform's native remove command, which is much faster than
+    shutil.rmtree on large trees. Falls back to shutil.rmtree if the command is missing or fails.
+    Args:
+        path (str): The directory to remove.
+    """
+    if os.name == 'nt':
+        command = ["cmd", "/c", "rd", "/s", "/q", path]
+    else:
+        command = ["rm", "-rf", "--", path]
+    try:
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    # rd can exit 0 on partial failure, so clean up whatever the native command left behind
+    if os.path.exists(path):
+        shutil.rmtree(path)
+
+def _recreate_directory(path):
+    """Removes the directory tree at path (if present) and creates it again, empty."""
+    if os.path.exists(path):
+        _fast_rmtree(path)
+    os.makedirs(path, exist_ok=True)
+
+def setup_directories(dest_base_dir, leftbehind_base_dir, force_empty, custom_print_func, interactive=True):
     """
     Sets up destination and leftbehind directories, handling existing content.
     Args:
@@ -127,29 +578,28 @@ def setup_directories(dest_base_dir, leftbehind_base_dir, force_empty, custom_pr
         leftbehind_base_dir (str): Path to the leftbehind directory.
         force_empty (bool): If True, forces emptying of directories without prompt.
         custom_print_func (function): The logging function.
+        interactive (bool): If False (or stdin is not a terminal), never prompt: an existing destination
+            directory aborts the setup unless force_empty is set.
     Returns:
         bool: True if directories are set up successfully, False otherwise.
     """
     # Destination directory handling
+    empty_dest = False
     if os.path.exists(dest_base_dir):
         custom_print_func(f"Warning: Destination directory '{dest_base_dir}' already exists.", level="WARNING", to_console=True)
         if not force_empty:
+            if not interactive or not sys.stdin.isatty():
+                # Nobody can answer a prompt; fail fast instead of blocking
+                custom_print_func("Aborting: Destination directory exists and no one can confirm emptying it. Re-run with --force-empty or clear it manually.", level="ERROR", to_console=True)
+                return False
+            flush_log_writer() # Make sure the warning above is shown before the prompt
             response = input("Do you want to empty its contents before proceeding? (y/N): ").strip().lower()
         else:
             response = 'y'
             custom_print_func("Proceeding with emptying destination directory due to --force-empty flag.", level="INFO", to_console=True)
         
         if response == 'y':
-            try:
-                custom_print_func(f"Attempting to remove and recreate '{dest_base_dir}'...", to_console=True)
-                if os.path.exists(dest_base_dir):
-                    shutil.rmtree(dest_base_dir)
-                os.makedirs(dest_base_dir, exist_ok=True)
-                custom_print_func(f"Directory '{dest_base_dir}' emptied and recreated.", to_console=True)
-            except OSError as e:
-                custom_print_func(f"Error removing or recreating destination directory '{dest_base_dir}': {e}", level="ERROR", to_console=True)
-                custom_print_func("This might be due to files being in use by another process. Please ensure no other applications are accessing this directory.", level="ERROR", to_console=True)
-                return False
+            empty_dest = True
         else:
             custom_print_func("Aborting: Destination directory not emptied. Please clear it manually or confirm to proceed.", level="INFO", to_console=True)
             return False
@@ -161,40 +611,137 @@ def setup_directories(dest_base_dir, leftbehind_base_dir, force_empty, custom_pr
             return False
     
     # Leftbehind directory handling
+    empty_leftbehind = False
     if os.path.exists(leftbehind_base_dir):
         custom_print_func(f"Warning: Leftbehind directory '{leftbehind_base_dir}' already exists. Its contents will be cleared for this run.", level="WARNING", to_console=True)
-        try:
-            custom_print_func(f"Attempting to remove and recreate '{leftbehind_base_dir}'...", to_console=True)
-            shutil.rmtree(leftbehind_base_dir)
-            os.makedirs(leftbehind_base_dir, exist_ok=True)
-            custom_print_func(f"Directory '{leftbehind_base_dir}' emptied and recreated.", to_console=True)
-        except OSError as e:
-            custom_print_func(f"Error removing or recreating leftbehind directory '{leftbehind_base_dir}': {e}", level="ERROR", to_console=True)
-            custom_print_func("This might be due to files being in use by another process. Please ensure no other applications are accessing this directory.", level="ERROR", to_console=True)
-            return False
+        empty_leftbehind = True
     else:
         try:
             os.makedirs(leftbehind_base_dir, exist_ok=True)
         except OSError as e:
             custom_print_func(f"Error creating leftbehind directory '{leftbehind_base_dir}': {e}", level="ERROR", to_console=True)
             return False
-            
-    return True
+
+    # The two trees are independent and removal is I/O-bound, so clear them at the same time
+    futures = []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if empty_dest:
+            custom_print_func(f"Attempting to remove and recreate '{dest_base_dir}'...", to_console=True)
+            futures.append(("destination", dest_base_dir, executor.submit(_recreate_directory, dest_base_dir)))
+        if empty_leftbehind:
+            custom_print_func(f"Attempting to remove and recreate '{leftbehind_base_dir}'...", to_console=True)
+            futures.append(("leftbehind", leftbehind_base_dir, executor.submit(_recreate_directory, leftbehind_base_dir)))
+
+    setup_ok = True
+    for directory_kind, directory_path, future in futures:
+        try:
+            future.result()
+            custom_print_func(f"Directory '{directory_path}' emptied and recreated.", to_console=True)
+        except OSError as e:
+            custom_print_func(f"Error removing or recreating {directory_kind} directory '{directory_path}': {e}", level="ERROR", to_console=True)
+            custom_print_func("This might be due to files being in use by another process. Please ensure no other applications are accessing this directory.", level="ERROR", to_console=True)
+            setup_ok = False
+    if empty_leftbehind:
+        with _created_dirs_lock:
+            _created_leftbehind_dirs.clear() # Directories remembered from before the wipe are gone
+    return setup_ok
+
+def _remove_empty_dirs_by_path(path, custom_print_func):
+    """
+    Bottom-up removal of empty directories under (and including) path, using path-based calls.
+    Returns:
+        int: The number of directories removed.
+    """
+    removed_count = 0
+    # Each entry is (directory, children_done). A directory is pushed back after its subdirectories
+    # so it is only checked for emptiness once they have been handled.
+    stack = [(path, False)]
+    # Directories that contain files (or could not be scanned) are never empty and need no second look
+    non_empty_dirs = set()
+    while stack:
+        dirpath, children_done = stack.pop()
+        if not children_done:
+            stack.append((dirpath, True))
+            try:
+                it = os.scandir(dirpath)
+            except OSError as e:
+                custom_print_func(f"  Warning: Could not scan directory '{dirpath}': {e}", level="WARNING", to_console=False)
+                non_empty_dirs.add(dirpath)
+                continue
+            try:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, False))
+                    else:
+                        non_empty_dirs.add(dirpath)
+            finally:
+                it.close()
+            continue
+
+        if dirpath in non_empty_dirs:
+            continue
+        try:
+            # Only subdirectories were seen; check again now that the empty ones have been removed
+            with os.scandir(dirpath) as it:
+                if next(it, None) is not None:
+                    continue
+            os.rmdir(dirpath)
+            removed_count += 1
+        except OSError as e:
+            custom_print_func(f"  Warning: Could not remove empty directory '{dirpath}': {e}", level="WARNING", to_console=False)
+    return removed_count
+
+def _remove_empty_dirs_by_fd(path, custom_print_func):
+    """
+    Bottom-up removal of empty directories under (and including) path using os.fwalk. Each empty
+    directory is removed by its parent's iteration with rmdir(name, dir_fd=parent), so the kernel
+    never walks the full path again.
+    Returns:
+        int: The number of directories removed.
+    """
+    removed_count = 0
+    # Directories found empty once their own empty subdirectories were removed, waiting for their parent
+    empty_dirs = set()
+
+    def report_scan_error(e):
+        custom_print_func(f"  Warning: Could not scan directory '{e.filename}': {e}", level="WARNING", to_console=False)
+
+    for dirpath, dirnames, filenames, dirfd in os.fwalk(path, topdown=False, onerror=report_scan_error):
+        is_empty = not filenames
+        for dirname in dirnames:
+            child_path = os.path.join(dirpath, dirname)
+            if child_path not in empty_dirs: # Has content, is a symlink, or could not be scanned
+                is_empty = False
+                continue
+            empty_dirs.discard(child_path)
+            try:
+                os.rmdir(dirname, dir_fd=dirfd)
+                removed_count += 1
+            except OSError as e:
+                custom_print_func(f"  Warning: Could not remove empty directory '{child_path}': {e}", level="WARNING", to_console=False)
+                is_empty = False
+        if is_empty:
+            empty_dirs.add(dirpath)
+
+    if path in empty_dirs: # The root has no parent iteration to remove it
+        try:
+            os.rmdir(path)
+            removed_count += 1
+        except OSError as e:
+            custom_print_func(f"  Warning: Could not remove empty directory '{path}': {e}", level="WARNING", to_console=False)
+    return removed_count
 
 def cleanup_empty_directories(path, custom_print_func):
     """
     Recursively removes empty directories within the given path.
+    Directories are visited bottom-up, so a directory that only contained empty directories is removed as well.
     Args:
         path (str): The root path to start cleaning from.
         custom_print_func (function): The logging function.
     """
     custom_print_func(f"  Info: Cleaning up empty directories under '{path}'...", to_console=False)
-    for dirpath, dirnames, filenames in os.walk(path, topdown=False):
-        if not dirnames and not filenames:
-            try:
-                os.rmdir(dirpath)
-                custom_print_func(f"  Info: Removed empty directory: '{dirpath}'", to_console=False)
-            except OSError as e:
-                custom_print_func(f"  Warning: Could not remove empty directory '{dirpath}': {e}", level="WARNING", to_console=False)
-    custom_print_func(f"  Info: Empty directory cleanup complete for '{path}'.", to_console=False)
-
+    if hasattr(os, 'fwalk') and os.rmdir in os.supports_dir_fd:
+        removed_count = _remove_empty_dirs_by_fd(path, custom_print_func)
+    else:
+        removed_count = _remove_empty_dirs_by_path(path, custom_print_func)
+    custom_print_func(f"  Info: Empty directory cleanup complete for '{path}'. Removed {removed_count} empty directories.", to_console=False)
@@ -6,23 +6,174 @@ import re
 import sys
 import time
 import argparse
-from multiprocessing import Pool, cpu_count, Lock
+import functools
+import threading
+import contextlib
+from multiprocessing import Pool, cpu_count
 import xml.etree.ElementTree as ET
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 # Import functions from other modules
 from metadata_utils import get_audio_metadata_and_embedded_image_status, parse_opf_metadata, extract_series_info, extract_internal_part_info, strip_series_info_from_title, strip_part_info_from_title, normalize_publisher_name
-from file_system_utils import custom_print, sanitize_filename, hard_link_to_leftbehind, set_global_log_handles
+from file_system_utils import print_lock, custom_print, sanitize_filename, hard_link_to_leftbehind, hard_link_to_leftbehind_batch, set_global_log_handles, set_global_log_queue, start_log_writer, flush_log_writer, stop_log_writer, flush_log_handles, DEBUG_ENABLED
+try:
+    import orjson # Optional C JSON parser for the metadata cache; falls back to the json module
+except ImportError:
+    orjson = None
+try:
+    from _lcs import longest_common_substring as _compiled_longest_common_substring # Optional Cython build of _lcs.pyx
+except ImportError:
+    _compiled_longest_common_substring = None
 
 # SCRIPT VERSION - Increment this each time the script is modified and sent
 SCRIPT_VERSION = "1.0.40" # Updated version for ls_result generation, find_longest_common_substring, and cache debug
 
-# Global lock for print statements to avoid interleaving output from multiple processes/threads
-print_lock = Lock()
-
 AUDIO_EXTENSIONS = ('.mp3', '.m4a', '.m4b')
 IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
 EBOOK_EXTENSIONS = ('.epub', '.mobi', '.azw3', '.pdf', '.lit', '.prc', '.fb2', '.txt', '.rtf')
+# Pre-scan file classifier: group 1 matches an audio extension, otherwise the name ends in .opf.
+# One case-insensitive match per name instead of lower() plus two endswith calls.
+_PRESCAN_FILE_RE = re.compile(r'(?:(%s)|\.opf)\Z' % '|'.join(map(re.escape, AUDIO_EXTENSIONS)), re.IGNORECASE)
+# Author and series-name cleanup patterns used by group_physical_folders_into_logical_books
+# Author separators; the first author is the text before the earliest one (same as re.split(r'[;,/&]| and ', artist)[0])
+_AUTHOR_SEPARATORS = (';', ',', '/', '&', ' and ')
+_RE_DRAMATIZED = re.compile(r'\[Dramatized Adaptation\]', re.IGNORECASE)
+_RE_TRAILING_SERIES = re.compile(r'\s*(?:#\d+(?:\.\d+)?(?:[ -].*)?|\((?:book|part|disc|volume|vol)\s*\d+(?:\.\d+)?(?:\s+of\s*\d+(?:\.\d+)?)?\)|\[.*?\])$', re.IGNORECASE)
+_RE_PART_VOL = re.compile(r'\s*(?:Part|Disc|Volume|Vol)\s*\d+(?:\s+of\s*\d+)?', re.IGNORECASE)
+_RE_HASH_PART = re.compile(r'#\d+(?:\.\d+)?(?:,\s*(?:Part|Disc|Volume|Vol)\s*\d+(?:\s+of\s*\d+)?)?', re.IGNORECASE)
+_RE_HASH_TAIL = re.compile(r'\s*#\d+(?:\.\d+)?$', re.IGNORECASE)
+_RE_WS = re.compile(r'\s+')
+# Extras dispatch: lowercased extension -> kind of non-audio file (None: not an extra); unknown extensions are 'other'
+_EXTRA_KIND_BY_EXT = {
+    **{ext: None for ext in AUDIO_EXTENSIONS + ('.opf',)},
+    **{ext: 'image' for ext in IMAGE_EXTENSIONS},
+    **{ext: 'ebook' for ext in EBOOK_EXTENSIONS},
+}
+# (info, error, leftbehind reason) message formats per kind of extra file
+_EXTRA_LINK_MESSAGES = {
+    'cover': ("  Info: Hard-linked '{name}' as primary cover to '{dest}'",
+              "  Error: Could not hard-link primary cover '{name}': {error}",
+              "Hard-link failed for primary cover: {error}"),
+    'image': ("  Info: Hard-linked extra image '{name}' to '{dest}'",
+              "  Error: Could not hard-link extra image '{name}': {error}",
+              "Hard-link failed for extra image: {error}"),
+    'playlist': ("  Info: Hard-linked 'playlist.ll' to '{dest}'",
+                 "  Error: Could not hard-link 'playlist.ll' '{name}': {error}",
+                 "Hard-link failed for playlist.ll: {error}"),
+    'ebook': ("  Info: Hard-linked extra file '{name}' to '{dest}'",
+              "  Error: Could not hard-link extra file '{name}': {error}",
+              "Hard-link failed for extra file: {error}"),
+    'other': ("  Info: Hard-linked extra file '{name}' to '{dest}'",
+              "  Error: Could not hard-link extra file '{name}': {error}",
+              "Hard-link failed for extra file: {error}"),
+}
+LINK_THREADS = 8 # Threads per worker issuing a book's audio hard-links concurrently
+PROGRESS_UPDATE_INTERVAL = 0.1 # Minimum seconds between redraws of a progress line
+
+# Device of the source root, recorded once by the same-filesystem check in organize_audiobooks_main.
+# Compare later paths against this instead of re-stating the source root.
+SOURCE_DEV = None
+
+# Metadata cache read by the pre-scan workers, set once per worker via _init_prescan_worker
+_global_audiobook_cache = {}
+
+# Run directories and read-only grouping results used by every processing worker, set once per worker
+# via _init_process_worker
+_global_source_root_dir = None
+_global_dest_base_dir = None
+_global_leftbehind_base_dir = None
+_global_parent_book_paths = [] # Multi-part parent folders, indexed by the parent_index of each part's task
+_global_series_max_numbers = {}
+_global_ambiguous_base_names = frozenset()
+_global_ambiguous_authors = frozenset() # Authors appearing in _global_ambiguous_base_names
+# This worker's (audio, non-audio) manual-log part files, opened by _init_process_worker
+_global_manual_log_part_handles = None
+
+# Pre-scan result for one physical folder, returned by _get_physical_folder_metadata. A namedtuple
+# pickles as a plain tuple (no per-result key strings) and its fields are read as attributes.
+PhysicalFolderResult = namedtuple('PhysicalFolderResult', [
+    'physical_folder_path', 'combined_metadata', 'book_has_embedded_image', 'audio_file_paths_in_folder',
+    'audio_file_metadata_in_folder', 'audio_file_embedded_images_in_folder', 'worker_cache_updates'
+])
+
+# Outcome of one logical book or part, returned by process_single_logical_book_or_part
+BookResult = namedtuple('BookResult', ['linked_count', 'errors_count', 'book_info', 'associated_physical_folders'])
+
+# A physical folder as placed in its logical book group by group_physical_folders_into_logical_books
+GroupedFolder = namedtuple('GroupedFolder', [
+    'physical_folder_path', 'combined_metadata', 'book_has_embedded_image', 'audio_file_paths_in_folder',
+    'audio_file_metadata_in_folder', 'sanitized_core_book_title_for_grouping', 'publisher', 'performer'
+])
+
+class _SuffixAutomaton:
+    """
+    Suffix automaton of a single string: every substring of the string corresponds to exactly one state,
+    so all of them can be matched against other strings in time linear in the total length.
+    """
+    def __init__(self, text):
+        self.next = [{}]         # Outgoing transitions per state
+        self.link = [-1]         # Suffix link per state
+        self.length = [0]        # Length of the longest substring in each state
+        self.first_end = [-1]    # End index in text of each state's first occurrence
+        last = 0
+        for index, char in enumerate(text):
+            cur = self._add_state(self.length[last] + 1, index)
+            state = last
+            while state != -1 and char not in self.next[state]:
+                self.next[state][char] = cur
+                state = self.link[state]
+            if state == -1:
+                self.link[cur] = 0
+            else:
+                target = self.next[state][char]
+                if self.length[state] + 1 == self.length[target]:
+                    self.link[cur] = target
+                else:
+                    clone = self._add_state(self.length[state] + 1, self.first_end[target])
+                    self.next[clone] = dict(self.next[target])
+                    self.link[clone] = self.link[target]
+                    while state != -1 and self.next[state].get(char) == target:
+                        self.next[state][char] = clone
+                        state = self.link[state]
+                    self.link[target] = clone
+                    self.link[cur] = clone
+            last = cur
+        # States ordered by decreasing length, so suffix-link parents come after their children
+        self.by_length_desc = sorted(range(len(self.length)), key=self.length.__getitem__, reverse=True)
+
+    def _add_state(self, length, first_end):
+        self.next.append({})
+        self.link.append(-1)
+        self.length.append(length)
+        self.first_end.append(first_end)
+        return len(self.length) - 1
+
+    def match_lengths(self, other):
+        """
+        Returns, for every state, the length of the longest of its substrings that also occurs in other.
+        """
+        matched = [0] * len(self.length)
+        state = 0
+        run = 0
+        for char in other:
+            while state and char not in self.next[state]:
+                state = self.link[state]
+                run = self.length[state]
+            if char in self.next[state]:
+                state = self.next[state][char]
+                run += 1
+            else:
+                state = 0
+                run = 0
+            if run > matched[state]:
+                matched[state] = run
+        # A match in a state also matches (a suffix of) every state on its suffix-link path
+        for state in self.by_length_desc:
+            parent = self.link[state]
+            if parent > 0 and matched[state]:
+                matched[parent] = max(matched[parent], min(matched[state], self.length[parent]))
+        return matched
 
 def find_longest_common_substring(strings):
     """
@@ -37,97 +188,283 @@ def find_longest_common_substring(strings):
     if len(strings) == 1:
         return strings[0]
 
+    # Common case for multi-part titles after part stripping: the titles are identical, or the shortest is
+    # a prefix of all the others. The C-level common prefix is then the answer, since no common substring
+    # can be longer than the shortest title and the prefix is its leftmost occurrence.
+    shared_prefix = os.path.commonprefix(strings)
+    if len(shared_prefix) == min(len(string) for string in strings):
+        return shared_prefix.strip()
+
+    if _compiled_longest_common_substring is not None:
+        return _compiled_longest_common_substring(list(strings)).strip()
+
     s1 = strings[0]
-    longest_common = ""
-
-    for i in range(len(s1)):
-        for j in range(i + 1, len(s1) + 1):
-            substring = s1[i:j]
-            is_common = True
-            for other_string in strings[1:]:
-                if substring not in other_string:
-                    is_common = False
-                    break
-            if is_common and len(substring) > len(longest_common):
-                longest_common = substring
+    # Every substring of s1 is a state of its suffix automaton. Each other string is matched through
+    # it once, and a state's common length is the minimum matched length across all strings.
+    automaton = _SuffixAutomaton(s1)
+    common_length = list(automaton.length)
+    for other_string in strings[1:]:
+        for state, matched in enumerate(automaton.match_lengths(other_string)):
+            if matched < common_length[state]:
+                common_length[state] = matched
+
+    # The leftmost occurrence in s1 of maximal length wins, as with a left-to-right substring scan
+    longest_length = 0
+    longest_end = 0
+    for state in range(1, len(common_length)):
+        run_length = common_length[state]
+        end = automaton.first_end[state] + 1
+        if run_length > longest_length or (run_length == longest_length and run_length and end < longest_end):
+            longest_length = run_length
+            longest_end = end
+    longest_common = s1[longest_end - longest_length:longest_end]
     return longest_common.strip()
 
 def generate_ls_output(directory, output_file_path, custom_print_func):
     """
-    Generates 'ls -R' output for a given directory and saves it to a file.
+    Generates 'ls -R' style output for a given directory and saves it to a file.
+    The tree is walked with os.scandir and written one directory at a time, so the listing is never
+    held in memory as a whole and no 'ls' process is needed.
     Args:
-        directory (str): The directory to run 'ls -R' on.
+        directory (str): The directory to list recursively.
         output_file_path (str): The file path to save the output to.
         custom_print_func (function): The logging function.
     """
     custom_print_func(f"--- Generating ls -R output for '{directory}' ---", to_console=True)
     try:
-        # Use subprocess.run with shell=True for 'ls -R' for simplicity
-        # capture_output=True captures stdout and stderr
-        # text=True decodes stdout/stderr as text
-        result = subprocess.run(['ls', '-R', directory], capture_output=True, text=True, check=True)
-        with open(output_file_path, 'w', encoding='utf-8') as f:
-            f.write(result.stdout)
+        # A 1 MB write buffer keeps multi-GB listings to a few large writes
+        with open(output_file_path, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+            # Same layout as 'ls -R': a "dir:" header, one visible name per line, a blank line between
+            # directories, and subdirectories listed depth-first in name order
+            pending_dirs = [directory]
+            first_dir = True
+            while pending_dirs:
+                current_dir = pending_dirs.pop()
+                try:
+                    with os.scandir(current_dir) as it:
+                        entries = sorted((entry for entry in it if not entry.name.startswith('.')), key=lambda entry: entry.name)
+                except OSError as e:
+                    custom_print_func(f"Warning: Could not list '{current_dir}' for ls -R output: {e}", level="WARNING", to_console=False)
+                    continue
+                lines = [f"{current_dir}:\n" if first_dir else f"\n{current_dir}:\n"]
+                lines.extend(f"{entry.name}\n" for entry in entries)
+                f.writelines(lines)
+                first_dir = False
+                # Pushed in reverse so the stack pops them in name order
+                pending_dirs.extend(reversed([entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]))
         custom_print_func(f"ls -R output for '{directory}' saved to: '{output_file_path}'", to_console=True)
-    except FileNotFoundError:
-        custom_print_func(f"Error: 'ls' command not found. Cannot generate ls -R output for '{directory}'.", level="ERROR", to_console=True)
-    except subprocess.CalledProcessError as e:
-        custom_print_func(f"Error generating ls -R output for '{directory}': {e.stderr}", level="ERROR", to_console=True)
     except IOError as e:
         custom_print_func(f"Error writing ls -R output to '{output_file_path}': {e}", level="ERROR", to_console=True)
 
 
-def _get_physical_folder_metadata(args):
+def _find_audio_dirs(root_dir, exclude_names):
+    """
+    Finds every directory under root_dir (inclusive) that directly contains at least one audio file.
+    Walks the tree with os.scandir, using the file type cached in each directory entry, and stops checking
+    a directory's file names once one audio file has been found.
+    Args:
+        root_dir (str): The directory to search.
+        exclude_names (set): Directory names whose own files are not considered (their subdirectories still are).
+    Returns:
+        set: Paths of the directories containing audio files.
+    """
+    audio_extensions = AUDIO_EXTENSIONS # Local lookups in the per-entry loop
+    dirs_with_audio = set()
+    # (path, excluded) pairs; exclusion is decided from entry.name when a directory is queued,
+    # so no os.path.basename call is needed per directory
+    pending_dirs = [(root_dir, os.path.basename(root_dir) in exclude_names)]
+    while pending_dirs:
+        current_dir, has_audio = pending_dirs.pop() # Excluded: treat as already decided
+        try:
+            with os.scandir(current_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False): # Symlinked directories are not followed, like os.walk
+                        pending_dirs.append((entry.path, entry.name in exclude_names))
+                    elif not has_audio and not entry.is_dir() and entry.name.lower().endswith(audio_extensions):
+                        dirs_with_audio.add(current_dir)
+                        has_audio = True
+        except OSError:
+            continue # Unreadable directory, skipped like os.walk does
+    return dirs_with_audio
+
+def _list_files(root_dir):
+    """
+    Lists every file under root_dir, recursively: the paths os.walk would yield as os.path.join(root, file),
+    but built from os.scandir entries (whose cached file type and full path save a stat and a join per file).
+    Args:
+        root_dir (str): The directory to list.
+    Returns:
+        list: Paths of the files found.
+    """
+    files = []
+    pending_dirs = [root_dir]
+    while pending_dirs:
+        current_dir = pending_dirs.pop()
+        try:
+            with os.scandir(current_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False): # Symlinked directories are not followed, like os.walk
+                        pending_dirs.append(entry.path)
+                    elif not entry.is_dir(): # Symlinks to directories are neither files nor walked, as in os.walk
+                        files.append(entry.path)
+        except OSError:
+            continue # Unreadable directory, skipped like os.walk does
+    return files
+
+def _is_in_processed_folder(file_path, root_dir, processed_folders):
+    """
+    Returns True if any directory containing file_path, below root_dir, is in processed_folders.
+    """
+    current_dir = os.path.dirname(file_path)
+    while current_dir != root_dir and len(current_dir) > len(root_dir):
+        if current_dir in processed_folders:
+            return True
+        current_dir = os.path.dirname(current_dir)
+    return False
+
+def _init_prescan_worker(log_queue, audiobook_cache):
+    """
+    Initializer for the pre-scan multiprocessing.Pool: routes worker logging to the parent and stores
+    the metadata cache as a module global, so it reaches each worker once (inherited on fork) instead of
+    being pickled into every task.
+    """
+    global _global_audiobook_cache
+    set_global_log_queue(log_queue)
+    _global_audiobook_cache = audiobook_cache
+
+def _init_process_worker(log_queue, source_root_dir, dest_base_dir, leftbehind_base_dir, parent_book_paths, series_max_numbers, ambiguous_base_names, manual_log_parts_dir):
+    """
+    Initializer for the processing multiprocessing.Pool: routes worker logging to the parent and stores
+    the run directories and grouping results shared by all books as module globals, instead of pickling
+    them into every task.
+    Also opens this worker's manual-log part files in manual_log_parts_dir, which the parent merges into
+    the manual log at the end of the run (see _write_manual_log_parts).
+    """
+    global _global_source_root_dir, _global_dest_base_dir, _global_leftbehind_base_dir, _global_parent_book_paths
+    global _global_series_max_numbers, _global_ambiguous_base_names, _global_ambiguous_authors, _global_manual_log_part_handles
+    set_global_log_queue(log_queue)
+    _global_source_root_dir = source_root_dir
+    _global_dest_base_dir = dest_base_dir
+    _global_leftbehind_base_dir = leftbehind_base_dir
+    _global_parent_book_paths = parent_book_paths
+    _global_series_max_numbers = series_max_numbers
+    _global_ambiguous_base_names = ambiguous_base_names
+    _global_ambiguous_authors = frozenset(author for author, _ in ambiguous_base_names)
+    pid = os.getpid()
+    _global_manual_log_part_handles = tuple(
+        open(os.path.join(manual_log_parts_dir, f"{section}_{pid}.log"), 'a', encoding='utf-8')
+        for section in ('audio', 'non_audio')
+    )
+
+def _write_manual_log_parts(audio_manual_logs, non_audio_manual_logs):
+    """
+    Appends a book's manual-log entries to this worker's part files, so they are not pickled back
+    to the parent with the result.
+    """
+    for handle, entries in zip(_global_manual_log_part_handles, (audio_manual_logs, non_audio_manual_logs)):
+        if entries:
+            handle.write(''.join(entry + "\n" for entry in entries))
+            handle.flush() # Worker may be terminated once the pool is done
+
+def _get_valid_cache_entry(audiobook_cache, file_path, file_signatures):
+    """
+    Returns the cache entry for a file if it was recorded for the file's current modification
+    time and size, so files edited since the last run are parsed again.
+    Args:
+        audiobook_cache (dict): Metadata cache keyed by file path.
+        file_path (str): The audio or OPF file to look up.
+        file_signatures (dict): File path -> (st_mtime_ns, st_size) from the folder scan.
+    Returns:
+        dict or None: The cache entry, or None if it is missing or stale.
+    """
+    cache_entry = audiobook_cache.get(file_path)
+    if cache_entry is None:
+        return None
+    signature = file_signatures.get(file_path)
+    if signature is None or cache_entry.get('mtime_ns') != signature[0] or cache_entry.get('size') != signature[1]:
+        return None
+    return cache_entry
+
+def _get_physical_folder_metadata(physical_folder_path):
     """
     Worker function for multiprocessing pool to get metadata for a single physical folder.
+    The caller runs it with pool.imap_unordered and a chunksize, merging each result's
+    'worker_cache_updates' into the cache as results arrive.
     Args:
-        args (tuple): A tuple containing (physical_folder_path, audiobook_cache).
+        physical_folder_path (str): The folder to scan. The metadata cache is read from the
+                                    module global set by _init_prescan_worker.
     Returns:
-        dict: A dictionary containing metadata and processing results for the folder.
+        PhysicalFolderResult: Metadata and processing results for the folder.
     """
-    physical_folder_path, audiobook_cache = args
-    # Global log handles are set via Pool initializer, no need to pass them here
+    audiobook_cache = _global_audiobook_cache
+    # Worker log output is routed to the parent via the Pool initializer, no need to pass log handles here
 
     folder_name = os.path.basename(physical_folder_path)
     custom_print(f"  Info: Pre-scanning folder: '{folder_name}'", to_console=False)
 
     combined_metadata = None
     book_has_embedded_image = False
-    all_audio_files_details_in_folder = []
+    # Per audio file details as parallel lists (same index = same file), so no dict is built per file
+    audio_file_paths_in_folder = []
+    audio_file_metadata_in_folder = []
+    audio_file_embedded_images_in_folder = []
     worker_cache_updates = {} # Cache updates specific to this worker
 
     audio_files_in_folder = []
     opf_file = None
-
-    # Walk through the physical folder to find audio and OPF files
-    for root, _, files in os.walk(physical_folder_path):
-        for file in files:
-            file_path = os.path.join(root, file)
-            if file.lower().endswith(AUDIO_EXTENSIONS):
-                audio_files_in_folder.append(file_path)
-            elif file.lower().endswith('.opf'):
-                opf_file = file_path # Assuming one OPF per folder for now
-        if audio_files_in_folder or opf_file: # Stop after finding files in top level or first audio file
-            break
+    file_signatures = {} # File path -> (st_mtime_ns, st_size), used to validate cache entries
+
+    # Scan only the top level of the physical folder for audio and OPF files. Book folders are
+    # chosen because they hold audio directly, so subfolders never need to be descended into.
+    with os.scandir(physical_folder_path) as it:
+        for entry in it:
+            if entry.is_dir(): # Same split as os.walk: anything that is not a directory counts as a file
+                continue
+            match = _PRESCAN_FILE_RE.search(entry.name)
+            if match is None:
+                continue
+            if match.group(1): # Audio extension
+                audio_files_in_folder.append(entry.path)
+            else:
+                opf_file = entry.path # Assuming one OPF per folder for now
+            try:
+                stat_result = entry.stat()
+                file_signatures[entry.path] = (stat_result.st_mtime_ns, stat_result.st_size)
+            except OSError:
+                pass # No signature, so the file is parsed and its result is not cached
     
     audio_files_in_folder.sort() # Ensure consistent order
 
     if not audio_files_in_folder:
         custom_print(f"  Warning: No audio files found in '{folder_name}'. Skipping metadata extraction for this folder.", level="WARNING", to_console=False)
-        return {
-            'physical_folder_path': physical_folder_path,
-            'combined_metadata': None,
-            'book_has_embedded_image': False,
-            'all_audio_files_details_in_folder': [],
-            'worker_cache_updates': worker_cache_updates
-        }
+        flush_log_handles() # Worker may be terminated before its buffered log writes are flushed
+        return PhysicalFolderResult(
+            physical_folder_path=physical_folder_path,
+            combined_metadata=None,
+            book_has_embedded_image=False,
+            audio_file_paths_in_folder=[],
+            audio_file_metadata_in_folder=[],
+            audio_file_embedded_images_in_folder=[],
+            worker_cache_updates=worker_cache_updates
+        )
 
     # Try to find an OPF file first
     opf_metadata = {}
     if opf_file:
-        custom_print(f"  DEBUG: Found OPF file: '{os.path.basename(opf_file)}' in '{folder_name}'", level="DEBUG", to_console=False)
-        opf_metadata = parse_opf_metadata(opf_file, custom_print)
-        if opf_metadata:
+        if DEBUG_ENABLED:
+            custom_print(f"  DEBUG: Found OPF file: '{os.path.basename(opf_file)}' in '{folder_name}'", level="DEBUG", to_console=False)
+        opf_cache_entry = _get_valid_cache_entry(audiobook_cache, opf_file, file_signatures)
+        if opf_cache_entry is not None:
+            opf_metadata = opf_cache_entry['metadata']
+        else:
+            opf_metadata = parse_opf_metadata(opf_file, custom_print)
+            if opf_metadata and opf_file in file_signatures:
+                worker_cache_updates[opf_file] = {
+                    'metadata': opf_metadata,
+                    'mtime_ns': file_signatures[opf_file][0],
+                    'size': file_signatures[opf_file][1]
+                }
+        if opf_metadata and DEBUG_ENABLED:
             custom_print(f"  DEBUG: OPF metadata for '{folder_name}': {opf_metadata}", level="DEBUG", to_console=False)
             
     # Process each audio file for its metadata
@@ -135,25 +472,27 @@ def _get_physical_folder_metadata(args):
         audio_file_path = os.path.join(physical_folder_path, audio_file_name) # Ensure full path
         
         # Check cache first
-        if audio_file_path in audiobook_cache:
-            file_metadata = audiobook_cache[audio_file_path]['metadata']
-            has_embedded_image_for_file = audiobook_cache[audio_file_path]['has_embedded_image']
+        cache_entry = _get_valid_cache_entry(audiobook_cache, audio_file_path, file_signatures)
+        if cache_entry is not None:
+            file_metadata = cache_entry['metadata']
+            has_embedded_image_for_file = cache_entry['has_embedded_image']
             custom_print(f"  Info: Using cached metadata for '{os.path.basename(audio_file_path)}'", to_console=False)
         else:
             file_metadata, has_embedded_image_for_file = get_audio_metadata_and_embedded_image_status(audio_file_path, custom_print)
-            if file_metadata:
+            if file_metadata and audio_file_path in file_signatures:
                 worker_cache_updates[audio_file_path] = {
                     'metadata': file_metadata,
-                    'has_embedded_image': has_embedded_image_for_file
+                    'has_embedded_image': has_embedded_image_for_file,
+                    'mtime_ns': file_signatures[audio_file_path][0],
+                    'size': file_signatures[audio_file_path][1]
                 }
-            custom_print(f"  DEBUG: Fresh metadata for '{os.path.basename(audio_file_path)}': {file_metadata}", level="DEBUG", to_console=False)
+            if DEBUG_ENABLED:
+                custom_print(f"  DEBUG: Fresh metadata for '{os.path.basename(audio_file_path)}': {file_metadata}", level="DEBUG", to_console=False)
 
         if file_metadata:
-            all_audio_files_details_in_folder.append({
-                'file_path': audio_file_path,
-                'metadata': file_metadata,
-                'has_embedded_image': has_embedded_image_for_file
-            })
+            audio_file_paths_in_folder.append(audio_file_path)
+            audio_file_metadata_in_folder.append(file_metadata)
+            audio_file_embedded_images_in_folder.append(has_embedded_image_for_file)
             if has_embedded_image_for_file:
                 book_has_embedded_image = True
         else:
@@ -163,21 +502,24 @@ def _get_physical_folder_metadata(args):
     if opf_metadata:
         combined_metadata = opf_metadata.copy()
         # Overlay common audio file metadata if not present in OPF
-        if all_audio_files_details_in_folder:
-            first_audio_meta = all_audio_files_details_in_folder[0]['metadata']
+        if audio_file_metadata_in_folder:
+            first_audio_meta = audio_file_metadata_in_folder[0]
             for key in ['artist', 'album', 'title', 'genre', 'comment', 'grouping', 'description', 'TIT3', 'TRACKTOTAL', 'copyright', 'publisher', 'performer', 'date']:
                 if key not in combined_metadata and key in first_audio_meta:
                     combined_metadata[key] = first_audio_meta[key]
-        custom_print(f"  DEBUG: Combined metadata (OPF prioritized) for '{folder_name}': {combined_metadata}", level="DEBUG", to_console=False)
-    elif all_audio_files_details_in_folder:
+        if DEBUG_ENABLED:
+            custom_print(f"  DEBUG: Combined metadata (OPF prioritized) for '{folder_name}': {combined_metadata}", level="DEBUG", to_console=False)
+    elif audio_file_metadata_in_folder:
         # If no OPF, use metadata from the first audio file as the primary source for the folder
-        combined_metadata = all_audio_files_details_in_folder[0]['metadata'].copy()
-        custom_print(f"  DEBUG: Combined metadata (first audio file) for '{folder_name}': {combined_metadata}", level="DEBUG", to_console=False)
+        combined_metadata = audio_file_metadata_in_folder[0].copy()
+        if DEBUG_ENABLED:
+            custom_print(f"  DEBUG: Combined metadata (first audio file) for '{folder_name}': {combined_metadata}", level="DEBUG", to_console=False)
     
     # Ensure publisher is normalized in combined_metadata
     if combined_metadata and 'publisher' in combined_metadata:
         combined_metadata['publisher'] = normalize_publisher_name(combined_metadata['publisher'])
-        custom_print(f"  DEBUG: Publisher after normalization: '{combined_metadata['publisher']}' for '{folder_name}'", level="DEBUG", to_console=False)
+        if DEBUG_ENABLED:
+            custom_print(f"  DEBUG: Publisher after normalization: '{combined_metadata['publisher']}' for '{folder_name}'", level="DEBUG", to_console=False)
 
     # Extract part info from the physical folder name itself, and add to combined_metadata
     part_designation, part_number, total_parts = extract_internal_part_info(folder_name)
@@ -185,39 +527,149 @@ def _get_physical_folder_metadata(args):
         combined_metadata['extracted_part_designation'] = part_designation
         combined_metadata['extracted_part_number'] = part_number
         combined_metadata['extracted_total_parts'] = total_parts
-    custom_print(f"  DEBUG: Extracted part info for '{folder_name}': designation='{part_designation}', num={part_number}, total={total_parts}", level="DEBUG", to_console=False)
-
-    custom_print(f"  DEBUG: Worker cache updates for '{folder_name}': {worker_cache_updates}", level="DEBUG", to_console=False) # New debug print
+    if DEBUG_ENABLED:
+        custom_print(f"  DEBUG: Extracted part info for '{folder_name}': designation='{part_designation}', num={part_number}, total={total_parts}", level="DEBUG", to_console=False)
+
+    if DEBUG_ENABLED:
+        custom_print(f"  DEBUG: Worker cache updates for '{folder_name}': {worker_cache_updates}", level="DEBUG", to_console=False) # New debug print
+
+    flush_log_handles() # Worker may be terminated before its buffered log writes are flushed
+    return PhysicalFolderResult(
+        physical_folder_path=physical_folder_path,
+        combined_metadata=combined_metadata,
+        book_has_embedded_image=book_has_embedded_image,
+        audio_file_paths_in_folder=audio_file_paths_in_folder,
+        audio_file_metadata_in_folder=audio_file_metadata_in_folder,
+        audio_file_embedded_images_in_folder=audio_file_embedded_images_in_folder,
+        worker_cache_updates=worker_cache_updates
+    )
+
+def _link_file(link_task):
+    """
+    Hard-links a single (src, dst) pair; os.link releases the GIL, so several can run on threads.
+    Returns:
+        OSError or None: The error raised by os.link, or None on success.
+    """
+    try:
+        os.link(*link_task)
+        return None
+    except OSError as e:
+        return e
 
-    return {
-        'physical_folder_path': physical_folder_path,
-        'combined_metadata': combined_metadata,
-        'book_has_embedded_image': book_has_embedded_image,
-        'all_audio_files_details_in_folder': all_audio_files_details_in_folder,
-        'worker_cache_updates': worker_cache_updates
-    }
+def _link_files(link_tasks):
+    """
+    Hard-links a batch of (src, dst) pairs, overlapping the syscalls on a small thread pool.
+    Args:
+        link_tasks (list): (src, dst) pairs.
+    Returns:
+        list: One OSError or None per task, in task order.
+    """
+    if len(link_tasks) < 2:
+        return [_link_file(task) for task in link_tasks]
+    # Tasks repeating an earlier destination would race it, so they run afterwards and fail
+    # deterministically, just as they did when linked one by one
+    seen_dests = set()
+    first_indices, repeat_indices = [], []
+    for index, (_, dst) in enumerate(link_tasks):
+        (repeat_indices if dst in seen_dests else first_indices).append(index)
+        seen_dests.add(dst)
+    results = [None] * len(link_tasks)
+    with ThreadPoolExecutor(max_workers=min(LINK_THREADS, len(first_indices))) as executor:
+        for index, result in zip(first_indices, executor.map(_link_file, [link_tasks[i] for i in first_indices])):
+            results[index] = result
+    for index in repeat_indices:
+        results[index] = _link_file(link_tasks[index])
+    return results
+
+@functools.lru_cache(maxsize=1024)
+def _format_series_number(series_book_num, max_series_num):
+    """
+    Formats a series book number for a folder name prefix. Numbers are zero-padded to the width of the
+    series' highest number once that reaches 10 (e.g. "03" in a series up to 12, but "3" in one up to 9),
+    and fractional numbers keep their fraction (e.g. "2.5"). Books of a series share max_series_num, so each
+    number is formatted once and then served from the cache.
+    Args:
+        series_book_num (int or float): The book's number in its series.
+        max_series_num (int or float): The highest book number of the series.
+    Returns:
+        str: The formatted number.
+    """
+    # Based on user's goal, no leading zeros for single digits (e.g., "1 - The Way of Kings")
+    padding_length_for_series_num = len(str(int(max_series_num))) if int(max_series_num) >= 10 else 1
+
+    int_part = int(series_book_num)
+    frac_part_str = ""
+    if isinstance(series_book_num, float) and series_book_num != int_part:
+        str_series_number = str(series_book_num)
+        if '.' in str_series_number:
+            frac_part_str = "." + str_series_number.split('.')[-1]
+
+    # Apply padding only if padding_length_for_series_num is greater than 1
+    if padding_length_for_series_num > 1:
+        return f"{int_part:0{padding_length_for_series_num}d}{frac_part_str}"
+    return f"{int_part}{frac_part_str}" # No padding for single digits
+
+def _imap_unordered_bounded(pool, func, tasks, chunksize, max_in_flight):
+    """
+    pool.imap_unordered over tasks, with at most max_in_flight tasks handed to the pool ahead of the results
+    read so far. The pool's feeder thread takes a slot per task and each result read returns one, so neither
+    queued tasks nor unread results grow with the size of the run. Close the generator before the pool exits
+    (e.g. with contextlib.closing): closing hands back every slot, so a feeder still waiting on one can finish.
+    Args:
+        pool (multiprocessing.Pool): The pool to run the tasks in.
+        func (function): The worker function.
+        tasks (list): The task arguments.
+        chunksize (int): The chunksize for imap_unordered; max_in_flight must be at least this large.
+        max_in_flight (int): The maximum number of tasks given to the pool whose results have not been read.
+    Yields:
+        The results, in completion order.
+    """
+    in_flight_slots = threading.Semaphore(max_in_flight)
+    def feed_tasks():
+        for task in tasks:
+            in_flight_slots.acquire()
+            yield task
+    try:
+        for result in pool.imap_unordered(func, feed_tasks(), chunksize=chunksize):
+            in_flight_slots.release()
+            yield result
+    finally:
+        in_flight_slots.release(len(tasks))
 
 def process_single_logical_book_or_part(args):
     """
     Processes a single logical book or a part of a multi-part book.
     Args:
-        args (tuple): A tuple containing (logical_book_info, source_root_dir, dest_base_dir,
-                                         leftbehind_base_dir, series_max_numbers, ambiguous_base_names,
-                                         parent_book_path).
+        args (tuple): A tuple containing (logical_book_info, parent_index), where parent_index selects the
+                      multi-part parent folder (None for a single book).
+                      The source, destination and leftbehind directories, the parent folders,
+                      series_max_numbers and ambiguous_base_names come from _init_process_worker.
     Returns:
-        tuple: (linked_count, errors_count, final_book_path_relative_to_dest, audio_manual_logs, non_audio_manual_logs, successfully_linked_paths, associated_physical_folders)
+        BookResult: linked_count, errors_count, book_info (the book folder relative to the destination) and
+                    associated_physical_folders (a list of the source folders this book/part covered).
+               Manual-log entries are written to the worker's part files instead of being returned.
     """
-    logical_book_info, source_root_dir, dest_base_dir, leftbehind_base_dir, \
-    series_max_numbers, ambiguous_base_names, parent_book_path = args
+    logical_book_info, parent_index = args
+    parent_book_path = _global_parent_book_paths[parent_index] if parent_index is not None else None
+    source_root_dir = _global_source_root_dir
+    dest_base_dir = _global_dest_base_dir
+    leftbehind_base_dir = _global_leftbehind_base_dir
+    series_max_numbers = _global_series_max_numbers
+    ambiguous_base_names = _global_ambiguous_base_names
+    ambiguous_authors = _global_ambiguous_authors
 
-    # Global log handles are set via Pool initializer, no need to pass them here
+    # Worker log output is routed to the parent via the Pool initializer, no need to pass log handles here
+
+    # Local aliases for the path helpers called per file below
+    join = os.path.join
+    relpath = os.path.relpath
 
     linked_count = 0
     errors_count = 0
     audio_manual_logs = []
     non_audio_manual_logs = []
     successfully_linked_paths = set()
-    associated_physical_folders = set() # To track which physical folders were processed by this logical book/part
+    associated_physical_folders = [] # To track which physical folders were processed by this logical book/part (each appears in one part only)
 
     sanitized_author = logical_book_info['author']
     sanitized_series_name = logical_book_info['series_name']
@@ -228,48 +680,27 @@ def process_single_logical_book_or_part(args):
     book_has_embedded_image = logical_book_info['book_has_embedded_image']
     
     physical_folder_paths_for_this_part = logical_book_info['physical_folder_paths']
-    all_audio_files_details_for_this_part = logical_book_info['all_audio_files_details']
+    audio_file_paths_for_this_part = logical_book_info['audio_file_paths']
+    audio_file_metadata_for_this_part = logical_book_info['audio_file_metadata']
 
     part_display_name = logical_book_info['part_display_name'] # Will be None for single books
     # part_number_int = logical_book_info.get('part_number_int') # Integer part number for sorting/padding
     # total_parts_int = logical_book_info.get('total_parts_int') # Integer total parts for padding
 
     # Construct the destination path
-    dest_author_path = os.path.join(dest_base_dir, sanitized_author)
+    dest_author_path = join(dest_base_dir, sanitized_author)
     
     final_book_folder_name_prefix = ""
     if sanitized_series_name and series_book_num_for_folder is not None:
         max_series_num = series_max_numbers.get(sanitized_series_name, series_book_num_for_folder)
-        
-        # Determine padding for series number: only pad if max_series_num is 10 or more
-        # or if it's a float (e.g., 2.5) where the integer part is single digit but needs to align with multi-digit.
-        # Based on user's goal, no leading zeros for single digits (e.g., "1 - The Way of Kings")
-        padding_length_for_series_num = 1
-        if isinstance(max_series_num, float):
-            if int(max_series_num) >= 10:
-                padding_length_for_series_num = len(str(int(max_series_num)))
-        else: # Integer series number
-            if int(max_series_num) >= 10:
-                padding_length_for_series_num = len(str(int(max_series_num)))
-
-        int_part = int(series_book_num_for_folder)
-        frac_part_str = ""
-        if isinstance(series_book_num_for_folder, float) and series_book_num_for_folder != int_part:
-            str_series_number = str(series_book_num_for_folder)
-            if '.' in str_series_number:
-                frac_part_str = "." + str_series_number.split('.')[-1]
-        
-        # Apply padding only if padding_length_for_series_num is greater than 1
-        if padding_length_for_series_num > 1:
-            padded_series_number_str = f"{int_part:0{padding_length_for_series_num}d}{frac_part_str}"
-        else:
-            padded_series_number_str = f"{int_part}{frac_part_str}" # No padding for single digits
+        padded_series_number_str = _format_series_number(series_book_num_for_folder, max_series_num)
 
         final_book_folder_name_prefix = f"{padded_series_number_str} - "
 
     book_or_series_distinguisher_to_apply = ""
     check_base_name = sanitized_series_name if sanitized_series_name else sanitized_core_book_title
-    if (sanitized_author, check_base_name) in ambiguous_base_names:
+    # The author check (a cached string hash) rules out most books before a (author, name) tuple is built
+    if sanitized_author in ambiguous_authors and (sanitized_author, check_base_name) in ambiguous_base_names:
         if publisher:
             book_or_series_distinguisher_to_apply = f" (Published by {normalize_publisher_name(publisher)})" # Use normalized publisher directly
         elif performer:
@@ -279,36 +710,44 @@ def process_single_logical_book_or_part(args):
     if sanitized_series_name:
         # Series folder
         current_series_folder_name = f"{sanitized_series_name}{book_or_series_distinguisher_to_apply}"
-        dest_series_path = os.path.join(dest_author_path, sanitize_filename(current_series_folder_name))
+        dest_series_path = join(dest_author_path, sanitize_filename(current_series_folder_name))
         os.makedirs(dest_series_path, exist_ok=True)
-        custom_print(f"  Info: Created series folder: '{os.path.relpath(dest_series_path, dest_base_dir)}'", to_console=False)
+        custom_print(f"  Info: Created series folder: '{relpath(dest_series_path, dest_base_dir)}'", to_console=False)
         
         # Book folder goes under series folder
         base_book_folder_name = f"{final_book_folder_name_prefix}{sanitized_core_book_title}"
-        dest_book_base_path = os.path.join(dest_series_path, sanitize_filename(base_book_folder_name))
+        dest_book_base_path = join(dest_series_path, sanitize_filename(base_book_folder_name))
     else:
         # No series, book folder directly under author
         base_book_folder_name = f"{final_book_folder_name_prefix}{sanitized_core_book_title}{book_or_series_distinguisher_to_apply}"
-        dest_book_base_path = os.path.join(dest_author_path, sanitize_filename(base_book_folder_name))
+        dest_book_base_path = join(dest_author_path, sanitize_filename(base_book_folder_name))
 
     # Now, determine the final destination path for the current part/book
     dest_book_path = dest_book_base_path
     if logical_book_info.get('is_multi_part') and part_display_name:
         # For multi-part books, create a subfolder for each part
         clean_part_folder_name = part_display_name.strip('()') # e.g., "1 of 5"
-        dest_book_path = os.path.join(dest_book_base_path, sanitize_filename(clean_part_folder_name))
-        custom_print(f"  DEBUG: Multi-part book part path: '{os.path.relpath(dest_book_path, dest_base_dir)}'", level="DEBUG", to_console=False)
+        dest_book_path = join(dest_book_base_path, sanitize_filename(clean_part_folder_name))
+        if DEBUG_ENABLED:
+            custom_print(f"  DEBUG: Multi-part book part path: '{relpath(dest_book_path, dest_base_dir)}'", level="DEBUG", to_console=False)
     
     os.makedirs(dest_book_path, exist_ok=True)
-    custom_print(f"  Info: Created book/part folder: '{os.path.relpath(dest_book_path, dest_base_dir)}'", to_console=False)
+    custom_print(f"  Info: Created book/part folder: '{relpath(dest_book_path, dest_base_dir)}'", to_console=False)
 
-    final_book_path_relative_to_dest = os.path.relpath(dest_book_path, dest_base_dir)
+    final_book_path_relative_to_dest = relpath(dest_book_path, dest_base_dir)
 
     # Process audio files
-    num_audio_files_in_part = len(all_audio_files_details_for_this_part)
-    for i, audio_file_detail in enumerate(all_audio_files_details_for_this_part): # Use files specific to THIS part
-        src_audio_file_path = audio_file_detail['file_path']
-        audio_metadata = audio_file_detail['metadata']
+    num_audio_files_in_part = len(audio_file_paths_for_this_part)
+    audio_link_tasks = [] # (src, dst) pairs, linked together after all names are built
+    sorted_audio_file_index = None # Path -> 1-based position by name, built on the first track lacking metadata
+    # Most books are a single file outside any multi-part set: it is named after the book alone,
+    # so the track number parsing and padding below can be skipped entirely
+    single_file_book = num_audio_files_in_part == 1 and not (logical_book_info.get('is_multi_part') and part_display_name)
+    for src_audio_file_path, audio_metadata in zip(audio_file_paths_for_this_part, audio_file_metadata_for_this_part): # Use files specific to THIS part
+        if single_file_book:
+            final_audio_file_name = sanitize_filename(f"{sanitized_core_book_title}{os.path.splitext(src_audio_file_path)[1]}")
+            audio_link_tasks.append((src_audio_file_path, join(dest_book_path, final_audio_file_name)))
+            continue
         
         # Determine the track number for file naming
         track_num_raw = audio_metadata.get('track')
@@ -318,12 +757,11 @@ def process_single_logical_book_or_part(args):
         track_total = None
 
         if track_num_raw:
+            track_parts = track_num_raw.split('/') # "N" or "N/M", split once
             try:
-                if '/' in track_num_raw:
-                    track_num = int(track_num_raw.split('/')[0].strip())
-                    track_total = int(track_num_raw.split('/')[1].strip()) if len(track_num_raw.split('/')) > 1 else None
-                else:
-                    track_num = int(track_num_raw.strip())
+                track_num = int(track_parts[0].strip())
+                if len(track_parts) > 1:
+                    track_total = int(track_parts[1].strip())
             except ValueError:
                 custom_print(f"  Warning: Could not parse track number '{track_num_raw}' for '{os.path.basename(src_audio_file_path)}'.", level="WARNING", to_console=False)
         
@@ -347,11 +785,13 @@ def process_single_logical_book_or_part(args):
             elif track_num is not None:
                 track_info_for_filename = f" Track {track_num:0{padding}d}"
             else: # Fallback to index if no track metadata
-                # Sort files by name to ensure consistent indexing if track metadata is missing
-                sorted_audio_files_paths = sorted([d['file_path'] for d in all_audio_files_details_for_this_part])
-                current_file_index = sorted_audio_files_paths.index(src_audio_file_path) + 1
+                # Files are indexed by sorted name to ensure consistent indexing if track metadata is missing
+                if sorted_audio_file_index is None:
+                    sorted_audio_file_index = {path: idx + 1 for idx, path in enumerate(sorted(audio_file_paths_for_this_part))}
+                current_file_index = sorted_audio_file_index[src_audio_file_path]
                 track_info_for_filename = f" Track {current_file_index:0{padding}d} of {num_audio_files_in_part:0{padding}d}"
-                custom_print(f"  DEBUG: Using generated track index {current_file_index} for '{os.path.basename(src_audio_file_path)}'", level="DEBUG", to_console=False)
+                if DEBUG_ENABLED:
+                    custom_print(f"  DEBUG: Using generated track index {current_file_index} for '{os.path.basename(src_audio_file_path)}'", level="DEBUG", to_console=False)
 
         # Determine the file title for the audio file name
         # Always start with the core book title
@@ -368,28 +808,31 @@ def process_single_logical_book_or_part(args):
         final_audio_file_name = f"{audio_file_base_name}{track_info_for_filename}{os.path.splitext(src_audio_file_path)[1]}"
         final_audio_file_name = sanitize_filename(final_audio_file_name) # Ensure final name is sanitized
 
-        dest_audio_file_path = os.path.join(dest_book_path, final_audio_file_name)
+        audio_link_tasks.append((src_audio_file_path, join(dest_book_path, final_audio_file_name)))
 
-        try:
-            os.link(src_audio_file_path, dest_audio_file_path)
+    # Link the whole part in one batch, then report results in track order
+    for (src_audio_file_path, dest_audio_file_path), e in zip(audio_link_tasks, _link_files(audio_link_tasks)):
+        if e is None:
             linked_count += 1
             successfully_linked_paths.add(src_audio_file_path)
-            custom_print(f"  Info: Hard-linked '{os.path.basename(src_audio_file_path)}' to '{os.path.relpath(dest_audio_file_path, dest_base_dir)}'", to_console=False)
-        except OSError as e:
+            custom_print(f"  Info: Hard-linked '{os.path.basename(src_audio_file_path)}' to '{relpath(dest_audio_file_path, dest_base_dir)}'", to_console=False)
+        else:
             errors_count += 1
-            error_msg = f"  Error: Could not hard-link '{os.path.basename(src_audio_file_path)}' to '{os.path.relpath(dest_audio_file_path, dest_base_dir)}': {e}"
+            error_msg = f"  Error: Could not hard-link '{os.path.basename(src_audio_file_path)}' to '{relpath(dest_audio_file_path, dest_base_dir)}': {e}"
             custom_print(error_msg, level="ERROR", to_console=True)
             hard_link_to_leftbehind(src_audio_file_path, source_root_dir, leftbehind_base_dir, reason=f"Hard-link failed: {e}", manual_log_list=non_audio_manual_logs, level="ERROR")
     
     # Process non-audio files (e.g., cover art, PDFs, EPUBs) from the original physical folders
+    dest_extras_path = join(dest_book_path, "Extras")
+    extras_dir_created = False
     for physical_folder_path in physical_folder_paths_for_this_part: # Use physical folders specific to THIS part
-        associated_physical_folders.add(physical_folder_path) # Mark this folder as processed
+        associated_physical_folders.append(physical_folder_path) # Mark this folder as processed
         
         # Collect all potential extra files in the physical folder
-        all_files_in_folder = [
-            f for f in os.listdir(physical_folder_path)
-            if os.path.isfile(os.path.join(physical_folder_path, f))
-        ]
+        # DirEntry.is_file answers from the directory entry itself, so no extra stat per file
+        with os.scandir(physical_folder_path) as it:
+            all_file_entries = [entry for entry in it if entry.is_file()]
+        num_images_in_folder = sum(1 for entry in all_file_entries if entry.name.lower().endswith(IMAGE_EXTENSIONS)) # Counted once, not per image
         
         primary_cover_linked = False
         
@@ -402,96 +845,92 @@ def process_single_logical_book_or_part(args):
         # Prioritize linking a single "Cover.jpg" or similar if no embedded image
         # OR if an embedded image exists, but we still want a separate cover file.
         # The user's goal shows explicit Cover.jpg files, so we should always try to link them.
-        for file_name in all_files_in_folder:
-            src_file_path = os.path.join(physical_folder_path, file_name)
-
-            if file_name.lower().endswith(IMAGE_EXTENSIONS):
+        for entry in all_file_entries:
+            file_name = entry.name
+            src_file_path = entry.path
+            lower_name = file_name.lower() # Lowercased once per file for all extension/name checks below
+            file_ext = os.path.splitext(file_name)[1]
+            ext = file_ext.lower()
+            already_linked = src_file_path in successfully_linked_paths
+
+            # Classify the file once; audio and OPF files map to None and are left alone here
+            kind = 'playlist' if lower_name == 'playlist.ll' else _EXTRA_KIND_BY_EXT.get(ext, 'other')
+            if kind == 'image':
                 # Check if this image is a strong candidate for the main cover
-                if any(kw in file_name.lower() for kw in ['cover', 'folder', 'front']) or \
-                   (not primary_cover_linked and len([f for f in all_files_in_folder if f.lower().endswith(IMAGE_EXTENSIONS)]) == 1): # If only one image, assume it's the cover
-                    
-                    dest_image_path = os.path.join(dest_book_path, f"{sanitize_filename(cover_image_base_name)} Cover{os.path.splitext(file_name)[1]}")
-                    
-                    try:
-                        os.link(src_file_path, dest_image_path)
-                        linked_count += 1
-                        successfully_linked_paths.add(src_file_path)
-                        custom_print(f"  Info: Hard-linked '{file_name}' as primary cover to '{os.path.relpath(dest_image_path, dest_base_dir)}'", to_console=False)
-                        primary_cover_linked = True
-                    except OSError as e:
-                        errors_count += 1
-                        error_msg = f"  Error: Could not hard-link primary cover '{os.path.basename(src_file_path)}': {e}"
-                        custom_print(error_msg, level="ERROR", to_console=True)
-                        non_audio_manual_logs.append(f"[ERROR] {error_msg}")
-                        hard_link_to_leftbehind(src_file_path, source_root_dir, leftbehind_base_dir, reason=f"Hard-link failed for primary cover: {e}", manual_log_list=non_audio_manual_logs, level="ERROR")
-                
-                # All other image files (including those not chosen as primary cover) are treated as extras
-                # No separate "Artwork" folder, they go to "Extras" if not the main cover.
-                elif src_file_path not in successfully_linked_paths: # If not already linked as primary cover
-                    dest_extra_path = os.path.join(dest_book_path, "Extras", sanitize_filename(file_name))
-                    os.makedirs(os.path.dirname(dest_extra_path), exist_ok=True)
-                    try:
-                        os.link(src_file_path, dest_extra_path)
-                        linked_count += 1
-                        successfully_linked_paths.add(src_file_path)
-                        custom_print(f"  Info: Hard-linked extra image '{os.path.basename(src_file_path)}' to '{os.path.relpath(dest_extra_path, dest_base_dir)}'", to_console=False)
-                    except OSError as e:
-                        errors_count += 1
-                        error_msg = f"  Error: Could not hard-link extra image '{os.path.basename(src_file_path)}': {e}"
-                        custom_print(error_msg, level="ERROR", to_console=True)
-                        non_audio_manual_logs.append(f"[ERROR] {error_msg}")
-                        hard_link_to_leftbehind(src_file_path, source_root_dir, leftbehind_base_dir, reason=f"Hard-link failed for extra image: {e}", manual_log_list=non_audio_manual_logs, level="ERROR")
-            
-            elif file_name.lower() == 'playlist.ll':
+                if any(kw in lower_name for kw in ['cover', 'folder', 'front']) or \
+                   (not primary_cover_linked and num_images_in_folder == 1): # If only one image, assume it's the cover
+                    kind = 'cover'
+                elif already_linked: # If already linked as primary cover
+                    continue
+            elif kind is None or (already_linked and kind != 'playlist'):
+                continue
+
+            if kind == 'cover':
+                dest_file_path = join(dest_book_path, f"{sanitize_filename(cover_image_base_name)} Cover{file_ext}")
+            elif kind == 'playlist':
                 # Place playlist.ll directly in the book/part folder
-                dest_playlist_path = os.path.join(dest_book_path, sanitize_filename(file_name))
-                try:
-                    os.link(src_file_path, dest_playlist_path)
-                    linked_count += 1
-                    successfully_linked_paths.add(src_file_path)
-                    custom_print(f"  Info: Hard-linked 'playlist.ll' to '{os.path.relpath(dest_playlist_path, dest_base_dir)}'", to_console=False)
-                except OSError as e:
-                    errors_count += 1
-                    error_msg = f"  Error: Could not hard-link 'playlist.ll' '{os.path.basename(src_file_path)}': {e}"
-                    custom_print(error_msg, level="ERROR", to_console=True)
-                    non_audio_manual_logs.append(f"[ERROR] {error_msg}")
-                    hard_link_to_leftbehind(src_file_path, source_root_dir, leftbehind_base_dir, reason=f"Hard-link failed for playlist.ll: {e}", manual_log_list=non_audio_manual_logs, level="ERROR")
-            
-            elif file_name.lower().endswith(EBOOK_EXTENSIONS) and src_file_path not in successfully_linked_paths: # Handle EPUBs and PDFs explicitly
-                dest_extra_path = os.path.join(dest_book_path, "Extras", sanitize_filename(file_name))
-                os.makedirs(os.path.dirname(dest_extra_path), exist_ok=True)
-                try:
-                    os.link(src_file_path, dest_extra_path)
-                    linked_count += 1
-                    successfully_linked_paths.add(src_file_path)
-                    custom_print(f"  Info: Hard-linked extra file '{os.path.basename(src_file_path)}' to '{os.path.relpath(dest_extra_path, dest_base_dir)}'", to_console=False)
-                except OSError as e:
-                    errors_count += 1
-                    error_msg = f"  Error: Could not hard-link extra file '{os.path.basename(src_file_path)}': {e}"
-                    custom_print(error_msg, level="ERROR", to_console=True)
-                    non_audio_manual_logs.append(f"[ERROR] {error_msg}")
-                    hard_link_to_leftbehind(src_file_path, source_root_dir, leftbehind_base_dir, reason=f"Hard-link failed for extra file: {e}", manual_log_list=non_audio_manual_logs, level="ERROR")
-
-            elif not file_name.lower().endswith(AUDIO_EXTENSIONS + IMAGE_EXTENSIONS + ('.opf',) + EBOOK_EXTENSIONS) and src_file_path not in successfully_linked_paths: # Catch any other unhandled files
-                # Hard-link other non-audio, non-image files to an "Extras" subfolder
-                dest_extra_path = os.path.join(dest_book_path, "Extras", sanitize_filename(file_name))
-                os.makedirs(os.path.dirname(dest_extra_path), exist_ok=True)
-                try:
-                    os.link(src_file_path, dest_extra_path)
-                    linked_count += 1
-                    successfully_linked_paths.add(src_file_path)
-                    custom_print(f"  Info: Hard-linked extra file '{os.path.basename(src_file_path)}' to '{os.path.relpath(dest_extra_path, dest_base_dir)}'", to_console=False)
-                except OSError as e:
-                    errors_count += 1
-                    error_msg = f"  Error: Could not hard-link extra file '{os.path.basename(src_file_path)}': {e}"
-                    custom_print(error_msg, level="ERROR", to_console=True)
-                    non_audio_manual_logs.append(f"[ERROR] {error_msg}")
-                    hard_link_to_leftbehind(src_file_path, source_root_dir, leftbehind_base_dir, reason=f"Hard-link failed for extra file: {e}", manual_log_list=non_audio_manual_logs, level="ERROR")
+                dest_file_path = join(dest_book_path, sanitize_filename(file_name))
+            else:
+                # All other image files (including those not chosen as primary cover), ebooks and any other
+                # unhandled files go to "Extras". No separate "Artwork" folder.
+                if not extras_dir_created: # Created on first use, once per book/part
+                    os.makedirs(dest_extras_path, exist_ok=True)
+                    extras_dir_created = True
+                dest_file_path = join(dest_extras_path, sanitize_filename(file_name))
+
+            info_fmt, error_fmt, reason_fmt = _EXTRA_LINK_MESSAGES[kind]
+            try:
+                os.link(src_file_path, dest_file_path)
+                linked_count += 1
+                successfully_linked_paths.add(src_file_path)
+                custom_print(info_fmt.format(name=file_name, dest=relpath(dest_file_path, dest_base_dir)), to_console=False)
+                if kind == 'cover':
+                    primary_cover_linked = True
+            except OSError as e:
+                errors_count += 1
+                error_msg = error_fmt.format(name=file_name, error=e)
+                custom_print(error_msg, level="ERROR", to_console=True)
+                non_audio_manual_logs.append(f"[ERROR] {error_msg}")
+                hard_link_to_leftbehind(src_file_path, source_root_dir, leftbehind_base_dir, reason=reason_fmt.format(error=e), manual_log_list=non_audio_manual_logs, level="ERROR")
     
-    custom_print(f"  Organized logical book/part '{sanitized_core_book_title}' into '{os.path.relpath(dest_book_path, dest_base_dir)}'. Hard-linked {linked_count} files.", to_console=False)
-    processed_book_info = os.path.relpath(dest_book_path, dest_base_dir)
-    return (linked_count, errors_count, processed_book_info, audio_manual_logs, non_audio_manual_logs, successfully_linked_paths, associated_physical_folders)
+    custom_print(f"  Organized logical book/part '{sanitized_core_book_title}' into '{relpath(dest_book_path, dest_base_dir)}'. Hard-linked {linked_count} files.", to_console=False)
+    processed_book_info = relpath(dest_book_path, dest_base_dir)
+    _write_manual_log_parts(audio_manual_logs, non_audio_manual_logs)
+    flush_log_handles() # Worker may be terminated before its buffered log writes are flushed
+    return BookResult(linked_count, errors_count, processed_book_info, associated_physical_folders)
 
+def _sweep_to_leftbehind(args):
+    """
+    Hard-links one directory's unorganized files to 'leftbehind'; run in the processing pool by the final sweep.
+    Args:
+        args (tuple): (src_paths, reason). The directories come from _init_process_worker.
+    Returns:
+        tuple: (linked_count, errors_count)
+    """
+    src_paths, reason = args
+    # Manual-log lines go to the parent's manual log through the worker log queue
+    result = hard_link_to_leftbehind_batch(src_paths, _global_source_root_dir, _global_leftbehind_base_dir, reason=reason, level="INFO")
+    flush_log_handles() # Worker may be terminated before its buffered log writes are flushed
+    return result
+
+@functools.lru_cache(maxsize=1024)
+def _format_part_display_name(part_designation, part_num, part_total):
+    """
+    Formats a multi-part folder name such as "(Part 01 of 12)". Parts of the same book share their
+    designation and total, so each distinct combination is formatted once and then served from the cache.
+    Args:
+        part_designation (str or None): e.g. "Part", "Disc", "Volume"; None means "Part".
+        part_num (int or float): The part number.
+        part_total (int or float or None): The total number of parts, if known.
+    Returns:
+        str: The display name, including parentheses.
+    """
+    designation = part_designation if part_designation else 'Part'
+    if part_total is None: # Fallback if total isn't known
+        return f"({designation} {int(part_num)})"
+    # Pad part number and total parts for display
+    part_padding = max(len(str(int(part_num))), len(str(int(part_total))))
+    return f"({designation} {int(part_num):0{part_padding}d} of {int(part_total):0{part_padding}d})"
 
 def group_physical_folders_into_logical_books(physical_folder_metadata_results, custom_print_func):
     """
@@ -500,15 +939,16 @@ def group_physical_folders_into_logical_books(physical_folder_metadata_results,
         physical_folder_metadata_results (list): List of results from _get_physical_folder_metadata.
         custom_print_func (function): The logging function.
     Returns:
-        tuple: (list of logical book info dicts, dict of series max numbers, set of ambiguous base names)
+        tuple: (list of logical book info dicts, dict of series max numbers, frozenset of ambiguous (author, base name) pairs)
     """
-    logical_books_grouped_by_key = {} 
+    logical_books_grouped_by_key = defaultdict(list) # logical_book_key -> list of physical folder entries
     
     for physical_folder_result in physical_folder_metadata_results:
-        physical_folder_path = physical_folder_result['physical_folder_path']
-        combined_metadata = physical_folder_result['combined_metadata']
-        book_has_embedded_image_from_folder = physical_folder_result['book_has_embedded_image']
-        all_audio_files_details_in_folder = physical_folder_result['all_audio_files_details_in_folder']
+        physical_folder_path = physical_folder_result.physical_folder_path
+        combined_metadata = physical_folder_result.combined_metadata
+        book_has_embedded_image_from_folder = physical_folder_result.book_has_embedded_image
+        audio_file_paths_in_folder = physical_folder_result.audio_file_paths_in_folder
+        audio_file_metadata_in_folder = physical_folder_result.audio_file_metadata_in_folder
 
         if combined_metadata is None:
             # This physical folder had no audio files, or metadata extraction failed.
@@ -522,70 +962,100 @@ def group_physical_folders_into_logical_books(physical_folder_metadata_results,
         performer = combined_metadata.get('performer')
         publisher = combined_metadata.get('publisher') # This is already normalized
 
-        sanitized_author = sanitize_filename(re.split(r'[;,/&]| and ', artist)[0].strip()) if artist else "Unknown Author"
+        if artist:
+            # First author only: cut at the earliest separator, probing each with str.find
+            first_author = artist
+            for separator in _AUTHOR_SEPARATORS:
+                separator_index = first_author.find(separator)
+                if separator_index != -1:
+                    first_author = first_author[:separator_index]
+            sanitized_author = sanitize_filename(first_author.strip())
+        else:
+            sanitized_author = "Unknown Author"
         
-        custom_print_func(f"  DEBUG: Before extract_series_info - grouping: '{grouping}', album: '{album}', title: '{title}'", level="DEBUG", to_console=False)
+        if DEBUG_ENABLED:
+            custom_print_func(f"  DEBUG: Before extract_series_info - grouping: '{grouping}', album: '{album}', title: '{title}'", level="DEBUG", to_console=False)
         # Extract series info (cleaned series name and book number)
         sanitized_series_name, series_number_from_extracted_patterns = extract_series_info(grouping, album, title)
-        custom_print_func(f"  DEBUG: After extract_series_info - sanitized_series_name: '{sanitized_series_name}', series_number_from_extracted_patterns: {series_number_from_extracted_patterns}", level="DEBUG", to_console=False)
+        if DEBUG_ENABLED:
+            custom_print_func(f"  DEBUG: After extract_series_info - sanitized_series_name: '{sanitized_series_name}', series_number_from_extracted_patterns: {series_number_from_extracted_patterns}", level="DEBUG", to_console=False)
 
         # Prioritize series_book_num if it came directly from OPF parsing
         series_book_num_for_logic = None
         if 'series_book_num' in combined_metadata and combined_metadata['series_book_num'] is not None:
             series_book_num_for_logic = combined_metadata['series_book_num']
-            custom_print_func(f"  DEBUG: Using OPF-derived series_book_num: {series_book_num_for_logic}", level="DEBUG", to_console=False)
+            if DEBUG_ENABLED:
+                custom_print_func(f"  DEBUG: Using OPF-derived series_book_num: {series_book_num_for_logic}", level="DEBUG", to_console=False)
             # If OPF gave a series_book_num, ensure series_name is also consistent from grouping if available
             if not sanitized_series_name and 'grouping' in combined_metadata:
                 sanitized_series_name = sanitize_filename(combined_metadata['grouping'])
-                custom_print_func(f"  DEBUG: OPF series_book_num present, but no series_name. Using grouping: '{sanitized_series_name}'", level="DEBUG", to_console=False)
+                if DEBUG_ENABLED:
+                    custom_print_func(f"  DEBUG: OPF series_book_num present, but no series_name. Using grouping: '{sanitized_series_name}'", level="DEBUG", to_console=False)
                 # Re-clean the series name from grouping after setting it
                 if sanitized_series_name:
                     # Apply generic cleaning to the series name after setting it from grouping
-                    sanitized_series_name = re.sub(r'\[Dramatized Adaptation\]', '', sanitized_series_name, flags=re.IGNORECASE).strip() # Specific cleanup
-                    sanitized_series_name = re.sub(r'\s*(?:#\d+(?:\.\d+)?(?:[ -].*)?|\((?:book|part|disc|volume|vol)\s*\d+(?:\.\d+)?(?:\s+of\s*\d+(?:\.\d+)?)?\)|\[.*?\])$', '', sanitized_series_name, flags=re.IGNORECASE).strip()
-                    sanitized_series_name = re.sub(r'\s*(?:Part|Disc|Volume|Vol)\s*\d+(?:\s+of\s*\d+)?', '', sanitized_series_name, flags=re.IGNORECASE).strip()
-                    sanitized_series_name = re.sub(r'#\d+(?:\.\d+)?(?:,\s*(?:Part|Disc|Volume|Vol)\s*\d+(?:\s+of\s*\d+)?)?', '', sanitized_series_name, flags=re.IGNORECASE).strip()
-                    sanitized_series_name = re.sub(r'\s*#\d+(?:\.\d+)?$', '', sanitized_series_name, flags=re.IGNORECASE).strip()
-                    sanitized_series_name = re.sub(r'\s+', ' ', sanitized_series_name).strip()
-                    custom_print_func(f"  DEBUG: Sanitized series name after OPF-driven cleanup: '{sanitized_series_name}'", level="DEBUG", to_console=False)
+                    sanitized_series_name = _RE_DRAMATIZED.sub('', sanitized_series_name).strip() # Specific cleanup
+                    sanitized_series_name = _RE_TRAILING_SERIES.sub('', sanitized_series_name).strip()
+                    sanitized_series_name = _RE_PART_VOL.sub('', sanitized_series_name).strip()
+                    sanitized_series_name = _RE_HASH_PART.sub('', sanitized_series_name).strip()
+                    sanitized_series_name = _RE_HASH_TAIL.sub('', sanitized_series_name).strip()
+                    sanitized_series_name = _RE_WS.sub(' ', sanitized_series_name).strip()
+                    if DEBUG_ENABLED:
+                        custom_print_func(f"  DEBUG: Sanitized series name after OPF-driven cleanup: '{sanitized_series_name}'", level="DEBUG", to_console=False)
         else:
             series_book_num_for_logic = series_number_from_extracted_patterns
-            custom_print_func(f"  DEBUG: Using extracted series_book_num: {series_book_num_for_logic}", level="DEBUG", to_console=False)
+            if DEBUG_ENABLED:
+                custom_print_func(f"  DEBUG: Using extracted series_book_num: {series_book_num_for_logic}", level="DEBUG", to_console=False)
         
         # Determine the core book title, stripping *both* series and part info for the logical grouping key
         overall_book_title_raw = title.strip() if title else album.strip() if album else os.path.basename(physical_folder_path)
-        custom_print_func(f"  DEBUG: overall_book_title_raw: '{overall_book_title_raw}'", level="DEBUG", to_console=False)
+        if DEBUG_ENABLED:
+            custom_print_func(f"  DEBUG: overall_book_title_raw: '{overall_book_title_raw}'", level="DEBUG", to_console=False)
 
-        # First, strip series info to get a cleaner base title
-        temp_core_title = strip_series_info_from_title(overall_book_title_raw, sanitized_series_name, series_book_num_for_logic)
-        custom_print_func(f"  DEBUG: temp_core_title (after series strip): '{temp_core_title}'", level="DEBUG", to_console=False)
+        # First, strip series info to get a cleaner base title (nothing to strip without a series name or number)
+        if sanitized_series_name or series_book_num_for_logic is not None:
+            temp_core_title = strip_series_info_from_title(overall_book_title_raw, sanitized_series_name, series_book_num_for_logic)
+        else:
+            temp_core_title = overall_book_title_raw.strip()
+        if DEBUG_ENABLED:
+            custom_print_func(f"  DEBUG: temp_core_title (after series strip): '{temp_core_title}'", level="DEBUG", to_console=False)
         # Then, strip part info from that cleaner title
         final_core_book_title_for_grouping = strip_part_info_from_title(temp_core_title)
-        custom_print_func(f"  DEBUG: final_core_book_title_for_grouping (after part strip): '{final_core_book_title_for_grouping}'", level="DEBUG", to_console=False)
+        if DEBUG_ENABLED:
+            custom_print_func(f"  DEBUG: final_core_book_title_for_grouping (after part strip): '{final_core_book_title_for_grouping}'", level="DEBUG", to_console=False)
 
         if not final_core_book_title_for_grouping: # Fallback if stripping left it empty
             final_core_book_title_for_grouping = temp_core_title if temp_core_title else overall_book_title_raw
-            custom_print_func(f"  DEBUG: final_core_book_title_for_grouping was empty, using fallback: '{final_core_book_title_for_grouping}'", level="DEBUG", to_console=False)
+            if DEBUG_ENABLED:
+                custom_print_func(f"  DEBUG: final_core_book_title_for_grouping was empty, using fallback: '{final_core_book_title_for_grouping}'", level="DEBUG", to_console=False)
 
         sanitized_core_book_title_for_grouping = sanitize_filename(final_core_book_title_for_grouping)
-        custom_print_func(f"  DEBUG: sanitized_core_book_title_for_grouping: '{sanitized_core_book_title_for_grouping}'", level="DEBUG", to_console=False)
+        if DEBUG_ENABLED:
+            custom_print_func(f"  DEBUG: sanitized_core_book_title_for_grouping: '{sanitized_core_book_title_for_grouping}'", level="DEBUG", to_console=False)
+
+        # Intern the key strings: equal names from different folders become one object, so key lookups
+        # compare by identity and thousands of folders by one author share a single string
+        sanitized_author = sys.intern(sanitized_author)
+        if sanitized_series_name:
+            sanitized_series_name = sys.intern(sanitized_series_name)
+        if publisher:
+            publisher = sys.intern(publisher)
 
         # Define the key for the logical book (author, series, book_num, publisher)
         logical_book_key = (sanitized_author, sanitized_series_name, series_book_num_for_logic, publisher)
-        custom_print_func(f"  DEBUG: Generated logical_book_key for '{os.path.basename(physical_folder_path)}': {logical_book_key}", level="DEBUG", to_console=False)
-
-        if logical_book_key not in logical_books_grouped_by_key:
-            logical_books_grouped_by_key[logical_book_key] = []
-        
-        logical_books_grouped_by_key[logical_book_key].append({
-            'physical_folder_path': physical_folder_path,
-            'combined_metadata': combined_metadata,
-            'book_has_embedded_image': book_has_embedded_image_from_folder,
-            'all_audio_files_details_in_folder': all_audio_files_details_in_folder,
-            'sanitized_core_book_title_for_grouping': sanitized_core_book_title_for_grouping, # Add this for later use
-            'publisher': publisher, # Add publisher for sub-grouping
-            'performer': performer # Add performer for ambiguity
-        })
+        if DEBUG_ENABLED:
+            custom_print_func(f"  DEBUG: Generated logical_book_key for '{os.path.basename(physical_folder_path)}': {logical_book_key}", level="DEBUG", to_console=False)
+
+        logical_books_grouped_by_key[logical_book_key].append(GroupedFolder(
+            physical_folder_path=physical_folder_path,
+            combined_metadata=combined_metadata,
+            book_has_embedded_image=book_has_embedded_image_from_folder,
+            audio_file_paths_in_folder=audio_file_paths_in_folder,
+            audio_file_metadata_in_folder=audio_file_metadata_in_folder,
+            sanitized_core_book_title_for_grouping=sanitized_core_book_title_for_grouping, # Add this for later use
+            publisher=publisher, # Add publisher for sub-grouping
+            performer=performer # Add performer for ambiguity
+        ))
 
     custom_print_func(f"Grouped {len(physical_folder_metadata_results)} physical folders into {len(logical_books_grouped_by_key)} initial logical book keys (including publisher).", to_console=True)
 
@@ -600,7 +1070,7 @@ def group_physical_folders_into_logical_books(physical_folder_metadata_results,
             sanitized_series_name = logical_book_key[1]
             series_book_num_for_logic = logical_book_key[2]
             publisher = logical_book_key[3] # Get publisher from the key
-            sanitized_core_book_title = res['sanitized_core_book_title_for_grouping']
+            sanitized_core_book_title = res.sanitized_core_book_title_for_grouping
 
             final_logical_books_for_processing.append({
                 'author': sanitized_author,
@@ -608,10 +1078,11 @@ def group_physical_folders_into_logical_books(physical_folder_metadata_results,
                 'series_book_num': series_book_num_for_logic,
                 'core_book_title': sanitized_core_book_title,
                 'publisher': publisher,
-                'performer': res['performer'],
-                'book_has_embedded_image': res['book_has_embedded_image'],
-                'physical_folder_paths': [res['physical_folder_path']],
-                'all_audio_files_details': res['all_audio_files_details_in_folder'],
+                'performer': res.performer,
+                'book_has_embedded_image': res.book_has_embedded_image,
+                'physical_folder_paths': [res.physical_folder_path],
+                'audio_file_paths': res.audio_file_paths_in_folder,
+                'audio_file_metadata': res.audio_file_metadata_in_folder,
                 'is_multi_part': False, # This is a single-part book
                 'part_display_name': None 
             })
@@ -628,14 +1099,16 @@ def group_physical_folders_into_logical_books(physical_folder_metadata_results,
             # Collect all titles/albums for common substring calculation
             titles_for_common_substring = []
             for res in physical_folder_results_list:
-                raw_title = res['combined_metadata'].get('title') or res['combined_metadata'].get('album') or os.path.basename(res['physical_folder_path'])
+                raw_title = res.combined_metadata.get('title') or res.combined_metadata.get('album') or os.path.basename(res.physical_folder_path)
                 # Strip part info *before* finding common substring, so "Book Title Part 1" and "Book Title Part 2" yield "Book Title"
                 cleaned_title_for_common = strip_part_info_from_title(raw_title)
                 titles_for_common_substring.append(cleaned_title_for_common)
             
-            custom_print_func(f"  DEBUG: Titles for common substring detection: {titles_for_common_substring}", level="DEBUG", to_console=False)
+            if DEBUG_ENABLED:
+                custom_print_func(f"  DEBUG: Titles for common substring detection: {titles_for_common_substring}", level="DEBUG", to_console=False)
             shared_book_title = find_longest_common_substring(titles_for_common_substring)
-            custom_print_func(f"  DEBUG: Shared book title found: '{shared_book_title}'", level="DEBUG", to_console=False)
+            if DEBUG_ENABLED:
+                custom_print_func(f"  DEBUG: Shared book title found: '{shared_book_title}'", level="DEBUG", to_console=False)
 
             if not shared_book_title: # Fallback if no significant common substring
                 shared_book_title = f"{sanitized_series_name if sanitized_series_name else 'Book'} {series_book_num_for_logic if series_book_num_for_logic is not None else ''}".strip() + " (Multi-Part)"
@@ -643,39 +1116,38 @@ def group_physical_folders_into_logical_books(physical_folder_metadata_results,
 
             # Create individual logical book entries for each part
             # Sort parts by their extracted part number for consistent ordering
-            physical_folder_results_list.sort(key=lambda x: x['combined_metadata'].get('extracted_part_number') if x['combined_metadata'].get('extracted_part_number') is not None else 0)
+            physical_folder_results_list.sort(key=lambda x: x.combined_metadata.get('extracted_part_number') or 0) # Missing/None part numbers sort as 0
 
             for i, res in enumerate(physical_folder_results_list):
-                original_physical_folder_name = os.path.basename(res['physical_folder_path'])
-                custom_print_func(f"  DEBUG: Processing part of multi-part book. Original physical folder name: '{original_physical_folder_name}'", level="DEBUG", to_console=False)
+                original_physical_folder_name = os.path.basename(res.physical_folder_path)
+                if DEBUG_ENABLED:
+                    custom_print_func(f"  DEBUG: Processing part of multi-part book. Original physical folder name: '{original_physical_folder_name}'", level="DEBUG", to_console=False)
                 
-                part_designation = res['combined_metadata'].get('extracted_part_designation')
-                part_num = res['combined_metadata'].get('extracted_part_number')
-                part_total = res['combined_metadata'].get('extracted_total_parts')
+                part_designation = res.combined_metadata.get('extracted_part_designation')
+                part_num = res.combined_metadata.get('extracted_part_number')
+                part_total = res.combined_metadata.get('extracted_total_parts')
                 
                 # Determine part_display_name based on user's desired format
                 part_display_name = ""
-                if part_num is not None and part_total is not None:
-                    # Pad part number and total parts for display
-                    part_padding = max(len(str(int(part_num))), len(str(int(part_total))))
-                    part_display_name = f"({part_designation if part_designation else 'Part'} {int(part_num):0{part_padding}d} of {int(part_total):0{part_padding}d})"
-                elif part_num is not None: # Fallback if total isn't known
-                    part_display_name = f"({part_designation if part_designation else 'Part'} {int(part_num)})"
+                if part_num is not None:
+                    part_display_name = _format_part_display_name(part_designation, part_num, part_total)
                 else: # Fallback to generic if no part info at all
                     part_display_name = f"(Part {i+1})" # Generic fallback for part index
                 
-                custom_print_func(f"  DEBUG: Calculated part_display_name (before sanitization): '{part_display_name}'", level="DEBUG", to_console=False)
+                if DEBUG_ENABLED:
+                    custom_print_func(f"  DEBUG: Calculated part_display_name (before sanitization): '{part_display_name}'", level="DEBUG", to_console=False)
 
                 part_info = {
                     'author': sanitized_author,
                     'series_name': sanitized_series_name, # Inherit series name
                     'series_book_num': series_book_num_for_logic, # Inherit book num
                     'core_book_title': sanitize_filename(shared_book_title), # Use the shared title for the part's core title
-                    'publisher': res['publisher'],
-                    'performer': res['performer'],
-                    'book_has_embedded_image': res['book_has_embedded_image'],
-                    'physical_folder_paths': [res['physical_folder_path']],
-                    'all_audio_files_details': res['all_audio_files_details_in_folder'],
+                    'publisher': res.publisher,
+                    'performer': res.performer,
+                    'book_has_embedded_image': res.book_has_embedded_image,
+                    'physical_folder_paths': [res.physical_folder_path],
+                    'audio_file_paths': res.audio_file_paths_in_folder,
+                    'audio_file_metadata': res.audio_file_metadata_in_folder,
                     'is_multi_part': True, # This is an individual part of a multi-part book
                     'part_display_name': part_display_name, # Name for its sub-folder, including parentheses
                     'part_index_for_multi_part_parent': i+1 # Pass index for fallback if needed
@@ -684,7 +1156,7 @@ def group_physical_folders_into_logical_books(physical_folder_metadata_results,
     
     # Now, calculate ambiguous_base_names based on the *final* book titles/series names
     ambiguous_base_names = set()
-    temp_base_name_tracker = {} # (author, base_name) -> set of (publisher, performer)
+    first_seen_variation = {} # (author, base_name) -> first (publisher, performer) seen for it
     for logical_book_info in final_logical_books_for_processing:
         # For multi-part books, the 'core_book_title' is the shared title for all parts.
         # For single books, it's their own core_book_title.
@@ -695,18 +1167,18 @@ def group_physical_folders_into_logical_books(physical_folder_metadata_results,
         
         author = logical_book_info['author']
         key = (author, base_name_for_ambiguity_check)
-        if key not in temp_base_name_tracker:
-            temp_base_name_tracker[key] = set()
         
         normalized_publisher = logical_book_info['publisher'] if logical_book_info['publisher'] else None
         normalized_performer = logical_book_info['performer'] if logical_book_info['performer'] else None
-        temp_base_name_tracker[key].add((normalized_publisher, normalized_performer))
-
-    for key, variations in temp_base_name_tracker.items():
-        if len(variations) > 1:
+        variation = (normalized_publisher, normalized_performer)
+        previous_variation = first_seen_variation.get(key)
+        if previous_variation is None:
+            first_seen_variation[key] = variation
+        elif previous_variation != variation: # A second distinct variation makes the pair ambiguous
             ambiguous_base_names.add(key)
     custom_print_func(f"Identified {len(ambiguous_base_names)} ambiguous (author, name) pairs for final folder naming.", to_console=True)
-    custom_print_func(f"  Ambiguous pairs: {ambiguous_base_names}", level="DEBUG", to_console=False)
+    if DEBUG_ENABLED:
+        custom_print_func(f"  Ambiguous pairs: {ambiguous_base_names}", level="DEBUG", to_console=False)
 
     # Recalculate series_max_numbers based on the final logical books
     series_max_numbers = {}
@@ -714,14 +1186,13 @@ def group_physical_folders_into_logical_books(physical_folder_metadata_results,
         if logical_book_info['series_name'] and logical_book_info['series_book_num'] is not None:
             sanitized_series_name = logical_book_info['series_name']
             series_number_to_use = logical_book_info['series_book_num']
-            if sanitized_series_name not in series_max_numbers:
-                series_max_numbers[sanitized_series_name] = series_number_to_use
-            else:
-                series_max_numbers[sanitized_series_name] = max(series_max_numbers[sanitized_series_name], series_number_to_use)
+            previous_max = series_max_numbers.get(sanitized_series_name) # Single lookup; never None once stored
+            series_max_numbers[sanitized_series_name] = series_number_to_use if previous_max is None else max(previous_max, series_number_to_use)
     
-    custom_print_func(f"  DEBUG: series_max_numbers after final logical grouping: {series_max_numbers}", level="DEBUG", to_console=False)
+    if DEBUG_ENABLED:
+        custom_print_func(f"  DEBUG: series_max_numbers after final logical grouping: {series_max_numbers}", level="DEBUG", to_console=False)
 
-    return final_logical_books_for_processing, series_max_numbers, ambiguous_base_names
+    return final_logical_books_for_processing, series_max_numbers, frozenset(ambiguous_base_names)
 
 
 def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_log_path, cache_file_path, target_author=None, target_series=None, force_empty=False):
@@ -737,6 +1208,7 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
     
     # Set global log handles for the main process and initial setup
     set_global_log_handles(log_file_handle, manual_log_file_handle)
+    worker_log_queue = start_log_writer() # All log writes, including pool workers', go through one writer thread
 
     custom_print(f"--- Starting Audiobook Organization (Script Version: {SCRIPT_VERSION}) ---", to_console=True)
     custom_print(f"Source Root Directory: '{source_root_dir}'", to_console=True)
@@ -762,6 +1234,7 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
         manual_log_file_handle.write(f"[ERROR] Organization aborted.\n")
         manual_log_file_handle.flush()
         custom_print("Organization aborted.", level="ERROR", to_console=True)
+        stop_log_writer()
         log_file_handle.close()
         manual_log_file_handle.close()
         return
@@ -777,12 +1250,14 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
         manual_log_file_handle.write(f"[ERROR] Organization aborted.\n")
         manual_log_file_handle.flush()
         custom_print("Organization aborted.", level="ERROR", to_console=True)
+        stop_log_writer()
         log_file_handle.close()
         manual_log_file_handle.close()
         return
     if os.path.exists(dest_base_dir):
         custom_print(f"Warning: Destination directory '{dest_base_dir}' already exists.", level="WARNING", to_console=True)
         if not force_empty:
+            flush_log_writer()
             print("Waiting for your input to proceed...", file=sys.stderr)
             response = input("Do you want to empty its contents before proceeding? (y/N): ").strip().lower()
         else:
@@ -804,6 +1279,7 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
                 manual_log_file_handle.flush()
                 custom_print("This might be due to files being in use by another process. Please ensure no other applications are accessing this directory.", level="ERROR", to_console=True)
                 custom_print("Organization aborted.", level="ERROR", to_console=True)
+                stop_log_writer()
                 log_file_handle.close()
                 manual_log_file_handle.close()
                 return
@@ -812,6 +1288,7 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
             custom_print(info_msg, level="INFO", to_console=True)
             manual_log_file_handle.write(f"[INFO] {info_msg}\n")
             manual_log_file_handle.flush()
+            stop_log_writer()
             log_file_handle.close()
             manual_log_file_handle.close()
             return
@@ -825,6 +1302,7 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
             manual_log_file_handle.write(f"[ERROR] Organization aborted.\n")
             manual_log_file_handle.flush()
             custom_print("Organization aborted.", level="ERROR", to_console=True)
+            stop_log_writer()
             log_file_handle.close()
             manual_log_file_handle.close()
             return
@@ -844,6 +1322,7 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
             manual_log_file_handle.flush()
             custom_print("This might be due to files being in use by another process. Please ensure no other applications are accessing this directory.", level="ERROR", to_console=True)
             custom_print("Organization aborted.", level="ERROR", to_console=True)
+            stop_log_writer()
             log_file_handle.close()
             manual_log_file_handle.close()
             return
@@ -857,9 +1336,11 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
             manual_log_file_handle.write(f"[ERROR] Organization aborted.\n")
             manual_log_file_handle.flush()
             custom_print("Organization aborted.", level="ERROR", to_console=True)
+            stop_log_writer()
             log_file_handle.close()
             manual_log_file_handle.close()
             return
+    global SOURCE_DEV
     try:
         source_stat = os.stat(source_root_dir)
         dest_stat = os.stat(dest_base_dir)
@@ -871,9 +1352,11 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
             manual_log_file_handle.write(f"[ERROR] Hard linking is not possible across different filesystems. Organization aborted.\n")
             manual_log_file_handle.flush()
             custom_print("Hard linking is not possible across different filesystems. Organization aborted.", level="ERROR", to_console=True)
+            stop_log_writer()
             log_file_handle.close()
             manual_log_file_handle.close()
             return
+        SOURCE_DEV = source_stat.st_dev
     except OSError as e:
         error_msg = f"Error checking filesystem for directories: {e}"
         custom_print(error_msg, level="ERROR", to_console=True)
@@ -881,16 +1364,19 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
         manual_log_file_handle.write(f"[ERROR] Organization aborted.\n")
         manual_log_file_handle.flush()
         custom_print("Organization aborted.", level="ERROR", to_console=True)
+        stop_log_writer()
         log_file_handle.close()
         manual_log_file_handle.close()
         return
-    all_audio_manual_logs = []
-    all_non_audio_manual_logs = []
     audiobook_cache = {}
     try:
         if os.path.exists(cache_file_path):
-            with open(cache_file_path, 'r', encoding='utf-8') as f:
-                audiobook_cache = json.load(f)
+            if orjson is not None: # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handlers below still apply
+                with open(cache_file_path, 'rb') as f:
+                    audiobook_cache = orjson.loads(f.read())
+            else:
+                with open(cache_file_path, 'r', encoding='utf-8') as f:
+                    audiobook_cache = json.load(f)
             custom_print(f"Loaded metadata cache from '{cache_file_path}'.", to_console=False)
     except json.JSONDecodeError as e:
         custom_print(f"Warning: Could not load metadata cache from '{cache_file_path}' (corrupted JSON?): {e}. Starting with empty cache.", level="WARNING", to_console=True)
@@ -900,45 +1386,54 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
         audiobook_cache = {}
     
     # Identify all top-level physical book folders
-    all_physical_book_folder_paths = []
-    dirs_with_audio = set()
-    for root, _, files in os.walk(source_root_dir):
-        if os.path.basename(root) == ".audiobook_organizer_data" or os.path.basename(root) == os.path.basename(dest_base_dir) or os.path.basename(root) == os.path.basename(LEFTBEHIND_BASE_DIR):
+    dirs_with_audio = _find_audio_dirs(source_root_dir, {".audiobook_organizer_data", os.path.basename(dest_base_dir), os.path.basename(LEFTBEHIND_BASE_DIR)})
+    # A folder is a top-level book unless an ancestor below the source root also holds audio. Sorted by
+    # path components, every folder's descendants directly follow it, so one prefix check against the
+    # last accepted folder replaces walking up each folder's ancestors.
+    top_level_book_dirs = set()
+    last_top_level_prefix = None
+    for d in sorted(dirs_with_audio, key=lambda path: path.split(os.sep)):
+        if last_top_level_prefix is not None and d.startswith(last_top_level_prefix):
             continue
-        for file in files:
-            if file.lower().endswith(AUDIO_EXTENSIONS):
-                dirs_with_audio.add(root)
-                break
-    for d in sorted(list(dirs_with_audio)):
-        is_top_level_book = True
-        current_dir = d
-        while current_dir != source_root_dir and os.path.dirname(current_dir) != source_root_dir:
-            parent_dir = os.path.dirname(current_dir)
-            if parent_dir in dirs_with_audio:
-                is_top_level_book = False
-                break
-            current_dir = parent_dir
-        if is_top_level_book:
-            all_physical_book_folder_paths.append(d)
+        top_level_book_dirs.add(d)
+        if d != source_root_dir: # The source root itself never hides the folders below it
+            last_top_level_prefix = d + os.sep
+    all_physical_book_folder_paths = [d for d in sorted(dirs_with_audio) if d in top_level_book_dirs]
     
     custom_print("Pre-scanning physical book folders to collect initial metadata (parallelized)...", to_console=True)
     physical_folder_metadata_results = [] # Stores results from _get_physical_folder_metadata
     total_folders_to_prescan = len(all_physical_book_folder_paths)
     
-    # Pass log file handles to worker processes using initializer and initargs
-    # The actual arguments to _get_physical_folder_metadata will NOT include the file handles directly
-    pool_args_prescan = [(path, audiobook_cache) for path in all_physical_book_folder_paths]
+    # Route worker log output to the parent's log writer and hand over the cache using initializer and initargs
+    # The actual arguments to _get_physical_folder_metadata are just the folder paths
+    pool_args_prescan = all_physical_book_folder_paths
     num_processes = cpu_count()
+    # Small libraries don't need a worker per core; each extra worker is a fork plus an initializer run
+    prescan_processes = max(1, min(num_processes, total_folders_to_prescan))
+    # Hand out folders in chunks (about 4 per worker) so each task message carries several folders,
+    # while results still stream back and idle workers keep picking up new chunks. Fewer than
+    # 4 folders per worker falls back to chunksize 1 to keep the load balanced.
+    prescan_chunksize = max(1, total_folders_to_prescan // (4 * prescan_processes))
     
-    with Pool(processes=num_processes, initializer=set_global_log_handles, initargs=(log_file_handle, manual_log_file_handle)) as pool:
-        for i, result in enumerate(pool.imap_unordered(_get_physical_folder_metadata, pool_args_prescan)):
+    # Workers only look up files below the source root, so the cache entries for other libraries (kept for
+    # later runs) are left out of what each worker receives or, under fork, touches and copies
+    source_root_prefix = os.path.join(source_root_dir, '')
+    prescan_cache = {path: entry for path, entry in audiobook_cache.items() if path.startswith(source_root_prefix)}
+    
+    last_progress_print = 0.0
+    with Pool(processes=prescan_processes, initializer=_init_prescan_worker, initargs=(worker_log_queue, prescan_cache)) as pool:
+        for i, result in enumerate(pool.imap_unordered(_get_physical_folder_metadata, pool_args_prescan, chunksize=prescan_chunksize)):
             physical_folder_metadata_results.append(result)
             # Update main cache from worker updates
-            if result['worker_cache_updates']: # worker_cache_updates
-                audiobook_cache.update(result['worker_cache_updates'])
-            with print_lock:
-                print(f"\rPre-scan Progress: {i+1}/{total_folders_to_prescan} folders scanned ({(((i+1) / total_folders_to_prescan) * 100):.2f}%)", end="")
-                sys.stdout.flush()
+            if result.worker_cache_updates:
+                audiobook_cache.update(result.worker_cache_updates)
+            # Redraw at most every PROGRESS_UPDATE_INTERVAL seconds, and always for the last folder
+            now = time.monotonic()
+            if i + 1 == total_folders_to_prescan or now - last_progress_print >= PROGRESS_UPDATE_INTERVAL:
+                last_progress_print = now
+                with print_lock:
+                    print(f"\rPre-scan Progress: {i+1}/{total_folders_to_prescan} folders scanned ({(((i+1) / total_folders_to_prescan) * 100):.2f}%)", end="")
+                    sys.stdout.flush()
     print()
     custom_print("Pre-scan complete.", to_console=True)
 
@@ -950,21 +1445,24 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
     
     total_linked_to_organized_final = 0
     total_errors_final = 0
-    all_successfully_linked_to_organized_source_paths = set()
     unique_books_processed = set() # This will track the *final* top-level book folders created
+    # Distinct lengths of the paths in unique_books_processed. A path has a recorded path as a prefix exactly
+    # when its slice at one of these lengths is in the set, so the check costs one lookup per length
+    # instead of a startswith per recorded book.
+    unique_book_path_lengths = set()
 
-    # Collect all source files to track which ones are not linked
-    all_source_files_found_during_scan = set()
-    for physical_folder_path in all_physical_book_folder_paths:
-        for root, _, files in os.walk(physical_folder_path):
-            for file in files:
-                all_source_files_found_during_scan.add(os.path.join(root, file))
+    # Physical folders covered by a processed book/part. Every file in them was handled by the worker (linked,
+    # or sent to 'leftbehind'), so only the remaining folders are walked for the final sweep.
+    processed_physical_folders = set()
 
 
     processed_books_count = 0
     total_books_to_process = len(logical_books_for_processing)
 
     pool_args_process = []
+    parent_book_paths = [] # Each multi-part parent folder once; its parts' tasks carry only the index
+    ambiguous_authors = frozenset(author for author, _ in ambiguous_base_names) # Cheap pre-check for the lookup below
+    created_parent_book_paths = set() # Parent folders already created in this run; skips repeat makedirs calls
     for logical_book_info in logical_books_for_processing:
         # If it's a multi-part logical book, we need to handle its parent folder creation first
         if logical_book_info.get('is_multi_part'):
@@ -978,7 +1476,7 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
 
             book_or_series_distinguisher_to_apply = ""
             check_base_name = sanitized_series_name if sanitized_series_name else sanitized_core_book_title
-            if (sanitized_author, check_base_name) in ambiguous_base_names:
+            if sanitized_author in ambiguous_authors and (sanitized_author, check_base_name) in ambiguous_base_names:
                 if publisher:
                     book_or_series_distinguisher_to_apply = f" (Published by {normalize_publisher_name(publisher)})"
                 elif performer:
@@ -989,25 +1487,7 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
             final_book_folder_name_prefix = ""
             if sanitized_series_name and series_book_num_for_folder is not None:
                 max_series_num = series_max_numbers.get(sanitized_series_name, series_book_num_for_folder)
-                padding_length_for_series_num = 1
-                if isinstance(max_series_num, float):
-                    if int(max_series_num) >= 10:
-                        padding_length_for_series_num = len(str(int(max_series_num)))
-                else:
-                    if int(max_series_num) >= 10:
-                        padding_length_for_series_num = len(str(int(max_series_num)))
-
-                int_part = int(series_book_num_for_folder)
-                frac_part_str = ""
-                if isinstance(series_book_num_for_folder, float) and series_book_num_for_folder != int_part:
-                    str_series_number = str(series_book_num_for_folder)
-                    if '.' in str_series_number:
-                        frac_part_str = "." + str_series_number.split('.')[-1]
-                
-                if padding_length_for_series_num > 1:
-                    padded_series_number_str = f"{int_part:0{padding_length_for_series_num}d}{frac_part_str}"
-                else:
-                    padded_series_number_str = f"{int_part}{frac_part_str}"
+                padded_series_number_str = _format_series_number(series_book_num_for_folder, max_series_num)
 
                 final_book_folder_name_prefix = f"{padded_series_number_str} - "
 
@@ -1021,54 +1501,84 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
             else:
                 parent_book_path_for_parts = os.path.join(dest_author_path, sanitize_filename(f"{final_book_folder_name_prefix}{sanitized_core_book_title}{book_or_series_distinguisher_to_apply}"))
             
-            os.makedirs(parent_book_path_for_parts, exist_ok=True)
+            if parent_book_path_for_parts not in created_parent_book_paths:
+                os.makedirs(parent_book_path_for_parts, exist_ok=True)
+                created_parent_book_paths.add(parent_book_path_for_parts)
             custom_print(f"  Created parent folder for multi-part book: '{os.path.relpath(parent_book_path_for_parts, dest_base_dir)}'", to_console=False)
-            unique_books_processed.add(os.path.relpath(parent_book_path_for_parts, dest_base_dir))
+            parent_book_path_relative = os.path.relpath(parent_book_path_for_parts, dest_base_dir)
+            unique_books_processed.add(parent_book_path_relative)
+            unique_book_path_lengths.add(len(parent_book_path_relative))
 
             # Add each part to the pool_args_process
+            parent_index = len(parent_book_paths)
+            parent_book_paths.append(parent_book_path_for_parts)
             for part_info in logical_book_info['parts']:
-                pool_args_process.append((part_info, source_root_dir, dest_base_dir, LEFTBEHIND_BASE_DIR, series_max_numbers, ambiguous_base_names, parent_book_path_for_parts))
+                pool_args_process.append((part_info, parent_index))
         else:
             # Add single logical book to the pool_args_process
-            pool_args_process.append((logical_book_info, source_root_dir, dest_base_dir, LEFTBEHIND_BASE_DIR, series_max_numbers, ambiguous_base_names, None))
-
-    # Execute processing in parallel
-    with Pool(processes=num_processes, initializer=set_global_log_handles, initargs=(log_file_handle, manual_log_file_handle)) as pool:
-        for i, result in enumerate(pool.imap_unordered(process_single_logical_book_or_part, pool_args_process)):
-            linked_count, errors_count, book_info, audio_logs, non_audio_logs, successfully_linked_paths_from_worker, associated_physical_folders = result
-            
-            total_linked_to_organized_final += linked_count
-            total_errors_final += errors_count
-            all_successfully_linked_to_organized_source_paths.update(successfully_linked_paths_from_worker)
-            if book_info and not any(book_info.startswith(parent_path) for parent_path in unique_books_processed): # Only add if it's a top-level book, not a sub-part
+            pool_args_process.append((logical_book_info, None))
+
+    # Execute processing in parallel. The run directories, parent folders, series_max_numbers and ambiguous_base_names reach
+    # each worker once through the initializer; books are handed out about 4 chunks per worker, as in the pre-scan,
+    # with no more than 2 chunks per worker handed out ahead of the results read.
+    process_chunksize = max(1, len(pool_args_process) // (4 * num_processes))
+    process_max_in_flight = 2 * num_processes * process_chunksize
+    # Workers append their manual-log entries to per-process files here instead of returning them
+    manual_log_parts_dir = os.path.join(os.path.dirname(manual_log_path), "manual_log_parts")
+    shutil.rmtree(manual_log_parts_dir, ignore_errors=True) # Left over from an interrupted run
+    os.makedirs(manual_log_parts_dir)
+    last_progress_print = 0.0
+    with Pool(processes=num_processes, initializer=_init_process_worker, initargs=(worker_log_queue, source_root_dir, dest_base_dir, LEFTBEHIND_BASE_DIR, parent_book_paths, series_max_numbers, ambiguous_base_names, manual_log_parts_dir)) as pool, \
+            contextlib.closing(_imap_unordered_bounded(pool, process_single_logical_book_or_part, pool_args_process, process_chunksize, process_max_in_flight)) as process_results:
+        for i, result in enumerate(process_results):
+            book_info = result.book_info
+            total_linked_to_organized_final += result.linked_count
+            total_errors_final += result.errors_count
+            if book_info and not any(book_info[:length] in unique_books_processed for length in unique_book_path_lengths): # Only add if it's a top-level book, not a sub-part
                 unique_books_processed.add(book_info)
-            all_audio_manual_logs.extend(audio_logs)
-            all_non_audio_manual_logs.extend(non_audio_logs)
+                unique_book_path_lengths.add(len(book_info))
             
-            # Remove processed files from all_source_files_found_during_scan
-            for folder_path in associated_physical_folders:
-                for root_inner, _, files_inner in os.walk(folder_path):
-                    for file_name_inner in files_inner:
-                        file_path_inner = os.path.join(root_inner, file_name_inner)
-                        if file_path_inner in all_source_files_found_during_scan:
-                            all_source_files_found_during_scan.remove(file_path_inner)
-
-            with print_lock:
-                progress_percent = (i+1 / total_books_to_process) * 100 # Adjusted progress for each part/book processed
-                print(f"\rOverall Progress: {i+1}/{total_books_to_process} logical books/parts processed ({progress_percent:.2f}%)", end="")
-                sys.stdout.flush()
-    print() # Newline after progress bar
-
-    custom_print("\n--- Sweeping for unorganized files to move to _leftbehind ---", to_console=True)
-    total_unlinked_found_in_sweep = 0
-    
-    # Any files remaining in all_source_files_found_during_scan were not part of any logical book processed
-    for src_file_path in all_source_files_found_during_scan:
+            processed_physical_folders.update(result.associated_physical_folders)
+
+            # Redraw at most every PROGRESS_UPDATE_INTERVAL seconds, and always for the last book/part
+            now = time.monotonic()
+            if i + 1 == total_books_to_process or now - last_progress_print >= PROGRESS_UPDATE_INTERVAL:
+                last_progress_print = now
+                progress_percent = ((i+1) / total_books_to_process) * 100 # Adjusted progress for each part/book processed
+                with print_lock: # The log writer thread also writes to the console
+                    print(f"\rOverall Progress: {i+1}/{total_books_to_process} logical books/parts processed ({progress_percent:.2f}%)", end="")
+                    sys.stdout.flush()
+        print() # Newline after progress bar
+
+        custom_print("\n--- Sweeping for unorganized files to move to _leftbehind ---", to_console=True)
+        # Collect the files of the book folders no logical book covered, walking them in the pool. The source
+        # tree is not written to during the run, so this finds what a scan before processing would have found.
+        all_source_files_found_during_scan = set()
+        if source_root_dir not in processed_physical_folders: # A processed source root covers every file below it
+            unprocessed_folder_paths = [physical_folder_path for physical_folder_path in all_physical_book_folder_paths
+                                        if physical_folder_path not in processed_physical_folders]
+            walk_chunksize = max(1, len(unprocessed_folder_paths) // (4 * num_processes))
+            for folder_files in pool.imap_unordered(_list_files, unprocessed_folder_paths, chunksize=walk_chunksize):
+                all_source_files_found_during_scan.update(folder_files)
+            if source_root_dir in all_physical_book_folder_paths:
+                # Only the source root can contain other book folders; drop the files of the processed ones
+                all_source_files_found_during_scan = {
+                    src_file_path for src_file_path in all_source_files_found_during_scan
+                    if not _is_in_processed_folder(src_file_path, source_root_dir, processed_physical_folders)
+                }
+        # Any files remaining in all_source_files_found_during_scan were not part of any logical book processed.
+        # They are linked by the same pool, one task per source directory, so each directory's 'leftbehind'
+        # counterpart is created and opened by a single worker.
         reason = "File not organized into main structure."
-        if hard_link_to_leftbehind(src_file_path, source_root_dir, LEFTBEHIND_BASE_DIR, reason=reason, manual_log_list=all_non_audio_manual_logs, level="INFO"):
-            total_unlinked_found_in_sweep += 1
-        else:
-            total_errors_final += 1
+        sweep_files_by_dir = defaultdict(list)
+        for src_file_path in all_source_files_found_during_scan:
+            sweep_files_by_dir[os.path.dirname(src_file_path)].append(src_file_path)
+        pool_args_sweep = [(src_paths, reason) for src_paths in sweep_files_by_dir.values()]
+        sweep_chunksize = max(1, len(pool_args_sweep) // (4 * num_processes))
+        total_unlinked_found_in_sweep = 0
+        for linked_count, errors_count in pool.imap_unordered(_sweep_to_leftbehind, pool_args_sweep, chunksize=sweep_chunksize):
+            total_unlinked_found_in_sweep += linked_count
+            total_errors_final += errors_count
             
     custom_print(f"Sweep complete. Found and hard-linked {total_unlinked_found_in_sweep} files to '{LEFTBEHIND_BASE_DIR}'.", to_console=True)
     end_time = time.time()
@@ -1091,27 +1601,40 @@ def organize_audiobooks_main(source_root_dir, dest_base_dir, log_path, manual_lo
     generate_ls_output(dest_base_dir, organized_ls_output_path, custom_print)
     generate_ls_output(LEFTBEHIND_BASE_DIR, leftbehind_ls_output_path, custom_print)
 
+    # Manual-log lines are buffered; write them out now so they land before the rewrite below, not on top of it
+    flush_log_writer()
+    flush_log_handles()
     try:
-        with open(manual_log_path, 'w', encoding='utf-8') as f:
-            f.write("--- Audio-Related Manual Actions ---\n")
-            if not all_audio_manual_logs:
-                f.write("[INFO] No audio-related manual actions required.\n")
-            for log_entry in all_audio_manual_logs:
-                f.write(log_entry + "\n")
-            f.write("\n--- Non-Audio/Image File Manual Actions (Including Unorganized Files) ---\n")
-            if not all_non_audio_manual_logs:
-                f.write("[INFO] No non-audio/image file manual actions required.\n")
-            for log_entry in all_non_audio_manual_logs:
-                f.write(log_entry + "\n")
+        # Each section is the concatenation of the workers' non-empty part files for it, streamed through
+        # 1 MB buffers so large logs are written in a few big writes without being read into memory whole
+        with os.scandir(manual_log_parts_dir) as it:
+            manual_log_parts = sorted((entry.name, entry.path) for entry in it if entry.stat().st_size)
+        with open(manual_log_path, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+            for section, header, none_required_msg in (
+                    ('audio', "--- Audio-Related Manual Actions ---\n", "[INFO] No audio-related manual actions required.\n"),
+                    ('non_audio', "\n--- Non-Audio/Image File Manual Actions (Including Unorganized Files) ---\n", "[INFO] No non-audio/image file manual actions required.\n")):
+                f.write(header)
+                section_part_paths = [part_path for part_name, part_path in manual_log_parts if part_name.rpartition('_')[0] == section]
+                if not section_part_paths:
+                    f.write(none_required_msg)
+                for part_path in section_part_paths:
+                    with open(part_path, 'r', encoding='utf-8') as part_file:
+                        shutil.copyfileobj(part_file, f, 1024 * 1024)
     except IOError as e:
         custom_print(f"Error: Could not write to manual log file '{manual_log_path}': {e}", level="ERROR", to_console=True)
+    shutil.rmtree(manual_log_parts_dir, ignore_errors=True)
     try:
-        with open(cache_file_path, 'w', encoding='utf-8') as f:
-            json.dump(audiobook_cache, f, indent=4)
+        if orjson is not None: # C serializer, typically several times faster than json with indentation
+            with open(cache_file_path, 'wb') as f:
+                f.write(orjson.dumps(audiobook_cache, option=orjson.OPT_INDENT_2))
+        else:
+            with open(cache_file_path, 'w', encoding='utf-8') as f:
+                json.dump(audiobook_cache, f) # Compact output; pretty-printing roughly doubles the dump time
         custom_print(f"Saved updated metadata cache to '{cache_file_path}'.", level="INFO", to_console=False)
     except IOError as e:
         custom_print(f"Error: Could not save metadata cache to '{cache_file_path}': {e}", level="ERROR", to_console=True)
     finally: # Ensure log files are closed even if errors occur
+        stop_log_writer()
         if log_file_handle:
             log_file_handle.close()
         if manual_log_file_handle:
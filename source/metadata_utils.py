@@ -1,31 +1,79 @@
 import os
 import re
+import functools
 import xml.etree.ElementTree as ET
 from mutagen.mp3 import MP3, EasyMP3
-from mutagen.m4a import M4A # Keep M4A for specific M4A tag handling if needed
 from mutagen.mp4 import MP4 # Explicitly import MP4 for broader MP4 container support
-from mutagen.id3 import ID3NoHeaderError, ID3, TXXX, TORY
-from mutagen.mp4 import MP4Tags, MP4Cover, AtomDataType
-from PIL import Image
-import io
+from mutagen.id3 import ID3NoHeaderError
 
 # Import custom_print and sanitize_filename from file_system_utils
-from file_system_utils import custom_print, sanitize_filename
+from file_system_utils import custom_print, sanitize_filename, DEBUG_ENABLED
 
 # SCRIPT VERSION - Increment this each time the script is modified and sent
 SCRIPT_VERSION = "1.0.37" # Incremented version for this change
 
 AUDIO_EXTENSIONS = ('.mp3', '.m4a', '.m4b')
 IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+_MP4_AUDIO_EXTENSIONS = frozenset(('.m4a', '.m4b'))
+# Lowercased artist values that say nothing about the author
+_GENERIC_ARTISTS = frozenset(('various artists', 'unknown artist', ''))
 
 def _get_tag_value(tag_obj):
     """Safely extracts string value from a Mutagen tag object."""
+    # Exact-type checks first: Mutagen hands back plain lists (or strings) for nearly every tag
+    tag_type = type(tag_obj)
+    if tag_type is list:
+        return str(tag_obj[0]) if tag_obj else None
+    if tag_type is str:
+        return tag_obj
     if tag_obj is None:
         return None
     if isinstance(tag_obj, (list, tuple)):
         return str(tag_obj[0]) if tag_obj else None
     return str(tag_obj)
 
+# Common tags: album, artist, title, genre, comment, grouping, description, TIT3, TRACKTOTAL
+# (tag key prefixes, metadata key), checked in order
+_MP3_TAG_PREFIXES = (
+    (('album',), 'album'),
+    (('artist',), 'artist'),
+    (('title',), 'title'),
+    (('genre',), 'genre'),
+    (('comment',), 'comment'),
+    (('grouping',), 'grouping'),
+    (('desc', 'description'), 'description'),
+    (('TIT3',), 'TIT3'), # Subtitle
+    (('TRCK', 'track'), 'track'), # Track number
+    (('TPUB', 'publisher'), 'publisher'), # Publisher
+    (('TPE4', 'performer'), 'performer'), # Performer/Narrator
+    (('TORY', 'originalyear'), 'original_release_year'), # Original Release Year
+    (('TDRC', 'date'), 'date') # Recording Date
+)
+
+# TXXX frame description (lowercased) -> (metadata key, only set if the key is still missing)
+_TXXX_FIELDS = {
+    'tracktotal': ('TRACKTOTAL', False),
+    'series': ('series', False),
+    'series_book_num': ('series_book_num', False),
+    'publisher': ('publisher', True), # Fallback for TXXX publisher
+    'performer': ('performer', True), # Fallback for TXXX performer
+    'copyright': ('copyright', True), # Fallback for TXXX copyright
+    'composer': ('composer', True), # Fallback for TXXX composer
+    'narratedby': ('narratedby', True), # Fallback for TXXX narratedby
+    'woas': ('woas', True) # Work or Series
+}
+
+@functools.lru_cache(maxsize=1024)
+def _mp3_tag_metadata_key(tag_key):
+    """
+    Maps an MP3 tag key to the metadata key it fills, or None if no prefix matches.
+    Files share a small set of tag keys, so the prefix scan runs once per distinct key.
+    """
+    for prefixes, metadata_key in _MP3_TAG_PREFIXES:
+        if tag_key.startswith(prefixes):
+            return metadata_key
+    return None
+
 def get_audio_metadata_and_embedded_image_status(file_path, custom_print_func):
     """
     Extracts metadata from an audio file using Mutagen and checks for embedded cover art.
@@ -38,75 +86,39 @@ def get_audio_metadata_and_embedded_image_status(file_path, custom_print_func):
     """
     metadata = {}
     has_embedded_image = False
+    # Both branches test 4-character extensions, so only the suffix is lowercased (not the whole path,
+    # and unlike splitext a file named just '.mp3' still counts)
+    extension = file_path[-4:].lower()
     try:
-        if file_path.lower().endswith('.mp3'):
+        if extension == '.mp3':
             audio = MP3(file_path, ID3=EasyMP3)
             # Check for ID3v2 tags first
             if audio.tags:
                 for key, value in audio.tags.items():
-                    # Common tags: album, artist, title, genre, comment, grouping, description, TIT3, TRACKTOTAL
-                    if key.startswith('album'):
-                        metadata['album'] = _get_tag_value(value)
-                    elif key.startswith('artist'):
-                        metadata['artist'] = _get_tag_value(value)
-                    elif key.startswith('title'):
-                        metadata['title'] = _get_tag_value(value)
-                    elif key.startswith('genre'):
-                        metadata['genre'] = _get_tag_value(value)
-                    elif key.startswith('comment'):
-                        metadata['comment'] = _get_tag_value(value)
-                    elif key.startswith('grouping'):
-                        metadata['grouping'] = _get_tag_value(value)
-                    elif key.startswith('desc') or key.startswith('description'):
-                        metadata['description'] = _get_tag_value(value)
-                    elif key.startswith('TIT3'): # Subtitle
-                        metadata['TIT3'] = _get_tag_value(value)
-                    elif key.startswith('TRCK') or key.startswith('track'): # Track number
-                        metadata['track'] = _get_tag_value(value)
-                    elif key.startswith('TPUB') or key.startswith('publisher'): # Publisher
-                        metadata['publisher'] = _get_tag_value(value)
-                    elif key.startswith('TPE4') or key.startswith('performer'): # Performer/Narrator
-                        metadata['performer'] = _get_tag_value(value)
-                    elif key.startswith('TORY') or key.startswith('originalyear'): # Original Release Year
-                        metadata['original_release_year'] = _get_tag_value(value)
-                    elif key.startswith('TDRC') or key.startswith('date'): # Recording Date
-                        metadata['date'] = _get_tag_value(value)
+                    metadata_key = _mp3_tag_metadata_key(key)
+                    if metadata_key:
+                        metadata[metadata_key] = _get_tag_value(value)
                     elif key.startswith('TXXX'): # Custom TXXX frames
                         if hasattr(value, 'desc') and hasattr(value, 'text'):
-                            for text_item in value.text:
-                                if value.desc.lower() == 'tracktotal':
-                                    metadata['TRACKTOTAL'] = text_item
-                                elif value.desc.lower() == 'series':
-                                    metadata['series'] = text_item
-                                elif value.desc.lower() == 'series_book_num':
-                                    try:
-                                        metadata['series_book_num'] = float(text_item)
-                                    except ValueError:
-                                        pass # Ignore if not a valid number
-                                elif value.desc.lower() == 'publisher': # Fallback for TXXX publisher
-                                    if 'publisher' not in metadata:
-                                        metadata['publisher'] = text_item
-                                elif value.desc.lower() == 'performer': # Fallback for TXXX performer
-                                    if 'performer' not in metadata:
-                                        metadata['performer'] = text_item
-                                elif value.desc.lower() == 'copyright': # Fallback for TXXX copyright
-                                    if 'copyright' not in metadata:
-                                        metadata['copyright'] = text_item
-                                elif value.desc.lower() == 'composer': # Fallback for TXXX composer
-                                    if 'composer' not in metadata:
-                                        metadata['composer'] = text_item
-                                elif value.desc.lower() == 'narratedby': # Fallback for TXXX narratedby
-                                    if 'narratedby' not in metadata:
-                                        metadata['narratedby'] = text_item
-                                elif value.desc.lower() == 'woas': # Work or Series
-                                    if 'woas' not in metadata:
-                                        metadata['woas'] = text_item
+                            txxx_field = _TXXX_FIELDS.get(value.desc.lower())
+                            if txxx_field:
+                                metadata_key, fallback_only = txxx_field
+                                for text_item in value.text:
+                                    if fallback_only:
+                                        metadata.setdefault(metadata_key, text_item)
+                                    elif metadata_key == 'series_book_num':
+                                        try:
+                                            metadata['series_book_num'] = float(text_item)
+                                        except ValueError:
+                                            pass # Ignore if not a valid number
+                                    else:
+                                        metadata[metadata_key] = text_item
 
                 # Check for embedded images
                 if 'APIC:' in audio.tags:
                     has_embedded_image = True
 
-        elif file_path.lower().endswith(('.m4a', '.m4b')):
+        elif extension in _MP4_AUDIO_EXTENSIONS:
             # Use MP4 for broader compatibility with M4B files
             audio = MP4(file_path)
             # M4A/MP4 tags are usually more consistent
@@ -135,15 +147,19 @@ def get_audio_metadata_and_embedded_image_status(file_path, custom_print_func):
                 has_embedded_image = True
         
         # Post-processing: Prioritize performer as author if 'artist' is generic
-        if metadata.get('artist', '').lower() in ['various artists', 'unknown artist', ''] and metadata.get('performer'):
-            custom_print_func(f"  DEBUG: Prioritizing 'performer' ('{metadata['performer']}') over generic 'artist' ('{metadata.get('artist')}') for author.", level="DEBUG", to_console=False)
-            metadata['author'] = metadata['performer']
+        artist = metadata.get('artist', '')
+        performer = metadata.get('performer')
+        if artist.lower() in _GENERIC_ARTISTS and performer:
+            if DEBUG_ENABLED:
+                custom_print_func(f"  DEBUG: Prioritizing 'performer' ('{performer}') over generic 'artist' ('{metadata.get('artist')}') for author.", level="DEBUG", to_console=False)
+            metadata['author'] = performer
         elif 'artist' in metadata:
-            metadata['author'] = metadata['artist'] # Default to artist as author
+            metadata['author'] = artist # Default to artist as author
         
         # Fallback for publisher using copyright if publisher tag is missing
         if not metadata.get('publisher') and metadata.get('copyright'):
-            custom_print_func(f"  DEBUG: Using copyright '{metadata['copyright']}' as fallback for publisher.", level="DEBUG", to_console=False)
+            if DEBUG_ENABLED:
+                custom_print_func(f"  DEBUG: Using copyright '{metadata['copyright']}' as fallback for publisher.", level="DEBUG", to_console=False)
             metadata['publisher'] = metadata['copyright']
 
     except ID3NoHeaderError:
@@ -152,6 +168,13 @@ def get_audio_metadata_and_embedded_image_status(file_path, custom_print_func):
         custom_print_func(f"  Error reading metadata from '{file_path}': {e}", level="ERROR", to_console=True) # Errors should always go to console
     return metadata, has_embedded_image
 
+# OPF namespaces in Clark notation, so element tags are compared as plain strings
+_DC_NAMESPACE = '{http://purl.org/dc/elements/1.1/}'
+_OPF_NAMESPACE = '{http://www.idpf.org/2007/opf}'
+# Dublin Core elements read from OPF files, by qualified tag
+_OPF_DC_FIELDS = {_DC_NAMESPACE + field: field for field in ('title', 'creator', 'publisher', 'date', 'description')}
+_OPF_META_TAG = _OPF_NAMESPACE + 'meta'
+
 def parse_opf_metadata(opf_file_path, custom_print_func):
     """
     Parses metadata from an OPF (Open Packaging Format) file.
@@ -163,49 +186,43 @@ def parse_opf_metadata(opf_file_path, custom_print_func):
     """
     metadata = {}
     try:
-        tree = ET.parse(opf_file_path)
-        root = tree.getroot()
-        
-        # Define namespaces
-        namespaces = {
-            'opf': 'http://www.idpf.org/2007/opf',
-            'dc': 'http://purl.org/dc/elements/1.1/',
-            'dcterms': 'http://purl.org/dc/terms/'
-        }
+        # Single pass over the document: keep the text of the first element of each Dublin Core
+        # field and the (property, text) of every opf:meta element, clearing elements as they end
+        dc_texts = {}
+        meta_properties = []
+        for _, element in ET.iterparse(opf_file_path, events=('end',)):
+            field = _OPF_DC_FIELDS.get(element.tag)
+            if field is not None:
+                if field not in dc_texts:
+                    dc_texts[field] = element.text
+            elif element.tag == _OPF_META_TAG:
+                meta_properties.append((element.get('property'), element.text))
+            element.clear()
 
         # Extract common metadata
-        title_element = root.find('.//dc:title', namespaces)
-        if title_element is not None:
-            metadata['title'] = title_element.text
-
-        creator_element = root.find('.//dc:creator', namespaces)
-        if creator_element is not None:
-            metadata['artist'] = creator_element.text
-            metadata['author'] = creator_element.text # Also set as author
-
-        publisher_element = root.find('.//dc:publisher', namespaces)
-        if publisher_element is not None:
-            metadata['publisher'] = publisher_element.text
+        if 'title' in dc_texts:
+            metadata['title'] = dc_texts['title']
 
-        date_element = root.find('.//dc:date', namespaces)
-        if date_element is not None:
-            metadata['date'] = date_element.text
+        if 'creator' in dc_texts:
+            metadata['artist'] = dc_texts['creator']
+            metadata['author'] = dc_texts['creator'] # Also set as author
 
-        description_element = root.find('.//dc:description', namespaces)
-        if description_element is not None:
-            metadata['description'] = description_element.text
+        for field in ('publisher', 'date', 'description'):
+            if field in dc_texts:
+                metadata[field] = dc_texts[field]
 
         # Specific for series and series_book_num (often in meta tags or custom elements)
-        for meta in root.findall('.//opf:meta', namespaces):
-            if meta.get('property') == 'belongs-to-series':
-                metadata['series'] = meta.text
-            if meta.get('property') == 'series-index':
+        for meta_property, meta_text in meta_properties:
+            if meta_property == 'belongs-to-series':
+                metadata['series'] = meta_text
+            if meta_property == 'series-index':
                 try:
-                    metadata['series_book_num'] = float(meta.text)
+                    metadata['series_book_num'] = float(meta_text)
                 except ValueError:
                     pass # Ignore if not a valid number
         
-        custom_print_func(f"  DEBUG: OPF metadata for '{os.path.basename(opf_file_path)}': {metadata}", level="DEBUG", to_console=False)
+        if DEBUG_ENABLED:
+            custom_print_func(f"  DEBUG: OPF metadata for '{os.path.basename(opf_file_path)}': {metadata}", level="DEBUG", to_console=False)
 
     except ET.ParseError as e:
         custom_print_func(f"  Warning: Could not parse OPF file '{opf_file_path}': {e}", level="WARNING", to_console=False) # Keep warnings in log, not console by default
@@ -213,11 +230,52 @@ def parse_opf_metadata(opf_file_path, custom_print_func):
         custom_print_func(f"  Error reading OPF metadata from '{opf_file_path}': {e}", level="ERROR", to_console=True) # Errors should always go to console
     return metadata
 
+# Regex to capture series name and number: what follows the series name, with {num} standing for the book number
+# This list is ordered to prioritize common patterns.
+_SERIES_BOOK_NUMBER = r'\d+(?:\.\d+)?' # Book Number (can be integer or float)
+_SERIES_PATTERN_TAILS = (
+    r'\s*[#S]\s*{num}\s*[-–—:]?\s*(?:.*)?$', # "Series #X", "Series S X"
+    r',\s*(?:Book|Vol|Volume|Part)\s*{num}\s*[-–—:]?\s*(?:.*)?$', # "Series, Book X"
+    r'\s*[-–—:]\s*(?:Book|Vol|Volume|Part)\s*{num}\s*[-–—:]?\s*(?:.*)?$', # "Series - Book X"
+    r'\s*{num}\s*[-–—:]?\s*(?:.*)?$' # "Series X" (most generic, last)
+)
+# Single-character scan run before the series patterns, which all need a digit
+_DIGIT_PATTERN = re.compile(r'\d')
+# Group 1: Series Name (non-greedy)
+# Group 2: Book Number
+_SERIES_PATTERNS = tuple(
+    re.compile('^(.*?)' + tail.replace('{num}', f'({_SERIES_BOOK_NUMBER})'), re.IGNORECASE)
+    for tail in _SERIES_PATTERN_TAILS
+)
+# All of _SERIES_PATTERNS as one alternation, tried in the same order. A pattern whose match would leave
+# the series name empty is skipped by a negative lookahead for the same pattern without a name, so the
+# first alternative that matches is the first pattern giving a non-empty name. Each alternative has
+# two groups (name, number), so the number is group match.lastindex and the name the group before it.
+_SERIES_COMBINED_PATTERN = re.compile(
+    '|'.join(
+        '(?!' + tail.replace('{num}', _SERIES_BOOK_NUMBER) + ')(.*?)' + tail.replace('{num}', f'({_SERIES_BOOK_NUMBER})')
+        for tail in _SERIES_PATTERN_TAILS
+    ),
+    re.IGNORECASE
+)
+
+# Applied in order to the extracted series name
+_SERIES_NAME_CLEANUP_PATTERNS = (
+    # Remove common trailing book/volume indicators if they weren't part of the number extraction
+    re.compile(r'(?:,\s*)?(?:Book|Vol|Volume|Part)\s*(\d+(?:\.\d+)?)', re.IGNORECASE),
+    re.compile(r'(\s*[-–—:]\s*)?(?:Book|Vol|Volume|Part)\s*(\d+(?:\.\d+)?)', re.IGNORECASE),
+    # Remove trailing numbers that might be mistaken for series numbers if not already captured
+    re.compile(r'\s*(\d+(?:\.\d+)?)$')
+)
+
+@functools.lru_cache(maxsize=4096)
 def extract_series_info(grouping, album, title):
     """
     Extracts series name and book number from various metadata fields.
     Prioritizes 'grouping' then 'album' then 'title'.
     Handles common patterns like "Series Name #X", "Series Name, Book X", "Series X - Book Name".
+    The function is pure and the files of a book share these fields, so results are memoized
+    (call extract_series_info.cache_clear() to release them in a long-lived process).
     Args:
         grouping (str): The grouping metadata field.
         album (str): The album metadata field.
@@ -225,60 +283,59 @@ def extract_series_info(grouping, album, title):
     Returns:
         tuple: (sanitized_series_name, series_book_num)
     """
-    potential_series_strings = [grouping, album, title]
-    
-    # Regex to capture series name and number
-    # Group 1: Series Name (non-greedy)
-    # Group 2: Book Number (can be integer or float)
-    # This regex is ordered to prioritize common patterns.
-    series_patterns = [
-        re.compile(r'^(.*?)\s*[#S]\s*(\d+(?:\.\d+)?)\s*[-–—:]?\s*(.*)?$', re.IGNORECASE), # "Series #X", "Series S X"
-        re.compile(r'^(.*?),\s*(?:Book|Vol|Volume|Part)\s*(\d+(?:\.\d+)?)\s*[-–—:]?\s*(.*)?$', re.IGNORECASE), # "Series, Book X"
-        re.compile(r'^(.*?)\s*[-–—:]\s*(?:Book|Vol|Volume|Part)\s*(\d+(?:\.\d+)?)\s*[-–—:]?\s*(.*)?$', re.IGNORECASE), # "Series - Book X"
-        re.compile(r'^(.*?)\s*(\d+(?:\.\d+)?)\s*[-–—:]?\s*(.*)?$', re.IGNORECASE) # "Series X" (most generic, last)
-    ]
-
     series_name = None
     series_book_num = None
 
-    for s in potential_series_strings:
-        if not s:
-            continue
-        
-        for pattern in series_patterns:
-            match = pattern.match(s.strip())
-            if match:
-                # Prioritize a non-empty series name from the match
-                extracted_name = match.group(1).strip()
-                if extracted_name:
-                    series_name = extracted_name
-                
-                # Extract book number
-                try:
-                    series_book_num = float(match.group(2))
-                except (ValueError, IndexError):
-                    series_book_num = None # Could not parse as float
-                
-                # If we found both, we can break
-                if series_name and series_book_num is not None:
-                    break
-        if series_name and series_book_num is not None:
+    for s in (grouping, album, title):
+        if not s or _DIGIT_PATTERN.search(s) is None:
+            continue # Every pattern needs a book number, so none can match
+
+        s = s.strip() # Stripped once per candidate string, not once per pattern
+
+        # Prioritize a non-empty series name from the match; if we found both, we can stop
+        match = _SERIES_COMBINED_PATTERN.match(s)
+        if match:
+            series_name = match.group(match.lastindex - 1).strip()
+            series_book_num = float(match.group(match.lastindex))
             break
 
+        # No series name in this string: keep the book number of the last pattern that matched
+        for pattern in reversed(_SERIES_PATTERNS):
+            match = pattern.match(s)
+            if match:
+                series_book_num = float(match.group(2))
+                break
+
     # Final sanitization of series name
     if series_name:
         # Remove common trailing book/volume indicators if they weren't part of the number extraction
-        series_name = re.sub(r'(?:,\s*)?(?:Book|Vol|Volume|Part)\s*(\d+(?:\.\d+)?)', '', series_name, flags=re.IGNORECASE).strip()
-        series_name = re.sub(r'(\s*[-–—:]\s*)?(?:Book|Vol|Volume|Part)\s*(\d+(?:\.\d+)?)', '', series_name, flags=re.IGNORECASE).strip()
-        # Remove trailing numbers that might be mistaken for series numbers if not already captured
-        series_name = re.sub(r'\s*(\d+(?:\.\d+)?)$', '', series_name).strip()
+        for pattern in _SERIES_NAME_CLEANUP_PATTERNS:
+            series_name = pattern.sub('', series_name).strip()
         series_name = sanitize_filename(series_name)
 
     return series_name, series_book_num
 
+# Pattern for " (Part X of Y)", "(X of Y)", "(Disc X of Y)", "(XofY)"
+# designation: Optional designation like "Part", "Disc", "Volume"
+# numberN: Part number (can be integer or float)
+# totalN: Total parts
+# Each form is a lookahead matched from the start of the name, so one match() call finds the
+# first form (in this order) that occurs anywhere in the name, just like searching for each in turn.
+_PART_EXTRACT_PATTERN = re.compile(
+    # (Part X of Y), (Disc X of Y), (Volume X of Y)
+    r'(?=.*?\((?:(?P<designation>Part|Disc|Volume)\s+)?(?P<number1>\d+(?:\.\d+)?)\s+of\s+(?P<total1>\d+)\))'
+    # (X of Y) or (XofY) - more generic, captures "2of5"
+    r'|(?=.*?\((?P<number2>\d+(?:\.\d+)?)\s*(?:of)?\s*(?P<total2>\d+)\))'
+    # (X) - for single part indication
+    r'|(?=.*?\((?P<number3>\d+(?:\.\d+)?)\))',
+    re.IGNORECASE | re.DOTALL
+)
+
+@functools.lru_cache(maxsize=4096)
 def extract_internal_part_info(folder_name):
     """
     Extracts part information (e.g., "Part 1 of 5", "1 of 5", "XofY") from a folder name.
+    The function is pure, so results are memoized.
     Args:
         folder_name (str): The name of the physical folder.
     Returns:
@@ -287,70 +344,88 @@ def extract_internal_part_info(folder_name):
                part_number (float): The extracted part number, or None
                total_parts (int): The total number of parts, or None
     """
-    # Pattern for " (Part X of Y)", "(X of Y)", "(Disc X of Y)", "(XofY)"
-    # Group 1: Optional designation like "Part", "Disc", "Volume"
-    # Group 2: Part number (can be integer or float)
-    # Group 3: Total parts
-    patterns = [
-        # (Part X of Y), (Disc X of Y), (Volume X of Y)
-        re.compile(r'\((?:(Part|Disc|Volume)\s+)?(\d+(?:\.\d+)?)\s+of\s+(\d+)\)', re.IGNORECASE),
-        # (X of Y) or (XofY) - more generic, captures "2of5"
-        re.compile(r'\((\d+(?:\.\d+)?)\s*(?:of)?\s*(\d+)\)', re.IGNORECASE), 
-        # (X) - for single part indication
-        re.compile(r'\((\d+(?:\.\d+)?)\)', re.IGNORECASE) 
-    ]
-
     part_designation = None
     part_number = None
     total_parts = None
 
-    for pattern in patterns:
-        match = pattern.search(folder_name)
-        if match:
-            # Safely get groups, defaulting to None if not present
-            # The number of groups can vary based on the matched pattern
-            g1 = match.group(1) if len(match.groups()) >= 1 else None
-            g2 = match.group(2) if len(match.groups()) >= 2 else None
-            g3 = match.group(3) if len(match.groups()) >= 3 else None
-
-            # Determine which groups correspond to part_num_str and total_parts_str
-            part_num_str = None
-            total_parts_str = None
-
-            if pattern == patterns[0]: # (Designation X of Y)
-                part_designation = g1.capitalize() if g1 else "Part"
-                part_num_str = g2
-                total_parts_str = g3
-            elif pattern == patterns[1]: # (X of Y) or (XofY)
-                part_designation = "Part" # Default to "Part"
-                part_num_str = g1
-                total_parts_str = g2
-            elif pattern == patterns[2]: # (X)
-                part_designation = "Part" # Default to "Part"
-                part_num_str = g1
-                total_parts_str = None # No total parts specified
-
-            try:
-                if part_num_str is not None: # Only attempt conversion if string is not None
-                    part_number = float(part_num_str)
-            except ValueError:
-                part_number = None
-            
-            if total_parts_str:
-                try:
-                    total_parts = int(total_parts_str)
-                except ValueError:
-                    total_parts = None
-            
-            if part_number is not None: # Found valid part info, break
-                break
+    if '(' not in folder_name: # Every pattern starts with '(', so none can match
+        return part_designation, part_number, total_parts
+
+    match = _PART_EXTRACT_PATTERN.match(folder_name)
+    if match:
+        # Determine which groups correspond to part_num_str and total_parts_str
+        if match.group('number1') is not None: # (Designation X of Y)
+            designation = match.group('designation')
+            part_designation = designation.capitalize() if designation else "Part"
+            part_num_str = match.group('number1')
+            total_parts_str = match.group('total1')
+        elif match.group('number2') is not None: # (X of Y) or (XofY)
+            part_designation = "Part" # Default to "Part"
+            part_num_str = match.group('number2')
+            total_parts_str = match.group('total2')
+        else: # (X)
+            part_designation = "Part" # Default to "Part"
+            part_num_str = match.group('number3')
+            total_parts_str = None # No total parts specified
+
+        # The groups only match digits, so the conversions cannot fail
+        part_number = float(part_num_str)
+        if total_parts_str:
+            total_parts = int(total_parts_str)
 
     return part_designation, part_number, total_parts
 
+# Templates for strip_series_info_from_title, filled in with the escaped series name
+_SERIES_STRIP_TEMPLATES = (
+    # Remove "Series Name #X" or "Series Name, Book X" patterns
+    r'^{0}\s*[#S]\s*\d+(\.\d+)?\s*[-–—:]?\s*',
+    r'^{0},\s*(?:Book|Vol|Volume|Part)\s*\d+(\.\d+)?\s*[-–—:]?\s*',
+    r'^{0}\s*[-–—:]\s*(?:Book|Vol|Volume|Part)\s*\d+(\.\d+)?\s*[-–—:]?\s*(.*)?$',
+    # Also remove if series name appears at the end
+    r'\s*[-–—:]?\s*{0}\s*[#S]\s*\d+(\.\d+)?$',
+    r'\s*,\s*{0},\s*(?:Book|Vol|Volume|Part)\s*\d+(\.\d+)?$',
+    r'\s*[-–—:]\s*{0}\s*[-–—:]\s*(?:Book|Vol|Volume|Part)\s*\d+(\.\d+)?$',
+    # Remove just the series name if it's a standalone prefix/suffix
+    r'^{0}\s*[-–—:]?\s*',
+    r'\s*[-–—:]?\s*{0}$'
+)
+
+# Templates for the book number, e.g. " - 1", " (1)", "(Book 1)"
+_BOOK_NUMBER_STRIP_TEMPLATES = (
+    r'\s*[-–—:]?\s*{0}(\s*of\s*\d+)?$',
+    r'\s*\((?:Book|Vol|Volume|Part)?\s*{0}(\s*of\s*\d+)?\)'
+)
+
+@functools.lru_cache(maxsize=512)
+def _series_strip_patterns(series_name):
+    """
+    Returns (name pattern, compiled series-stripping patterns) for a series name.
+    Every stripping pattern contains the name, so a title the name pattern does not find is left as is.
+    Every book in a series strips the same name, so the compiled patterns are memoized.
+    """
+    escaped_series_name = re.escape(series_name)
+    return (
+        re.compile(escaped_series_name, re.IGNORECASE),
+        tuple(re.compile(template.replace('{0}', escaped_series_name), re.IGNORECASE) for template in _SERIES_STRIP_TEMPLATES)
+    )
+
+@functools.lru_cache(maxsize=512)
+def _book_number_strip_patterns(book_num_str):
+    """
+    Returns (number pattern, compiled book-number-stripping patterns) for a book number string.
+    """
+    escaped_book_num = re.escape(book_num_str)
+    return (
+        re.compile(escaped_book_num, re.IGNORECASE),
+        tuple(re.compile(template.replace('{0}', escaped_book_num), re.IGNORECASE) for template in _BOOK_NUMBER_STRIP_TEMPLATES)
+    )
+
+@functools.lru_cache(maxsize=4096)
 def strip_series_info_from_title(title, series_name, series_book_num):
     """
     Strips series name and book number from a title string.
     This helps in getting a cleaner 'core' book title.
+    The function is pure, so results are memoized.
     Args:
         title (str): The original title string.
         series_name (str): The extracted series name.
@@ -365,36 +440,46 @@ def strip_series_info_from_title(title, series_name, series_book_num):
     
     # Remove series name if present at the beginning or end
     if series_name:
-        # Escape series_name for regex
-        escaped_series_name = re.escape(series_name)
-        # Remove "Series Name #X" or "Series Name, Book X" patterns
-        cleaned_title = re.sub(rf'^{escaped_series_name}\s*[#S]\s*\d+(\.\d+)?\s*[-–—:]?\s*', '', cleaned_title, flags=re.IGNORECASE).strip()
-        cleaned_title = re.sub(rf'^{escaped_series_name},\s*(?:Book|Vol|Volume|Part)\s*\d+(\.\d+)?\s*[-–—:]?\s*', '', cleaned_title, flags=re.IGNORECASE).strip()
-        cleaned_title = re.sub(rf'^{escaped_series_name}\s*[-–—:]\s*(?:Book|Vol|Volume|Part)\s*\d+(\.\d+)?\s*[-–—:]?\s*(.*)?$', '', cleaned_title, flags=re.IGNORECASE).strip()
-        
-        # Also remove if series name appears at the end
-        cleaned_title = re.sub(rf'\s*[-–—:]?\s*{escaped_series_name}\s*[#S]\s*\d+(\.\d+)?$', '', cleaned_title, flags=re.IGNORECASE).strip()
-        cleaned_title = re.sub(rf'\s*,\s*{escaped_series_name},\s*(?:Book|Vol|Volume|Part)\s*\d+(\.\d+)?$', '', cleaned_title, flags=re.IGNORECASE).strip()
-        cleaned_title = re.sub(rf'\s*[-–—:]\s*{escaped_series_name}\s*[-–—:]\s*(?:Book|Vol|Volume|Part)\s*\d+(\.\d+)?$', '', cleaned_title, flags=re.IGNORECASE).strip()
-
-        # Remove just the series name if it's a standalone prefix/suffix
-        cleaned_title = re.sub(rf'^{escaped_series_name}\s*[-–—:]?\s*', '', cleaned_title, flags=re.IGNORECASE).strip()
-        cleaned_title = re.sub(rf'\s*[-–—:]?\s*{escaped_series_name}$', '', cleaned_title, flags=re.IGNORECASE).strip()
-
+        name_pattern, strip_patterns = _series_strip_patterns(series_name)
+        if name_pattern.search(cleaned_title):
+            for pattern in strip_patterns:
+                cleaned_title = pattern.sub('', cleaned_title).strip()
+        else:
+            cleaned_title = cleaned_title.strip()
 
     # Remove standalone book number if present
     if series_book_num is not None:
         # Convert to string to handle both int and float
-        book_num_str = str(series_book_num)
-        # Remove patterns like " - 1", " (1)", "Book 1"
-        cleaned_title = re.sub(rf'\s*[-–—:]?\s*{re.escape(book_num_str)}(\s*of\s*\d+)?$', '', cleaned_title, flags=re.IGNORECASE).strip()
-        cleaned_title = re.sub(rf'\s*\((?:Book|Vol|Volume|Part)?\s*{re.escape(book_num_str)}(\s*of\s*\d+)?\)', '', cleaned_title, flags=re.IGNORECASE).strip()
-        
+        number_pattern, strip_patterns = _book_number_strip_patterns(str(series_book_num))
+        if number_pattern.search(cleaned_title):
+            for pattern in strip_patterns:
+                cleaned_title = pattern.sub('', cleaned_title).strip()
+        else:
+            cleaned_title = cleaned_title.strip()
+
     return cleaned_title.strip()
 
+# Regex to capture and remove part indicators like " (Part X of Y)", "(X of Y)", "(X)"
+# This should be more aggressive to remove common part notations.
+_PART_STRIP_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\s*\(Part\s+\d+(?:\.\d+)?\s+of\s+\d+\)',
+    r'\s*\(\d+(?:\.\d+)?\s*of\s*\d+\)', # Matches (XofY) or (X of Y)
+    r'\s*\(Disc\s+\d+\s+of\s+\d+\)',
+    r'\s*\(\d+(?:\.\d+)?\)', # Matches standalone numbers in parentheses like "(1)"
+    r'\s*\[Part\s+\d+(?:\.\d+)?\s+of\s+\d+\]',
+    r'\s*\[\d+(?:\.\d+)?\s+of\s+\d+\]',
+    r'\s*\[Disc\s+\d+\s+of\s+\d+\]',
+    r'\s*\[\d+(?:\.\d+)?\]', # Matches standalone numbers in brackets like "[1]"
+    r'\s*-\s*Part\s+\d+(?:\.\d+)?(?:\s+of\s+\d+)?', # Matches " - Part 1" or " - Part 1 of 5"
+    r'\s*-\s*\d+(?:\.\d+)?(?:\s+of\s+\d+)?', # Matches " - 1" or " - 1 of 5"
+    r'\s*\(Dramatized Adaptation\)' # Specific for your "Words of Radiance" case
+))
+
+@functools.lru_cache(maxsize=4096)
 def strip_part_info_from_title(title):
     """
     Strips part information (e.g., " (Part 1 of 5)", " (1 of 5)") from a title string.
+    The function is pure, so results are memoized.
     Args:
         title (str): The original title string.
     Returns:
@@ -403,25 +488,12 @@ def strip_part_info_from_title(title):
     if not title:
         return ""
     
-    # Regex to capture and remove part indicators like " (Part X of Y)", "(X of Y)", "(X)"
-    # This should be more aggressive to remove common part notations.
-    part_patterns = [
-        r'\s*\(Part\s+\d+(?:\.\d+)?\s+of\s+\d+\)',
-        r'\s*\(\d+(?:\.\d+)?\s*of\s*\d+\)', # Matches (XofY) or (X of Y)
-        r'\s*\(Disc\s+\d+\s+of\s+\d+\)',
-        r'\s*\(\d+(?:\.\d+)?\)', # Matches standalone numbers in parentheses like "(1)"
-        r'\s*\[Part\s+\d+(?:\.\d+)?\s+of\s+\d+\]',
-        r'\s*\[\d+(?:\.\d+)?\s+of\s+\d+\]',
-        r'\s*\[Disc\s+\d+\s+of\s+\d+\]',
-        r'\s*\[\d+(?:\.\d+)?\]', # Matches standalone numbers in brackets like "[1]"
-        r'\s*-\s*Part\s+\d+(?:\.\d+)?(?:\s+of\s+\d+)?', # Matches " - Part 1" or " - Part 1 of 5"
-        r'\s*-\s*\d+(?:\.\d+)?(?:\s+of\s+\d+)?', # Matches " - 1" or " - 1 of 5"
-        r'\s*\(Dramatized Adaptation\)' # Specific for your "Words of Radiance" case
-    ]
-
-    cleaned_title = title
-    for pattern in part_patterns:
-        cleaned_title = re.sub(pattern, '', cleaned_title, flags=re.IGNORECASE).strip()
+    if '(' in title or '[' in title or '-' in title:
+        cleaned_title = title
+        for pattern in _PART_STRIP_PATTERNS:
+            cleaned_title = pattern.sub('', cleaned_title).strip()
+    else:
+        cleaned_title = title.strip() # Every part pattern needs a '(', '[' or '-', so none can match
     
     # Remove any trailing hyphens, spaces, or dots that might be left
     cleaned_title = cleaned_title.strip(' -.')
@@ -429,9 +501,42 @@ def strip_part_info_from_title(title):
     return cleaned_title.strip()
 
 
+# Common replacements
+_PUBLISHER_REPLACEMENTS = {
+    'graphic audio': 'Graphic Audio',
+    'audible studios': 'Audible',
+    'audible': 'Audible',
+    'hachette audio': 'Hachette Audio',
+    'random house audio': 'Random House Audio',
+    'macmillan audio': 'Macmillan Audio',
+    'harperaudio': 'HarperAudio',
+    'simon & schuster audio': 'Simon & Schuster Audio',
+    'prh audio': 'PRH Audio',
+    'tantor audio': 'Tantor Audio',
+    'brilliance audio': 'Brilliance Audio',
+    'podium audio': 'Podium Audio',
+    'dreamscape media': 'Dreamscape Media',
+    'recorded books': 'Recorded Books',
+    'blackstone audio': 'Blackstone Audio',
+    'scholastic audio': 'Scholastic Audio',
+    'michael-scott earle': 'Self-Published', # Example for specific authors
+    'actors everywhere': 'Actors Everywhere', # Keep as is if this is a valid publisher/narrator
+    'graphic': 'Graphic Audio' # Normalizing 'Graphic' to 'Graphic Audio'
+}
+_PUBLISHER_REPLACEMENT_NAMES = tuple(_PUBLISHER_REPLACEMENTS.values())
+
+# One lookahead per replacement key, tried in dict order from the start of the string, so the
+# alternative that matches is the first key (not the leftmost occurrence) found anywhere in the name.
+_PUBLISHER_SUBSTRING_PATTERN = re.compile(
+    '|'.join(f'(?=.*?({re.escape(old)}))' for old in _PUBLISHER_REPLACEMENTS),
+    re.DOTALL
+)
+
+@functools.lru_cache(maxsize=4096)
 def normalize_publisher_name(publisher_name):
     """
     Normalizes publisher names to a consistent format.
+    The function is pure and publishers and narrators repeat across many books, so results are memoized.
     Args:
         publisher_name (str): The original publisher name.
     Returns:
@@ -441,38 +546,15 @@ def normalize_publisher_name(publisher_name):
         return None
     
     normalized = publisher_name.lower().strip()
-    
-    # Common replacements
-    replacements = {
-        'graphic audio': 'Graphic Audio',
-        'audible studios': 'Audible',
-        'audible': 'Audible',
-        'hachette audio': 'Hachette Audio',
-        'random house audio': 'Random House Audio',
-        'macmillan audio': 'Macmillan Audio',
-        'harperaudio': 'HarperAudio',
-        'simon & schuster audio': 'Simon & Schuster Audio',
-        'prh audio': 'PRH Audio',
-        'tantor audio': 'Tantor Audio',
-        'brilliance audio': 'Brilliance Audio',
-        'podium audio': 'Podium Audio',
-        'dreamscape media': 'Dreamscape Media',
-        'recorded books': 'Recorded Books',
-        'blackstone audio': 'Blackstone Audio',
-        'scholastic audio': 'Scholastic Audio',
-        'michael-scott earle': 'Self-Published', # Example for specific authors
-        'actors everywhere': 'Actors Everywhere', # Keep as is if this is a valid publisher/narrator
-        'graphic': 'Graphic Audio' # Normalizing 'Graphic' to 'Graphic Audio'
-    }
-
-    for old, new in replacements.items():
-        if normalized == old:
-            return new
-            
+
+    exact_match = _PUBLISHER_REPLACEMENTS.get(normalized)
+    if exact_match:
+        return exact_match
+
     # If not in direct replacements, check for substrings
-    for old, new in replacements.items():
-        if old in normalized:
-            return new # Return the standard name if a substring matches
+    match = _PUBLISHER_SUBSTRING_PATTERN.match(normalized)
+    if match:
+        return _PUBLISHER_REPLACEMENT_NAMES[match.lastindex - 1] # Return the standard name if a substring matches
 
     # If still not normalized, sanitize and return as is
     return sanitize_filename(publisher_name)